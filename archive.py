@@ -0,0 +1,74 @@
+import argparse
+import sys
+import time
+
+from src.models import export, money
+from src.models.batch import read_rounds
+from src.models.binary_archive import write_archive
+from src.models.round_archive import RoundArchive, default_archive_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Store and query completed golf rounds.")
+    parser.add_argument("--db", default=default_archive_path(),
+                        help=f"archive database (default: {default_archive_path()})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="settle and store rounds from a scorecard file")
+    import_parser.add_argument("input", help="JSON array or JSON lines file with one round per entry")
+
+    for name, help_text in (("totals", "paid, received and net per player"),
+                            ("rounds", "list stored rounds"),
+                            ("binary", "write the matching rounds to a memory-mappable binary file"),
+                            ("export", "write payments and player summaries of the matching rounds")):
+        query_parser = commands.add_parser(name, help=help_text)
+        if name == "binary":
+            query_parser.add_argument("output", help="binary archive file to write")
+        if name == "export":
+            query_parser.add_argument("output", help="directory for hole_payments, players and final_payments")
+            query_parser.add_argument("--format", choices=export.FORMATS, default="csv")
+        query_parser.add_argument("--player")
+        query_parser.add_argument("--course")
+        query_parser.add_argument("--since", help="first date to include (YYYY-MM-DD)")
+        query_parser.add_argument("--until", help="last date to include (YYYY-MM-DD)")
+
+    args = parser.parse_args(argv)
+
+    with RoundArchive(args.db) as archive:
+        if args.command == "import":
+            start = time.perf_counter()
+            count = archive.import_rounds(read_rounds(args.input))
+            elapsed = time.perf_counter() - start
+            print(f"Imported {count} rounds in {elapsed:.3f}s", file=sys.stderr)
+
+        elif args.command == "totals":
+            totals = archive.player_totals(args.player, args.course, args.since, args.until)
+            print(f"{'Player':<20} {'Rounds':>7} {'Paid':>10} {'Received':>10} {'Net':>10}")
+            for player, summary in sorted(totals.items(), key=lambda item: -item[1]["net"]):
+                print(f"{player:<20} {summary['rounds']:>7} {money.format_amount(summary['paid']):>10} "
+                      f"{money.format_amount(summary['received']):>10} {money.format_amount(summary['net']):>10}")
+
+        elif args.command == "binary":
+            start = time.perf_counter()
+            count = write_archive(args.output, archive.iter_games(args.player, args.course,
+                                                                  args.since, args.until))
+            elapsed = time.perf_counter() - start
+            print(f"Wrote {count} rounds to {args.output} in {elapsed:.3f}s", file=sys.stderr)
+
+        elif args.command == "export":
+            start = time.perf_counter()
+            counts = export.export_archive(archive, args.output, args.format, args.player, args.course,
+                                           args.since, args.until)
+            elapsed = time.perf_counter() - start
+            written = ", ".join(f"{count} {kind}" for kind, count in counts.items())
+            print(f"Exported {written} records to {args.output} in {elapsed:.3f}s", file=sys.stderr)
+
+        else:
+            for round_id, played_on, course in archive.find_rounds(args.player, args.course,
+                                                                   args.since, args.until):
+                print(f"{round_id:>6}  {played_on}  {course}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+"""Replay rounds through the whole GUI flow under the offscreen Qt platform.
+
+Run from the repository root:
+
+    python -m benchmarks.gui_replay --players 4 --holes 18 --rounds 3 -o replay.json
+    python -m benchmarks.gui_replay --script rounds.jsonl --compare replay.json
+
+The app is put together as main.py does (stylesheet, AppController, start
+screen), with the archive and journal in a temporary directory. Each round
+of the script (the batch/scorecard format, see batch.py; synthetic rounds
+when no script is given) is entered into StartScreen, GameSetupScreen,
+HoleScreen and BuchiScreen by setting their widgets and calling their
+continue handlers, exactly as the buttons do, and every results screen is
+acknowledged until the final results are shown. The wall time of each
+screen transition and of each ProgressWindow table update is recorded.
+
+Every finished round is checked against Game.from_dict of the same round
+settled without the GUI: the inputs the screens stored, every hole's
+payments, the balances and the final payments must agree. The exit status
+is 1 if any round disagrees or, with --max-ms, if any transition or table
+update took longer, so the replay also works as a regression test.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.run_benchmarks import git_commit
+from benchmarks.synthetic import synthetic_round
+from src.models import settlement
+from src.models.batch import read_rounds
+from src.models.game import Game
+
+# ProgressWindow methods the controller calls to refresh the progress tables
+TABLE_UPDATES = ("update_table", "update_all_tables", "update_hole")
+
+
+class ReplayDriver:
+    """Drives one AppController through scripted rounds and times every step."""
+
+    def __init__(self, app, directory):
+        from src.controllers.app_controller import AppController
+        from src.views.styles import apply_base_stylesheet
+
+        self.app = app
+        apply_base_stylesheet(app)
+        self.controller = AppController(archive_path=os.path.join(directory, "rounds.db"),
+                                        journal_path=os.path.join(directory, "current_game.jsonl"))
+        if self.controller.resume_game():
+            raise RuntimeError("A fresh replay directory should have no game to resume")
+        self.controller.show_start_screen()
+        self.app.processEvents()
+
+        self.transitions = []  # (from screen, to screen, seconds)
+        self.table_updates = []  # (ProgressWindow method, seconds)
+        self._timed_window = None
+
+    @property
+    def screen(self):
+        return self.controller.stack.currentWidget()
+
+    def step(self, action):
+        """Run a screen's continue handler and time it until the next screen has been shown."""
+        before = type(self.screen).__name__
+        start = time.perf_counter()
+        action()
+        self.app.processEvents()
+        self.transitions.append((before, type(self.screen).__name__, time.perf_counter() - start))
+        self.time_table_updates()
+
+    def time_table_updates(self):
+        """Wrap the refresh methods of a newly opened progress window so every call is timed."""
+        window = self.controller.progress_window
+        if window is None or window is self._timed_window:
+            return
+        self._timed_window = window
+        for name in TABLE_UPDATES:
+            setattr(window, name, self._timed(name, getattr(window, name)))
+
+    def _timed(self, name, method):
+        def timed(*args):
+            start = time.perf_counter()
+            result = method(*args)
+            self.table_updates.append((name, time.perf_counter() - start))
+            return result
+        return timed
+
+    def play(self, round_data):
+        """Enter one round through every screen and return the game the GUI settled."""
+        from src.views.start_screen import StartScreen
+        from src.views.game_setup_screen import GameSetupScreen
+        from src.views.hole_screen import HoleScreen
+        from src.views.buchi_screen import BuchiScreen
+        from src.views.results_screen import ResultsScreen
+        from src.views.final_results_screen import FinalResultsScreen
+
+        if isinstance(self.screen, FinalResultsScreen):
+            self.step(self.screen.on_new_game)
+        screen = self._expect(StartScreen)
+        self.fill_start_screen(screen, round_data)
+        self.step(screen.on_start_game)
+
+        if isinstance(self.screen, GameSetupScreen):
+            self.fill_voor(self.screen, round_data.get("voor", {}))
+            self.step(self.screen.on_continue)
+
+        holes = {hole_data["hole"]: hole_data for hole_data in round_data["holes"]}
+        while not isinstance(self.screen, FinalResultsScreen):
+            screen = self._expect(HoleScreen)
+            hole_data = holes[screen.hole_number]
+            self.fill_hole(screen, hole_data)
+            self.step(screen.on_continue)
+
+            if isinstance(self.screen, BuchiScreen):
+                self.fill_buchi(self.screen, hole_data.get("buchi", {}))
+                self.step(self.screen.on_continue)
+
+            screen = self._expect(ResultsScreen)
+            self.step(screen.on_continue)
+        return self.controller.game
+
+    def _expect(self, screen_class):
+        if not isinstance(self.screen, screen_class):
+            raise RuntimeError(f"Expected {screen_class.__name__}, the app shows {type(self.screen).__name__}")
+        return self.screen
+
+    def fill_start_screen(self, screen, round_data):
+        settings = round_data.get("settings", {})
+        screen.player_count.setValue(len(round_data["players"]))
+        screen.hole_count.setValue(settings.get("number_of_holes", len(round_data["holes"])))
+        screen.game_mode.setCurrentIndex(screen.game_mode.findData(settings.get("game_mode", "single_winner")))
+        screen.select_scoring_type(settings.get("scoring_type", "par"))
+        screen.course.setText(settings.get("course", ""))
+        screen.buchi_enabled.setChecked(bool(settings.get("buchi_enabled", False)))
+        screen.voor_enabled.setChecked(bool(settings.get("voor_enabled", False)))
+
+    def fill_voor(self, screen, voor):
+        from PyQt5.QtWidgets import QSpinBox
+
+        for spin_box in screen.findChildren(QSpinBox):
+            from_player = spin_box.property("from_player")
+            to_player = spin_box.property("to_player")
+            if from_player is not None:
+                spin_box.setValue(voor.get(from_player, {}).get(to_player, 0))
+
+    def fill_hole(self, screen, hole_data):
+        screen.hole_value.setValue(hole_data["value"])
+        # Par first: changing it moves every score still at the old par
+        screen.hole_par.setValue(hole_data["par"])
+        for player_name, spin_box in screen.player_score_inputs.items():
+            spin_box.setValue(hole_data["scores"][player_name])
+
+    def fill_buchi(self, screen, buchi):
+        for player_name in buchi.get("participants", []):
+            screen.participant_checkboxes[player_name].setChecked(True)
+        # Checking participants rebuilds the winner checkboxes
+        for player_name in buchi.get("winners", []):
+            screen.winner_checkboxes[player_name].setChecked(True)
+
+
+def check_replayable(round_data):
+    """Raise ValueError if the round cannot be entered through the screens as they are."""
+    from src.models.scoring import load_scoring_rules
+
+    settings = round_data.get("settings", {})
+    players = round_data["players"]
+    holes = round_data["holes"]
+    number_of_holes = settings.get("number_of_holes", len(holes))
+
+    if players != [f"Player {i}" for i in range(1, len(players) + 1)]:
+        raise ValueError("The GUI names players 'Player 1' to 'Player N'")
+    if not 2 <= len(players) <= 10 or not 1 <= number_of_holes <= 18:
+        raise ValueError("The start screen takes 2 to 10 players and 1 to 18 holes")
+    if sorted(hole_data["hole"] for hole_data in holes) != list(range(1, number_of_holes + 1)):
+        raise ValueError("Every hole from 1 to number_of_holes must be in the round")
+    if settings.get("scoring_rules") is not None:
+        raise ValueError("A round's own scoring rules cannot be entered on the start screen")
+    if settings.get("scoring_type", "par") not in load_scoring_rules():
+        raise ValueError(f"Unknown scoring type {settings.get('scoring_type')!r}")
+
+    if settings.get("voor_enabled"):
+        for adjustments in round_data.get("voor", {}).values():
+            if any(not 0 <= adjustment <= 2 for adjustment in adjustments.values()):
+                raise ValueError("Voor adjustments are entered as 0 to 2")
+    for hole_data in holes:
+        if not isinstance(hole_data["value"], int) or not 1 <= hole_data["value"] <= 1000:
+            raise ValueError(f"Hole {hole_data['hole']}: values are whole numbers from 1 to 1000")
+        if not 1 <= hole_data["par"] <= 10:
+            raise ValueError(f"Hole {hole_data['hole']}: par must be 1 to 10")
+        scores = hole_data.get("scores", {})
+        if set(scores) != set(players) or any(not 1 <= score <= 20 for score in scores.values()):
+            raise ValueError(f"Hole {hole_data['hole']}: every player needs a score from 1 to 20")
+        if settings.get("buchi_enabled"):
+            buchi = hole_data.get("buchi", {})
+            participants = buchi.get("participants", [])
+            winners = buchi.get("winners", [])
+            if len(participants) < 2 and winners:
+                raise ValueError(f"Hole {hole_data['hole']}: buchi winners need at least two participants")
+            if len(participants) >= 2 and not 0 < len(winners) < len(participants):
+                raise ValueError(f"Hole {hole_data['hole']}: some but not all buchi participants must win")
+
+
+def differences(game, round_data):
+    """Where the game the GUI settled disagrees with the same round settled directly."""
+    expected = Game.from_dict(round_data)
+    expected.calculate_all_payments()
+    problems = []
+
+    for player_name, player in expected.players.items():
+        entered = {opponent: adjustment for opponent, adjustment in
+                   game.players[player_name].voor_adjustments.items() if adjustment}
+        wanted = {opponent: adjustment for opponent, adjustment in player.voor_adjustments.items() if adjustment}
+        if expected.settings.voor_enabled and entered != wanted:
+            problems.append(f"voor of {player_name}: {entered} instead of {wanted}")
+
+    for hole_number, hole in expected.holes.items():
+        played = game.holes.get(hole_number)
+        if played is None:
+            problems.append(f"hole {hole_number} was not played")
+            continue
+        entered = (played.value, played.par, played.player_scores.as_dict())
+        wanted = (hole.value, hole.par, hole.player_scores.as_dict())
+        if entered != wanted:
+            problems.append(f"hole {hole_number} inputs: {entered} instead of {wanted}")
+        if (expected.settings.buchi_enabled
+                and (set(played.buchi_participants), set(played.buchi_winners))
+                != (set(hole.buchi_participants), set(hole.buchi_winners))):
+            problems.append(f"hole {hole_number} buchi: {played.buchi_participants} won by "
+                            f"{played.buchi_winners} instead of {hole.buchi_participants} won by {hole.buchi_winners}")
+        if played.payments != hole.payments:
+            problems.append(f"hole {hole_number} payments: {played.payments} instead of {hole.payments}")
+
+    balances = {player_name: amount for player_name, amount in game.ledger.balances.items() if amount}
+    wanted = {player_name: amount for player_name, amount in expected.ledger.balances.items() if amount}
+    if balances != wanted:
+        problems.append(f"balances: {balances} instead of {wanted}")
+    # Equal balances can settle with different but equally short lists of transfers
+    settled = {player_name: amount for player_name, amount in settlement.net_balances(game.final_payments).items()
+               if amount}
+    if settled != wanted or game.settlement.transaction_count != expected.settlement.transaction_count:
+        problems.append(f"final payments: {game.final_payments} instead of {expected.final_payments}")
+    return problems
+
+
+def summarize(timings):
+    """{label: [seconds]} as timing statistics in seconds."""
+    return {
+        label: {
+            "min": min(values),
+            "median": statistics.median(values),
+            "max": max(values),
+            "count": len(values)
+        }
+        for label, values in sorted(timings.items())
+    }
+
+
+def compare(previous, current):
+    """Print the median ratio (current / previous) of every transition and table update in both runs."""
+    print(f"{'step':<45} {'old ms':>10} {'new ms':>10} {'ratio':>7}")
+    for kind in ("transitions", "table_updates"):
+        for label, timing in current[kind].items():
+            old = previous.get(kind, {}).get(label)
+            if not old:
+                continue
+            ratio = timing["median"] / old["median"] if old["median"] else float("inf")
+            print(f"{label:<45} {old['median'] * 1000:>10.3f} {timing['median'] * 1000:>10.3f} {ratio:>7.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay rounds through the GUI offscreen and time every screen.")
+    parser.add_argument("--script", help="JSON array or JSON lines file of rounds to enter (default: synthetic)")
+    parser.add_argument("--players", type=int, default=4, help="players per synthetic round")
+    parser.add_argument("--holes", type=int, default=18, help="holes per synthetic round")
+    parser.add_argument("--rounds", type=int, default=3, help="number of synthetic rounds")
+    parser.add_argument("--game-mode", choices=["single_winner", "face_to_face"], default="face_to_face")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ms", type=float,
+                        help="fail if any transition or table update takes longer than this")
+    parser.add_argument("-o", "--output", help="write the timings and results as JSON")
+    parser.add_argument("--compare", help="previous replay output to compare against")
+    args = parser.parse_args(argv)
+
+    if args.script:
+        rounds = list(read_rounds(args.script))
+    else:
+        rounds = [synthetic_round(args.players, args.holes, args.game_mode, seed=args.seed + i)
+                  for i in range(args.rounds)]
+    for round_data in rounds:
+        check_replayable(round_data)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        driver = ReplayDriver(app, directory)
+        for number, round_data in enumerate(rounds, 1):
+            start = time.perf_counter()
+            game = driver.play(round_data)
+            elapsed = time.perf_counter() - start
+            problems = differences(game, round_data)
+            results.append({"id": round_data.get("id", number), "players": len(round_data["players"]),
+                            "holes": len(round_data["holes"]), "seconds": elapsed, "problems": problems})
+            print(f"  round {round_data.get('id', number)}: {elapsed * 1000:.1f} ms, "
+                  f"{'ok' if not problems else f'{len(problems)} problems'}", file=sys.stderr)
+            for problem in problems:
+                print(f"    {problem}", file=sys.stderr)
+
+    transitions = {}
+    for before, after, seconds in driver.transitions:
+        transitions.setdefault(f"{before} -> {after}", []).append(seconds)
+    table_updates = {}
+    for name, seconds in driver.table_updates:
+        table_updates.setdefault(f"ProgressWindow.{name}", []).append(seconds)
+
+    output = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "script": args.script
+        },
+        "rounds": results,
+        "transitions": summarize(transitions),
+        "table_updates": summarize(table_updates)
+    }
+
+    for kind in ("transitions", "table_updates"):
+        for label, timing in output[kind].items():
+            print(f"  {label:<45} median {timing['median'] * 1000:8.2f} ms, "
+                  f"max {timing['max'] * 1000:8.2f} ms ({timing['count']}x)", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), output)
+
+    failed = [result for result in results if result["problems"]]
+    too_slow = []
+    if args.max_ms is not None:
+        too_slow = [label for kind in ("transitions", "table_updates")
+                    for label, timing in output[kind].items() if timing["max"] * 1000 > args.max_ms]
+    if failed:
+        print(f"{len(failed)} of {len(results)} rounds settled differently through the GUI", file=sys.stderr)
+    if too_slow:
+        print(f"Slower than {args.max_ms} ms: {', '.join(too_slow)}", file=sys.stderr)
+    return 1 if failed or too_slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
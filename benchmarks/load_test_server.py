@@ -0,0 +1,229 @@
+"""Load test for the scoring server: many scorer devices submitting at once.
+
+Run from the repository root:
+
+    python -m benchmarks.load_test_server --games 20 --scorers 4 --duration 10
+
+Unless --server HOST:PORT points at a running server, one is started in a
+separate process on a free local port. Every game gets --scorers
+connections that each submit one player's scores hole after hole (cycling
+through the holes) for --duration seconds, plus --subscribers WebSocket
+clients counting the settlement updates pushed to them. The report gives
+sustained submissions per second, latency percentiles and push counts.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import sys
+import time
+
+from benchmarks.synthetic import synthetic_round
+from src.server.protocol import read_frame
+from src.server.scoring_server import serve
+
+
+class Connection:
+    """A keep-alive HTTP/1.1 client connection."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, method, path, data=None):
+        body = json.dumps(data).encode("utf-8") if data is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: load-test\r\n"
+                          f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1")
+                          + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        payload = await self.reader.readexactly(length)
+        return status, payload
+
+    def close(self):
+        self.writer.close()
+
+
+async def create_games(host, port, games, players, holes):
+    connection = await Connection.open(host, port)
+    game_ids = []
+    for index in range(games):
+        round_data = synthetic_round(players, holes, seed=index)
+        hole_details = round_data.pop("holes")
+        round_data["id"] = f"load-{index}"
+        status, _ = await connection.request("POST", "/games", round_data)
+        if status != 201:
+            raise RuntimeError(f"Could not create game {round_data['id']}: HTTP {status}")
+        for hole in hole_details:
+            await connection.request("POST", f"/games/{round_data['id']}/holes",
+                                     {"hole": hole["hole"], "value": hole["value"], "par": hole["par"]})
+        game_ids.append((round_data["id"], round_data["players"]))
+    connection.close()
+    return game_ids
+
+
+async def scorer(host, port, game_id, player_name, holes, deadline, latencies, errors, seed):
+    """One device entering one player's scores, hole after hole, until the deadline."""
+    rng = random.Random(seed)
+    connection = await Connection.open(host, port)
+    hole_number = 0
+    while time.perf_counter() < deadline:
+        hole_number = hole_number % holes + 1
+        start = time.perf_counter()
+        status, _ = await connection.request(
+            "POST", f"/games/{game_id}/scores",
+            {"hole": hole_number, "player": player_name, "score": rng.randint(2, 7)})
+        latencies.append(time.perf_counter() - start)
+        if status != 200:
+            errors.append(status)
+    connection.close()
+
+
+async def subscriber(host, port, game_id, deadline, counts):
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    writer.write((f"GET /games/{game_id}/ws HTTP/1.1\r\nHost: load-test\r\nUpgrade: websocket\r\n"
+                  f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n")
+                 .encode("latin-1"))
+    await reader.readuntil(b"\r\n\r\n")
+    received = 0
+    try:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            await asyncio.wait_for(read_frame(reader), remaining)
+            received += 1
+    except asyncio.TimeoutError:
+        pass
+    counts.append(received)
+    writer.close()
+
+
+async def run_load(host, port, args):
+    game_ids = await create_games(host, port, args.games, args.players, args.holes)
+    latencies = []
+    errors = []
+    pushes = []
+
+    start = time.perf_counter()
+    deadline = start + args.duration
+    tasks = []
+    for game_index, (game_id, players) in enumerate(game_ids):
+        for _ in range(args.subscribers):
+            tasks.append(subscriber(host, port, game_id, deadline, pushes))
+        for scorer_index in range(args.scorers):
+            player_name = players[scorer_index % len(players)]
+            tasks.append(scorer(host, port, game_id, player_name, args.holes, deadline,
+                                latencies, errors, seed=game_index * 100 + scorer_index))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "games": args.games,
+        "scorers_per_game": args.scorers,
+        "subscribers_per_game": args.subscribers,
+        "duration": elapsed,
+        "submissions": len(latencies),
+        "submissions_per_second": len(latencies) / elapsed,
+        "errors": len(errors),
+        "latency_ms": {
+            "median": statistics.median(latencies) * 1000 if latencies else 0.0,
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "max": latencies[-1] * 1000 if latencies else 0.0
+        },
+        "pushes_received": sum(pushes),
+        "pushes_per_second": sum(pushes) / elapsed
+    }
+
+
+def _run_server(host, port):
+    try:
+        asyncio.run(serve(host, port))
+    except KeyboardInterrupt:
+        pass
+
+
+def free_port(host):
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(host, port, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Scoring server on {host}:{port} did not start")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the scoring server with concurrent scorers.")
+    parser.add_argument("--server", help="HOST:PORT of a running server (default: start one)")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--holes", type=int, default=18)
+    parser.add_argument("--scorers", type=int, default=4, help="concurrent scorer connections per game")
+    parser.add_argument("--subscribers", type=int, default=1, help="WebSocket subscribers per game")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of sustained submissions")
+    parser.add_argument("-o", "--output", help="also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    server_process = None
+    if args.server:
+        host, _, port = args.server.rpartition(":")
+        port = int(port)
+    else:
+        host, port = "127.0.0.1", free_port("127.0.0.1")
+        server_process = multiprocessing.Process(target=_run_server, args=(host, port), daemon=True)
+        server_process.start()
+    try:
+        wait_for_server(host, port)
+        report = asyncio.run(run_load(host, port, args))
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.join()
+
+    print(f"{report['submissions']} submissions in {report['duration']:.1f}s: "
+          f"{report['submissions_per_second']:.0f}/s sustained, {report['errors']} errors", file=sys.stderr)
+    print(f"latency median {report['latency_ms']['median']:.2f} ms, p95 {report['latency_ms']['p95']:.2f} ms, "
+          f"p99 {report['latency_ms']['p99']:.2f} ms; {report['pushes_received']} updates pushed "
+          f"({report['pushes_per_second']:.0f}/s)", file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
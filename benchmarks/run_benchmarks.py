@@ -0,0 +1,250 @@
+"""Benchmarks for the settlement model and the Qt views.
+
+Run from the repository root:
+
+    python -m benchmarks.run_benchmarks --grid quick -o results.json
+    python -m benchmarks.run_benchmarks --grid full --compare results.json -o new.json
+
+Model cases time calculate_payments_for_hole, calculate_all_payments (fresh
+and with every hole already settled) and _optimize_payments over a grid of
+player counts, hole counts, game modes, and voor/buchi on or off. View cases
+time ProgressWindow.update_all_tables / update_hole and FinalResultsScreen
+construction and first show (init_ui plus the first tab) under the offscreen
+Qt platform. Cases whose
+estimated work exceeds --max-work are skipped and listed in the output.
+The quick grid runs in seconds; the full grid takes a long time because the
+largest cases rebuild games of 180,000 holes for every measurement.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.synthetic import synthetic_round
+from src.models.game import Game
+
+GRIDS = {
+    "quick": {
+        "players": [2, 4, 10],
+        "holes": [9, 18, 180],
+        "view_players": [2, 4, 10],
+        "view_holes": [9, 18]
+    },
+    "full": {
+        "players": [2, 4, 10, 50, 200],
+        # up to 10,000 eighteen-hole rounds' worth of holes
+        "holes": [9, 18, 180, 1800, 18000, 180000],
+        "view_players": [2, 10, 50, 200],
+        "view_holes": [9, 18, 180]
+    }
+}
+
+GAME_MODES = ["single_winner", "face_to_face"]
+
+
+def measure(function, repeat, setup=None):
+    """Run function repeat times and return timing statistics in seconds."""
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "repeat": repeat
+    }
+
+
+def estimated_work(players, holes, game_mode):
+    pairs = players * (players - 1) // 2 if game_mode == "face_to_face" else players
+    return pairs * holes
+
+
+def model_cases(grid, max_work):
+    for players, holes, game_mode, voor, buchi in itertools.product(
+            grid["players"], grid["holes"], GAME_MODES, [False, True], [False, True]):
+        case = {"players": players, "holes": holes, "game_mode": game_mode,
+                "voor": voor, "buchi": buchi}
+        yield case, estimated_work(players, holes, game_mode) <= max_work
+
+
+def run_model_case(case, repeat, vectorized):
+    round_data = synthetic_round(case["players"], case["holes"], case["game_mode"],
+                                 voor=case["voor"], buchi=case["buchi"])
+
+    def fresh_game(_=None):
+        game = Game.from_dict(round_data)
+        game.use_vectorized_kernel = vectorized
+        return game
+
+    def settle_every_hole(game):
+        for hole_number in game.holes:
+            game.calculate_payments_for_hole(hole_number)
+
+    def settled_game():
+        game = fresh_game()
+        game.calculate_all_payments()
+        return game
+
+    results = {}
+    results["calculate_payments_for_hole"] = measure(settle_every_hole, repeat, fresh_game)
+    results["calculate_payments_for_hole"]["per_hole"] = (
+        results["calculate_payments_for_hole"]["median"] / case["holes"])
+    results["calculate_all_payments"] = measure(lambda game: game.calculate_all_payments(), repeat, fresh_game)
+    results["calculate_all_payments_cached"] = measure(
+        lambda game: game.calculate_all_payments(), repeat, settled_game)
+    results["_optimize_payments"] = measure(lambda game: game._optimize_payments(), repeat, settled_game)
+    return results
+
+
+def run_view_cases(grid, repeat):
+    """Time the view refresh paths; requires PyQt5."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from src.views.progress_window import ProgressWindow
+    from src.views.final_results_screen import FinalResultsScreen
+
+    app = QApplication.instance() or QApplication([])
+    results = []
+
+    for players, holes in itertools.product(grid["view_players"], grid["view_holes"]):
+        case = {"players": players, "holes": holes, "game_mode": "face_to_face",
+                "voor": True, "buchi": True}
+        game = Game.from_dict(synthetic_round(players, holes, "face_to_face"))
+        game.calculate_all_payments()
+
+        window = ProgressWindow(game)
+        window.show()
+        app.processEvents()
+
+        def update_all(_):
+            window.update_all_tables()
+            app.processEvents()
+
+        def update_hole(_):
+            window.update_hole(holes)
+            app.processEvents()
+
+        def final_results(_):
+            screen = FinalResultsScreen(game)
+            screen.show()
+            app.processEvents()
+            screen.close()
+            screen.deleteLater()
+
+        timings = {
+            "ProgressWindow.update_all_tables": measure(update_all, repeat),
+            "ProgressWindow.update_hole": measure(update_hole, repeat),
+            "FinalResultsScreen.init_ui": measure(final_results, repeat)
+        }
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+        results.append({"case": case, "timings": timings})
+        print(f"  views {players}p x {holes}h: "
+              f"update_all {timings['ProgressWindow.update_all_tables']['median'] * 1000:.2f} ms, "
+              f"final results {timings['FinalResultsScreen.init_ui']['median'] * 1000:.2f} ms",
+              file=sys.stderr)
+    return results
+
+
+def case_key(kind, case):
+    return (kind,) + tuple(sorted(case.items()))
+
+
+def compare(previous, current):
+    """Print the median ratio (current / previous) for every metric in both runs."""
+    old = {}
+    for kind in ("model", "views"):
+        for entry in previous.get(kind, []):
+            old[case_key(kind, entry["case"])] = entry["timings"]
+
+    print(f"{'case':<55} {'metric':<35} {'old ms':>10} {'new ms':>10} {'ratio':>7}")
+    for kind in ("model", "views"):
+        for entry in current.get(kind, []):
+            old_timings = old.get(case_key(kind, entry["case"]))
+            if not old_timings:
+                continue
+            case = entry["case"]
+            label = (f"{kind} {case['players']}p {case['holes']}h {case['game_mode']}"
+                     f" voor={int(case['voor'])} buchi={int(case['buchi'])}")
+            for metric, timing in entry["timings"].items():
+                if metric not in old_timings:
+                    continue
+                old_median = old_timings[metric]["median"]
+                ratio = timing["median"] / old_median if old_median else float("inf")
+                print(f"{label:<55} {metric:<35} {old_median * 1000:>10.3f} "
+                      f"{timing['median'] * 1000:>10.3f} {ratio:>7.2f}")
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+                                       text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the settlement model and the Qt views.")
+    parser.add_argument("--grid", choices=sorted(GRIDS), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-work", type=float, default=2e7,
+                        help="skip model cases with more player comparisons than this")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy face-to-face kernel")
+    parser.add_argument("--no-views", action="store_true", help="skip the Qt view benchmarks")
+    parser.add_argument("-o", "--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args(argv)
+
+    grid = GRIDS[args.grid]
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "grid": args.grid,
+            "repeat": args.repeat,
+            "vectorized": args.vectorized
+        },
+        "model": [],
+        "views": [],
+        "skipped": []
+    }
+
+    for case, runnable in model_cases(grid, args.max_work):
+        if not runnable:
+            results["skipped"].append(case)
+            continue
+        timings = run_model_case(case, args.repeat, args.vectorized)
+        results["model"].append({"case": case, "timings": timings})
+        print(f"  model {case['players']}p x {case['holes']}h {case['game_mode']} "
+              f"voor={int(case['voor'])} buchi={int(case['buchi'])}: "
+              f"all {timings['calculate_all_payments']['median'] * 1000:.2f} ms",
+              file=sys.stderr)
+
+    if not args.no_views:
+        results["views"] = run_view_cases(grid, args.repeat)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {len(results['model'])} model and {len(results['views'])} view cases to {args.output}"
+          f" ({len(results['skipped'])} skipped)", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
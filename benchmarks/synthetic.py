@@ -0,0 +1,55 @@
+"""Deterministic synthetic rounds for benchmarks and load tests."""
+import random
+
+from src.models.game import Game
+
+PARS = [3, 4, 4, 4, 5]
+
+
+def synthetic_round(players, holes, game_mode="face_to_face", scoring_type="par",
+                    voor=True, buchi=True, seed=0):
+    """A round dictionary in the batch/scorecard format."""
+    rng = random.Random(seed)
+    names = [f"Player {i}" for i in range(1, players + 1)]
+
+    voor_data = {}
+    if voor:
+        for name in names:
+            voor_data[name] = {opponent: rng.randint(0, 2) for opponent in names if opponent != name}
+
+    hole_data = []
+    for hole_number in range(1, holes + 1):
+        par = rng.choice(PARS)
+        scores = {name: max(1, par + rng.randint(-2, 3)) for name in names}
+
+        participants = []
+        winners = []
+        if buchi and players >= 2:
+            participants = rng.sample(names, rng.randint(2, min(players, 4)))
+            winners = participants[:rng.randint(1, len(participants) - 1)]
+
+        hole_data.append({
+            "hole": hole_number,
+            "value": rng.choice([5, 10, 20]),
+            "par": par,
+            "scores": scores,
+            "buchi": {"participants": participants, "winners": winners}
+        })
+
+    return {
+        "id": f"synthetic-{players}p-{holes}h-{seed}",
+        "settings": {
+            "number_of_holes": holes,
+            "game_mode": game_mode,
+            "scoring_type": scoring_type,
+            "buchi_enabled": buchi,
+            "voor_enabled": voor
+        },
+        "players": names,
+        "voor": voor_data,
+        "holes": hole_data
+    }
+
+
+def synthetic_game(players, holes, **options):
+    return Game.from_dict(synthetic_round(players, holes, **options))
@@ -0,0 +1,39 @@
+import argparse
+import logging
+import sys
+
+from src.models.batch import default_process_count
+from src.models.csv_import import import_csv, CHUNK_ROUNDS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Settle the rounds of a club scorecard CSV file (one row per player per hole), "
+                    "reporting bad rows without stopping.")
+    parser.add_argument("input", help="CSV file with round, hole, par, value, player and score columns")
+    parser.add_argument("-o", "--output", default="results.jsonl",
+                        help="where to write one JSON result line per round (default: results.jsonl)")
+    parser.add_argument("--errors", help="write bad rows and skipped rounds to this CSV file (default: log them)")
+    parser.add_argument("--rounds-output",
+                        help="also write the parsed rounds as JSON lines, for archive.py import or tournament.py")
+    parser.add_argument("-p", "--processes", type=int, default=default_process_count(),
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--chunk-rounds", type=int, default=CHUNK_ROUNDS,
+                        help=f"rounds handed to the workers at a time (default: {CHUNK_ROUNDS})")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="use the NumPy face-to-face kernel when NumPy is installed")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+    try:
+        report = import_csv(args.input, args.output, args.errors, args.processes, args.chunk_rounds,
+                            args.vectorized, args.rounds_output)
+    except ValueError as e:
+        print(f"{args.input}: {e}", file=sys.stderr)
+        return 2
+    print(report.summary(), file=sys.stderr)
+    return 1 if report.errors or report.skipped_rounds else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
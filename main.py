@@ -1,17 +1,37 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from src.controllers.app_controller import AppController
-import os
+import time
 
 if __name__ == "__main__":
+    started = time.perf_counter()
+
+    # --profile-startup: report import time per module and the time to the first StartScreen paint
+    profile_startup = "--profile-startup" in sys.argv
+    if profile_startup:
+        sys.argv.remove("--profile-startup")
+        from src.startup_profile import ImportTimer
+        import_timer = ImportTimer()
+        import_timer.install()
+
+    from PyQt5.QtWidgets import QApplication
+    from src.controllers.app_controller import AppController
+    from src.views.styles import apply_base_stylesheet
+
     app = QApplication(sys.argv)
-    
-    # Set application-wide stylesheet
-    style_path = os.path.join(os.path.dirname(__file__), "src", "assets", "style.qss")
-    with open(style_path, "r") as f:
-        app.setStyleSheet(f.read())
-    
+
+    # Set application-wide stylesheet (table styles follow once the start screen has painted)
+    apply_base_stylesheet(app)
+
     controller = AppController()
-    controller.show_start_screen()
-    
-    sys.exit(app.exec_())
\ No newline at end of file
+    # Pick up an unfinished game after a crash, otherwise start a new one
+    if not controller.resume_game():
+        controller.show_start_screen()
+
+    if profile_startup and controller.start_screen is not None:
+        def report_startup():
+            import_timer.uninstall()
+            import_timer.report()
+            print(f"First StartScreen paint after {(time.perf_counter() - started) * 1000:.1f} ms",
+                  file=sys.stderr)
+        controller.start_screen.first_paint_signal.connect(report_startup)
+
+    sys.exit(app.exec_())
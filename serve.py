@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+import logging
+import sys
+
+from src.models.batch import read_rounds
+from src.server.scoring_server import serve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the local scoring server so several devices can enter scores at once.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on; 0.0.0.0 for every device on the LAN (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    parser.add_argument("--load", help="JSON array or JSON lines file of rounds to open as games at start-up")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    rounds = list(read_rounds(args.load)) if args.load else []
+    try:
+        asyncio.run(serve(args.host, args.port, rounds))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
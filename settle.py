@@ -0,0 +1,40 @@
+import argparse
+import json
+import sys
+
+from src.models import money
+from src.models.batch import settle_file, default_process_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Settle golf rounds from a scorecard file without opening the GUI.")
+    parser.add_argument("input", help="JSON array or JSON lines file with one round per entry")
+    parser.add_argument("-o", "--output", default="results.jsonl",
+                        help="where to write one JSON result line per round (default: results.jsonl)")
+    parser.add_argument("-p", "--processes", type=int, default=default_process_count(),
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=16,
+                        help="rounds handed to a worker at a time (default: 16)")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="use the NumPy face-to-face kernel when NumPy is installed")
+    parser.add_argument("--trace",
+                        help="write every calculation step (winner, scores, multiplier, payment) to this JSON lines file")
+    parser.add_argument("--league-output",
+                        help="also settle all rounds together and write the transfers to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = settle_file(args.input, args.output, args.processes, args.chunksize,
+                         args.vectorized, args.trace)
+    print(report.summary(), file=sys.stderr)
+
+    if args.league_output:
+        league = report.league_settlement()
+        with open(args.league_output, "w") as f:
+            json.dump({"final_payments": money.payments_to_major(league.payments), "settlement": league.to_dict()}, f, indent=2)
+        print(f"League settlement: {league.summary()}", file=sys.stderr)
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import argparse
+import json
+import sys
+
+from src.models.scoring import load_scoring_rules, validate_rules
+
+from src.models.batch import read_rounds, default_process_count
+from src.models.simulator import (
+    VoorSimulator, PlayerModel, DEFAULT_PARS, available, fit_players, score_history
+)
+
+
+def parse_hand_entry(entry):
+    """NAME=AVERAGE[:SPREAD], e.g. "Player 1=0.8:1.2" (strokes over par per hole)."""
+    name, _, numbers = entry.rpartition("=")
+    if not name:
+        raise argparse.ArgumentTypeError(f"Expected NAME=AVERAGE[:SPREAD], got {entry!r}")
+    average, _, spread = numbers.partition(":")
+    try:
+        return PlayerModel.from_average(name, float(average), float(spread) if spread else 1.0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected NAME=AVERAGE[:SPREAD], got {entry!r}")
+
+
+def load_players(args):
+    """Fit the named players from past rounds, then apply the hand-entered ones."""
+    hand_entered = {player.name: player for player in args.player}
+    names = args.players or list(hand_entered)
+
+    history = {}
+    if args.history:
+        history = score_history(read_rounds(args.history))
+    elif args.db:
+        from src.models.round_archive import RoundArchive
+        with RoundArchive(args.db) as archive:
+            history = archive.score_history(players=names or None)
+    elif args.season:
+        from src.models.binary_archive import BinaryArchive
+        with BinaryArchive(args.season) as archive:
+            history = archive.score_history(players=names or None)
+
+    fitted = {}
+    if history:
+        fitted = {player.name: player for player in fit_players(history, names or None)}
+        names = names or list(fitted)
+
+    missing = [name for name in names if name not in hand_entered and name not in fitted]
+    if missing:
+        raise SystemExit(f"No scores for {', '.join(missing)}: give --history/--db/--season or --player NAME=AVERAGE")
+    return [hand_entered.get(name) or fitted[name] for name in names]
+
+
+def print_estimate(title, estimate, players):
+    averages = {player.name: player.expected_offset for player in players}
+    print(title)
+    print(f"  {'Player':<20} {'Over par':>8} {'Expected':>10} {'+/-':>7}")
+    for name in estimate.players:
+        print(f"  {name:<20} {averages[name]:>8.2f} {estimate.mean[name]:>10.2f} {estimate.stderr[name]:>7.2f}")
+    print(f"  spread (rms of expected payouts): {estimate.spread:.2f}")
+
+
+def print_voor(voor, names):
+    print("Voor (row player receives against column player):")
+    print("  " + " " * 20 + "".join(f"{name[:8]:>9}" for name in names))
+    for name in names:
+        adjustments = voor.get(name, {})
+        cells = "".join(f"{'-' if opponent == name else adjustments.get(opponent, 0):>9}" for opponent in names)
+        print(f"  {name:<20}{cells}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Simulate rounds to see each player's expected payout under a voor setting, "
+                    "or search for the fairest voor.")
+    parser.add_argument("--players", nargs="+", help="players in the group (default: everyone with a history)")
+    parser.add_argument("--history", help="fit players from this scorecard file (JSON array or JSON lines)")
+    parser.add_argument("--db", help="fit players from this round archive database")
+    parser.add_argument("--season", help="fit players from this binary round archive (archive.py binary)")
+    parser.add_argument("--player", action="append", type=parse_hand_entry, default=[],
+                        help="hand-entered player NAME=AVERAGE[:SPREAD] strokes over par per hole (repeatable)")
+    parser.add_argument("--mode", choices=["face_to_face", "single_winner"], default="face_to_face")
+    parser.add_argument("--scoring", choices=sorted(load_scoring_rules()), default="par",
+                        help="named scoring rules (default: par)")
+    parser.add_argument("--scoring-rules", help="JSON file with the game's own scoring rules, used instead of --scoring")
+    parser.add_argument("--buchi", action="store_true", help="include buchi with the players' buchi record")
+    parser.add_argument("--pars", default=",".join(str(par) for par in DEFAULT_PARS),
+                        help="comma-separated par of every hole (default: an 18 hole par 72 course)")
+    parser.add_argument("--value", type=float, default=10, help="hole value (default: 10)")
+    parser.add_argument("--voor", help="JSON file with the voor to evaluate, {player: {opponent: strokes}}")
+    parser.add_argument("--search", action="store_true", help="search for the voor that equalizes payouts")
+    parser.add_argument("--rounds", type=int, default=1000000, help="simulated rounds (default: 1,000,000)")
+    parser.add_argument("-p", "--processes", type=int, default=default_process_count(),
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    if not available():
+        print("The simulator needs NumPy: pip install numpy", file=sys.stderr)
+        return 1
+
+    players = load_players(args)
+    pars = [int(par) for par in args.pars.split(",") if par.strip()]
+    voor = None
+    if args.voor:
+        with open(args.voor) as f:
+            voor = json.load(f)
+
+    scoring_rules = None
+    if args.scoring_rules:
+        with open(args.scoring_rules) as f:
+            scoring_rules = json.load(f)
+        try:
+            validate_rules(scoring_rules)
+        except ValueError as e:
+            raise SystemExit(f"{args.scoring_rules}: {e}")
+
+    with VoorSimulator(players, pars, args.value, args.mode, args.scoring, args.buchi,
+                       args.rounds, args.processes, args.seed, scoring_rules) as simulator:
+        if args.search:
+            result = simulator.search(voor)
+            print_estimate("Current voor:", result.baseline, players)
+            print()
+            print_voor(result.voor, simulator.names)
+            print_estimate("With this voor:", result.estimate, players)
+            print(f"Compared {result.candidates} voor settings over {args.rounds} rounds "
+                  f"in {result.elapsed:.1f}s", file=sys.stderr)
+            report = result.to_dict()
+        else:
+            estimate = simulator.evaluate(voor)
+            print_estimate("Expected payout per round:", estimate, players)
+            report = estimate.to_dict()
+
+    if args.output:
+        report["players"] = [player.to_dict() for player in players]
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,38 @@
-from PyQt5.QtWidgets import QMainWindow
+import logging
+import sqlite3
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QMainWindow, QStackedWidget
 
 from src.models.game import Game, GameSettings
+from src.models.journal import GameJournal, default_journal_path
 from src.views.start_screen import StartScreen
-from src.views.game_setup_screen import GameSetupScreen
-from src.views.hole_screen import HoleScreen
-from src.views.buchi_screen import BuchiScreen
-from src.views.results_screen import ResultsScreen
-from src.views.final_results_screen import FinalResultsScreen
-from src.views.progress_window import ProgressWindow
+from src.views.styles import apply_deferred_stylesheets
+
+# The other screens, the progress window and the round archive are imported
+# the first time they are needed so they do not delay the first window.
+
+logger = logging.getLogger(__name__)
 
 
 class AppController:
-    def __init__(self):
+    def __init__(self, archive_path=None, journal_path=None):
         self.main_window = QMainWindow()
         self.main_window.setWindowTitle("Golf Helper")
         self.main_window.setMinimumSize(1200, 800)
         
+        # Screens live in one stack and are reused between holes and games
+        self.stack = QStackedWidget()
+        self.main_window.setCentralWidget(self.stack)
+        
         self.game_settings = GameSettings()
         self.game = None
         self.progress_window = None
+        self.archive_path = archive_path  # None means the default archive location
+        self.journal_path = journal_path or default_journal_path()
+        self.journal = None  # GameJournal of the game in progress
         
-        # Initialize screens (they'll be created when needed)
+        # Screens are created the first time they are needed
         self.start_screen = None
         self.game_setup_screen = None
         self.hole_screen = None
@@ -30,25 +42,109 @@ class AppController:
 
     def show_start_screen(self):
         """Show the initial game setup screen."""
-        self.start_screen = StartScreen(self.game_settings)
-        self.start_screen.start_game_signal.connect(self.on_start_game)
+        if self.start_screen is None:
+            self.start_screen = StartScreen(self.game_settings)
+            self.start_screen.start_game_signal.connect(self.on_start_game)
+            # Let the first frame paint before the table and tab styles are parsed
+            self.start_screen.first_paint_signal.connect(
+                lambda: QTimer.singleShot(0, apply_deferred_stylesheets))
+        else:
+            self.start_screen.reset(self.game_settings)
         
-        self.main_window.setCentralWidget(self.start_screen)
+        self.show_screen(self.start_screen)
         self.main_window.show()
 
+    def resume_game(self):
+        """Recover an unfinished game from the journal and show the screen it was on.
+        
+        Returns False (and changes nothing) if there is no journaled game.
+        """
+        try:
+            journal = GameJournal.recover(self.journal_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.exception("Could not recover the journaled game")
+            return False
+        if journal is None:
+            return False
+        
+        self.journal = journal
+        self.game = journal.game
+        self.game_settings = self.game.settings
+        apply_deferred_stylesheets()
+        
+        # Holes already played need their payments for the progress window
+        for hole_number in self.game.holes:
+            if hole_number < self.game.current_hole:
+                self.game.calculate_payments_for_hole(hole_number)
+        self.open_progress_window()
+        
+        hole_number = self.game.current_hole
+        hole = self.game.holes.get(hole_number)
+        if hole_number > self.game_settings.number_of_holes:
+            self.show_final_results()
+        elif hole is None:
+            if not self.game.holes and self.game_settings.voor_enabled:
+                self.show_game_setup_screen()
+            else:
+                self.show_next_hole()
+        elif len(hole.player_scores) < len(self.game.players):
+            # The hole screen was open (or only partly saved)
+            self.show_hole_screen(hole_number)
+        elif self.game.settings.buchi_enabled and not hole.buchi_participants:
+            # Scores saved but no buchi yet (a hole without buchi is asked again)
+            self.show_buchi_screen(hole_number)
+        else:
+            self.game.calculate_payments_for_hole(hole_number)
+            self.show_results_screen(hole_number)
+            self.progress_window.update_hole(hole_number)
+        
+        self.main_window.show()
+        return True
+
+    def start_journal(self):
+        """Journal the new game so it can be recovered after a crash."""
+        try:
+            self.journal = GameJournal(self.journal_path).start(self.game)
+        except OSError:
+            # Playing without a journal is better than not playing
+            logger.exception("Could not start the game journal")
+            self.journal = None
+
+    def finish_journal(self):
+        """The round is over: nothing left to recover."""
+        if self.journal is not None:
+            self.journal.discard()
+            self.journal = None
+
+    def show_screen(self, screen):
+        """Make screen the visible page of the stack, adding it if needed."""
+        if self.stack.indexOf(screen) < 0:
+            self.stack.addWidget(screen)
+        self.stack.setCurrentWidget(screen)
+
+    def discard_screen(self, screen):
+        """Remove a per-game screen from the stack and free it."""
+        if screen is not None:
+            self.stack.removeWidget(screen)
+            screen.deleteLater()
+
     def on_start_game(self):
         """Handler for when the user wants to start a new game."""
         # Initialize the game with current settings
         self.game = Game(self.game_settings)
         
+        # Normally already applied after the first paint; a no-op in that case
+        apply_deferred_stylesheets()
+        
         # Add players
         for i in range(1, self.game_settings.number_of_players + 1):
             player_name = f"Player {i}"
             self.game.add_player(player_name)
         
+        self.start_journal()
+        
         # Create and show progress window
-        self.progress_window = ProgressWindow(self.game)
-        self.progress_window.show()
+        self.open_progress_window()
         
         # Show game setup screen for voor adjustments if needed
         if self.game_settings.voor_enabled:
@@ -57,12 +153,22 @@ class AppController:
             # Skip to first hole if voor not enabled
             self.show_next_hole()
 
+    def open_progress_window(self):
+        """Create and show the progress window for the current game."""
+        from src.views.progress_window import ProgressWindow
+        self.progress_window = ProgressWindow(self.game)
+        self.progress_window.hole_corrected.connect(self.on_hole_corrected)
+        self.progress_window.show()
+
     def show_game_setup_screen(self):
         """Show the game setup screen for voor adjustments."""
+        from src.views.game_setup_screen import GameSetupScreen
+        
+        self.discard_screen(self.game_setup_screen)
         self.game_setup_screen = GameSetupScreen(self.game)
         self.game_setup_screen.continue_signal.connect(self.show_next_hole)
         
-        self.main_window.setCentralWidget(self.game_setup_screen)
+        self.show_screen(self.game_setup_screen)
 
     def show_next_hole(self):
         """Show the screen for the next hole."""
@@ -72,15 +178,22 @@ class AppController:
         if current_hole > self.game_settings.number_of_holes:
             self.show_final_results()
             return
-            
+        
         # Create a new hole in the game
         self.game.add_hole(current_hole, 0, 0)  # Default values will be set by user
         
-        # Show the hole screen
-        self.hole_screen = HoleScreen(self.game, current_hole)
-        self.hole_screen.continue_signal.connect(self.on_hole_completed)
+        self.show_hole_screen(current_hole)
+
+    def show_hole_screen(self, hole_number):
+        """Show the score entry screen for a hole."""
+        if self.hole_screen is None:
+            from src.views.hole_screen import HoleScreen
+            self.hole_screen = HoleScreen(self.game, hole_number)
+            self.hole_screen.continue_signal.connect(self.on_hole_completed)
+        else:
+            self.hole_screen.reset(self.game, hole_number)
         
-        self.main_window.setCentralWidget(self.hole_screen)
+        self.show_screen(self.hole_screen)
 
     def on_hole_completed(self):
         """Handler for when a hole is completed."""
@@ -91,20 +204,23 @@ class AppController:
             # Calculate payments for the current hole
             self.game.calculate_payments_for_hole(self.game.current_hole)
             # Show results screen
-            self.results_screen = ResultsScreen(self.game, self.game.current_hole)
-            self.results_screen.continue_signal.connect(self.on_results_acknowledged)
-            self.main_window.setCentralWidget(self.results_screen)
+            self.show_results_screen(self.game.current_hole)
         
         # Update progress window
-        if hasattr(self, 'progress_window'):
-            self.progress_window.update_table()
+        if self.progress_window:
+            self.progress_window.update_hole(self.game.current_hole)
 
     def show_buchi_screen(self, hole_number):
         """Show the buchi selection screen."""
-        self.buchi_screen = BuchiScreen(self.game, hole_number)
-        self.buchi_screen.continue_signal.connect(lambda: self.on_buchi_completed(hole_number))
+        if self.buchi_screen is None:
+            from src.views.buchi_screen import BuchiScreen
+            self.buchi_screen = BuchiScreen(self.game, hole_number)
+            self.buchi_screen.continue_signal.connect(
+                lambda: self.on_buchi_completed(self.buchi_screen.hole_number))
+        else:
+            self.buchi_screen.reset(self.game, hole_number)
         
-        self.main_window.setCentralWidget(self.buchi_screen)
+        self.show_screen(self.buchi_screen)
 
     def on_buchi_completed(self, hole_number):
         """Handler for when buchi selections are completed."""
@@ -112,20 +228,50 @@ class AppController:
         self.game.calculate_payments_for_hole(hole_number)
         
         # Show results screen
-        self.results_screen = ResultsScreen(self.game, hole_number)
-        self.results_screen.continue_signal.connect(self.on_results_acknowledged)
-        self.main_window.setCentralWidget(self.results_screen)
+        self.show_results_screen(hole_number)
         
         # Update progress window
-        if hasattr(self, 'progress_window'):
-            self.progress_window.update_table()
+        if self.progress_window:
+            self.progress_window.update_hole(hole_number)
+
+    def show_results_screen(self, hole_number):
+        """Show the results screen for a hole."""
+        if self.results_screen is None:
+            from src.views.results_screen import ResultsScreen
+            self.results_screen = ResultsScreen(self.game, hole_number)
+            self.results_screen.continue_signal.connect(self.on_results_acknowledged)
+        else:
+            self.results_screen.reset(self.game, hole_number)
+        
+        self.show_screen(self.results_screen)
+        
+        # A finished hole is a good point to make the journal durable
+        if self.journal is not None:
+            self.journal.sync()
+
+    def correct_hole(self, hole_number, **changes):
+        """Fix a past hole's value, par, scores or buchi (see Game.correct_hole).
+        
+        Only while the round is in progress: a finished round has been archived.
+        """
+        if self.game.current_hole > self.game_settings.number_of_holes:
+            raise ValueError("The round is over; its results have been archived")
+        correction = self.game.correct_hole(hole_number, **changes)
+        if self.progress_window:
+            self.progress_window.update_hole(hole_number)
+        self.on_hole_corrected(hole_number)
+        return correction
+
+    def on_hole_corrected(self, hole_number):
+        """Handler for a past hole whose inputs were corrected."""
+        # The results screen may still be showing the corrected hole
+        if (self.results_screen is not None and self.stack.currentWidget() is self.results_screen
+                and self.results_screen.hole_number == hole_number):
+            self.results_screen.populate()
 
     def show_hole_results(self, hole_number):
         """Show the results for a specific hole."""
-        self.results_screen = ResultsScreen(self.game, hole_number)
-        self.results_screen.continue_signal.connect(self.on_continue_to_next_hole)
-        
-        self.main_window.setCentralWidget(self.results_screen)
+        self.show_results_screen(hole_number)
 
     def on_continue_to_next_hole(self):
         """Handler for continuing to the next hole."""
@@ -137,11 +283,27 @@ class AppController:
         """Show the final results screen."""
         # Calculate all payments and optimize them
         self.game.calculate_all_payments()
+        self.archive_game()
+        self.finish_journal()
         
+        from src.views.final_results_screen import FinalResultsScreen
+        
+        self.discard_screen(self.final_results_screen)
         self.final_results_screen = FinalResultsScreen(self.game)
         self.final_results_screen.new_game_signal.connect(self.on_new_game)
         
-        self.main_window.setCentralWidget(self.final_results_screen)
+        self.show_screen(self.final_results_screen)
+
+    def archive_game(self):
+        """Store the finished round in the round archive."""
+        from src.models.round_archive import RoundArchive
+        
+        try:
+            with RoundArchive(self.archive_path) as archive:
+                archive.save_game(self.game)
+        except (OSError, sqlite3.Error):
+            # Losing the archive copy must never block showing the results
+            logger.exception("Could not archive the finished round")
 
     def on_new_game(self):
         """Handler for starting a new game."""
@@ -149,7 +311,7 @@ class AppController:
         if self.progress_window:
             self.progress_window.close()
             self.progress_window = None
-            
+        
         # Reset game settings and show start screen
         self.game_settings = GameSettings()
         self.show_start_screen()
@@ -163,8 +325,4 @@ class AppController:
         if self.game.current_hole <= self.game_settings.number_of_holes:
             self.show_next_hole()
         else:
-            self.show_final_results()
-            
-        # Update progress window
-        if hasattr(self, 'progress_window'):
-            self.progress_window.update_table()
\ No newline at end of file
+            self.show_final_results()
\ No newline at end of file
@@ -0,0 +1,39 @@
+from PyQt5.QtCore import QTimer
+
+from src.views.standings_window import StandingsWindow
+
+
+class TournamentController:
+    """Shows a tournament's combined standings and keeps them current.
+
+    Holes are posted to the Tournament as groups finish them; a timer applies
+    whatever the worker pool has settled since the last tick and refreshes
+    only the standings rows that changed.
+    """
+
+    def __init__(self, tournament, poll_interval=200):
+        self.tournament = tournament
+        self.standings_window = StandingsWindow(tournament)
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.on_poll)
+        self.timer.start(poll_interval)
+
+    def show(self):
+        self.standings_window.show()
+
+    def post_hole(self, group_id, hole_data):
+        """Record a finished hole for a group; standings follow once it is settled."""
+        self.tournament.post_hole(group_id, hole_data)
+
+    def on_poll(self):
+        changed = self.tournament.collect()
+        if changed:
+            self.standings_window.update_entries(changed)
+        else:
+            self.standings_window.update_status()
+
+    def close(self):
+        self.timer.stop()
+        self.standings_window.close()
+        self.tournament.close()
@@ -0,0 +1,172 @@
+"""Headless settlement of many rounds without the GUI.
+
+Rounds are plain dictionaries in the format produced by Game.to_dict:
+
+    {
+        "id": "2024-06-01-group-1",
+        "settings": {"game_mode": "face_to_face", "scoring_type": "par",
+                     "buchi_enabled": true, "voor_enabled": true},
+        "players": ["Player 1", "Player 2"],
+        "voor": {"Player 1": {"Player 2": 1}},
+        "holes": [
+            {"hole": 1, "value": 10, "par": 3,
+             "scores": {"Player 1": 3, "Player 2": 4},
+             "buchi": {"participants": ["Player 1", "Player 2"], "winners": ["Player 2"]}}
+        ]
+    }
+
+Amounts in the results are in major units, like the hole values they come from.
+
+This module must never import PyQt5 so it can run on machines without a display.
+"""
+import functools
+import json
+import multiprocessing
+import os
+import time
+
+from src.models import money, settlement
+from src.models.game import Game
+
+
+def read_rounds(path):
+    """Yield round dictionaries from a JSON array file, a JSON lines file or a scorecard CSV file.
+
+    Bad rows in a CSV file are logged and their rounds skipped (see csv_import).
+    """
+    if path.lower().endswith(".csv"):
+        from src.models.csv_import import read_csv_rounds
+        yield from read_csv_rounds(path)
+        return
+
+    with open(path, "r") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == "[":
+            for round_data in json.load(f):
+                yield round_data
+            return
+
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def settle_round(round_data, vectorized=False, trace=False):
+    """Settle a single round and return its result dictionary.
+
+    With trace=True the result also carries the round's calculation trace
+    entries under "trace".
+    """
+    game = Game.from_dict(round_data)
+    game.use_vectorized_kernel = vectorized
+    if trace:
+        game.enable_trace()
+
+    game.calculate_all_payments()
+
+    hole_payments = {}
+    for hole_number, hole in sorted(game.holes.items()):
+        if hole.payments:
+            hole_payments[str(hole_number)] = money.payments_to_major(hole.payments)
+
+    result = {
+        "id": round_data.get("id"),
+        "final_payments": money.payments_to_major(game.final_payments),
+        "settlement": game.settlement.to_dict(),
+        "hole_payments": hole_payments
+    }
+    if trace:
+        result["trace"] = game.trace.entries
+    return result
+
+
+def _settle_round_safely(round_data, vectorized=False, trace=False):
+    """Pool worker: settle a round, turning failures into an error result."""
+    try:
+        return settle_round(round_data, vectorized, trace)
+    except Exception as e:
+        return {"id": round_data.get("id"), "error": f"{type(e).__name__}: {e}"}
+
+
+class BatchReport:
+    def __init__(self):
+        self.rounds = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.balances = {}  # player_name: net balance across every settled round, in minor units
+
+    @property
+    def rounds_per_second(self):
+        if self.elapsed <= 0:
+            return 0.0
+        return self.rounds / self.elapsed
+
+    def league_settlement(self):
+        """Settle every round in the batch at once, as a single set of transfers."""
+        return settlement.settle_balances(self.balances)
+
+    def summary(self):
+        return (f"Settled {self.rounds} rounds ({self.errors} failed) in "
+                f"{self.elapsed:.3f}s - {self.rounds_per_second:.1f} rounds/s")
+
+
+def settle_rounds(rounds, processes=None, chunksize=16, vectorized=False, trace=False):
+    """Settle rounds across a process pool, yielding results in input order.
+
+    With processes=1 everything runs in the calling process, which is handy for
+    debugging and avoids pool start-up cost for small batches.
+    """
+    worker = functools.partial(_settle_round_safely, vectorized=vectorized, trace=trace)
+
+    if processes == 1:
+        for round_data in rounds:
+            yield worker(round_data)
+        return
+
+    with multiprocessing.Pool(processes=processes) as pool:
+        for result in pool.imap(worker, rounds, chunksize=chunksize):
+            yield result
+
+
+def settle_file(input_path, output_path, processes=None, chunksize=16, vectorized=False, trace_path=None):
+    """Settle every round in input_path and write one JSON line per round to output_path.
+
+    If trace_path is given, every calculation step is written there as JSON
+    lines tagged with the round id.
+    """
+    report = BatchReport()
+    start = time.perf_counter()
+    trace_out = open(trace_path, "w") if trace_path else None
+
+    try:
+        with open(output_path, "w") as out:
+            rounds = settle_rounds(read_rounds(input_path), processes, chunksize, vectorized,
+                                   trace=trace_out is not None)
+            for result in rounds:
+                report.rounds += 1
+                if "error" in result:
+                    report.errors += 1
+                else:
+                    settlement.net_balances(money.payments_to_minor(result["final_payments"]), report.balances)
+
+                for entry in result.pop("trace", []):
+                    trace_out.write(json.dumps(dict({"round": result["id"]}, **entry)))
+                    trace_out.write("\n")
+
+                out.write(json.dumps(result))
+                out.write("\n")
+    finally:
+        if trace_out:
+            trace_out.close()
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def default_process_count():
+    return os.cpu_count() or 1
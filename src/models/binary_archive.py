@@ -0,0 +1,362 @@
+"""Fixed-layout binary archive of completed rounds, read through mmap.
+
+Loading a season from the SQLite archive builds a Game per round; this
+format keeps every round's inputs as flat arrays so a season can be scanned
+without building any objects. The file is little-endian:
+
+    header        magic "GBTA", version, round count, string count and the
+                  offsets of the string table and the round index
+    round data    per round, each array starting on an 8 byte boundary:
+                    players  uint32[P]   string table indices
+                    holes    int32[H]    hole numbers
+                    pars     int32[H]
+                    values   int64[H]    hole values in minor units (see money)
+                    scores   int32[H*P]  hole-major, like ScoreMatrix; 0 = no score
+                    buchi    uint8[H*P]  BUCHI_PLAYED | BUCHI_WON bits
+                    voor     int32[P*P]  voor[i*P + j]: what player i receives against j
+    string table  uint32[count + 1] offsets, then the UTF-8 bytes of every
+                  player name, course, date, id, game mode and scoring rule set,
+                  each stored once
+    round index   one ROUND_RECORD per round
+
+BinaryArchive maps the file read-only and hands out memoryviews straight
+into the mapping, so reading a round's arrays copies nothing;
+numpy.asarray() wraps a view the same way. A view keeps the mapping alive
+even after the archive is closed. Buchi participants come back in player
+order.
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from src.models import money
+from src.models.game import Game
+
+MAGIC = b"GBTA"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIQQ")  # magic, version, reserved, rounds, strings, string table, round index
+# external id (-1: none), date, course, game mode, scoring type, scoring rules (-1: none),
+# flags, players, holes, number_of_holes, offset of the round's data
+ROUND_RECORD = struct.Struct("<iIIIIiBHHHQ")
+
+FLAG_BUCHI = 1
+FLAG_VOOR = 2
+BUCHI_PLAYED = 1
+BUCHI_WON = 2
+
+ALIGNMENT = 8
+# Views into the mapping need the file's byte order; big-endian machines get swapped copies instead
+SWAP_BYTES = sys.byteorder != "little"
+
+
+def _padding(position):
+    return -position % ALIGNMENT
+
+
+def _layout(players, holes):
+    """(name, typecode, count) of each array in a round's data, in file order."""
+    return (
+        ("players", "I", players),
+        ("holes", "i", holes),
+        ("pars", "i", holes),
+        ("values", "q", holes),
+        ("scores", "i", holes * players),
+        ("buchi", "B", holes * players),
+        ("voor", "i", players * players)
+    )
+
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}  # string: position in the table
+
+    def intern(self, text):
+        if text is None:
+            return -1
+        position = self.index.get(text)
+        if position is None:
+            position = self.index[text] = len(self.index)
+        return position
+
+    def encode(self):
+        offsets = array("I", [0])
+        blob = bytearray()
+        for text in self.index:
+            blob += text.encode("utf-8")
+            offsets.append(len(blob))
+        return offsets, bytes(blob)
+
+
+def write_archive(path, games):
+    """Write completed games to a binary archive and return the number of rounds.
+
+    games is an iterable of Game objects or (external_id, Game) pairs, as
+    for RoundArchive.save_games. Rounds are written as they come, so only
+    the string table and the round index are held in memory.
+    """
+    strings = _StringTable()
+    records = []
+    with open(path, "wb") as f:
+        f.write(bytes(HEADER.size))
+        f.write(bytes(_padding(HEADER.size)))
+        for item in games:
+            if isinstance(item, tuple):
+                external_id, game = item
+            else:
+                external_id, game = None, item
+            offset = f.tell()
+            arrays = _round_arrays(game, strings)
+            for name, typecode, count in _layout(len(game.players), len(game.holes)):
+                data = arrays[name]
+                if SWAP_BYTES:
+                    data.byteswap()
+                f.write(data.tobytes())
+                f.write(bytes(_padding(f.tell())))
+
+            settings = game.settings
+            flags = (FLAG_BUCHI if settings.buchi_enabled else 0) | (FLAG_VOOR if settings.voor_enabled else 0)
+            records.append(ROUND_RECORD.pack(
+                strings.intern(None if external_id is None else str(external_id)),
+                strings.intern(game.played_on),
+                strings.intern(settings.course),
+                strings.intern(settings.game_mode),
+                strings.intern(settings.scoring_type),
+                strings.intern(None if settings.scoring_rules is None
+                               else json.dumps(settings.scoring_rules, sort_keys=True)),
+                flags, len(game.players), len(game.holes), settings.number_of_holes, offset))
+
+        string_offset = f.tell()
+        offsets, blob = strings.encode()
+        if SWAP_BYTES:
+            offsets.byteswap()
+        f.write(offsets.tobytes())
+        f.write(blob)
+        f.write(bytes(_padding(f.tell())))
+
+        index_offset = f.tell()
+        for record in records:
+            f.write(record)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(records), len(strings.index), string_offset, index_offset))
+    return len(records)
+
+
+def _round_arrays(game, strings):
+    """One round's inputs as the arrays of its data section."""
+    players = list(game.players)
+    holes = sorted(game.holes.items())
+    matrix = game.score_matrix
+
+    arrays = {
+        "players": array("I", [strings.intern(player_name) for player_name in players]),
+        "holes": array("i", [hole_number for hole_number, hole in holes]),
+        "pars": array("i", [hole.par for hole_number, hole in holes]),
+        "values": array("q", [money.to_minor(hole.value) for hole_number, hole in holes]),
+        "scores": array("i"),
+        "buchi": array("B"),
+        "voor": array("i")
+    }
+    # Score matrix columns are in the order the players were added, which is game.players' order
+    for hole_number, hole in holes:
+        arrays["scores"].extend(matrix.row(hole_number))
+        participants = set(hole.buchi_participants)
+        winners = set(hole.buchi_winners)
+        arrays["buchi"].extend(
+            (BUCHI_PLAYED if player_name in participants else 0) | (BUCHI_WON if player_name in winners else 0)
+            for player_name in players)
+    for player_name in players:
+        adjustments = game.players[player_name].voor_adjustments
+        arrays["voor"].extend(adjustments.get(opponent, 0) for opponent in players)
+    return arrays
+
+
+class RoundView:
+    """One round of a BinaryArchive: its settings and array views into the file."""
+
+    def __init__(self, archive, record):
+        (external_id, played_on, course, game_mode, scoring_type, scoring_rules,
+         flags, players, holes, number_of_holes, offset) = record
+        self.archive = archive
+        self.external_id = archive.string(external_id)
+        self.played_on = archive.string(played_on)
+        self.course = archive.string(course)
+        self.game_mode = archive.string(game_mode)
+        self.scoring_type = archive.string(scoring_type)
+        self._scoring_rules = scoring_rules
+        self.buchi_enabled = bool(flags & FLAG_BUCHI)
+        self.voor_enabled = bool(flags & FLAG_VOOR)
+        self.player_count = players
+        self.hole_count = holes
+        self.number_of_holes = number_of_holes
+
+        for name, typecode, count in _layout(players, holes):
+            setattr(self, name, archive.view(offset, typecode, count))
+            offset += count * array(typecode).itemsize
+            offset += _padding(offset)
+
+    @property
+    def player_names(self):
+        return [self.archive.string(index) for index in self.players]
+
+    @property
+    def scoring_rules(self):
+        text = self.archive.string(self._scoring_rules)
+        return None if text is None else json.loads(text)
+
+    def to_dict(self):
+        """The round in the batch/scorecard format (see batch.py)."""
+        names = self.player_names
+        width = self.player_count
+        holes = []
+        for row, hole_number in enumerate(self.holes):
+            cells = range(row * width, (row + 1) * width)
+            holes.append({
+                "hole": hole_number,
+                "value": money.to_major(self.values[row]),
+                "par": self.pars[row],
+                "scores": {names[cell - row * width]: self.scores[cell] for cell in cells if self.scores[cell]},
+                "buchi": {
+                    "participants": [names[cell - row * width] for cell in cells if self.buchi[cell] & BUCHI_PLAYED],
+                    "winners": [names[cell - row * width] for cell in cells if self.buchi[cell] & BUCHI_WON]
+                }
+            })
+
+        voor = {}
+        for i, player_name in enumerate(names):
+            adjustments = {opponent: self.voor[i * width + j] for j, opponent in enumerate(names)
+                           if j != i and self.voor[i * width + j]}
+            if adjustments:
+                voor[player_name] = adjustments
+
+        return {
+            "id": self.external_id,
+            "date": self.played_on,
+            "settings": {
+                "number_of_holes": self.number_of_holes,
+                "game_mode": self.game_mode,
+                "scoring_type": self.scoring_type,
+                "scoring_rules": self.scoring_rules,
+                "buchi_enabled": self.buchi_enabled,
+                "voor_enabled": self.voor_enabled,
+                "course": self.course
+            },
+            "players": names,
+            "voor": voor,
+            "holes": holes
+        }
+
+    def to_game(self):
+        """Rebuild the round as a settled Game."""
+        game = Game.from_dict(self.to_dict())
+        game.calculate_all_payments()
+        return game
+
+
+class BinaryArchive:
+    """Read-only, memory-mapped access to a file written by write_archive."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._map)
+
+        magic, version, _, self.round_count, string_count, string_offset, self._index_offset = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a binary round archive")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is version {version}; this reader handles version {VERSION}")
+
+        self._string_offsets = self.view(string_offset, "I", string_count + 1)
+        self._string_data = string_offset + (string_count + 1) * 4
+        self._strings = [None] * string_count  # decoded on first use
+
+    def view(self, offset, typecode, count):
+        """count items of typecode starting at offset, as a view into the file."""
+        itemsize = array(typecode).itemsize
+        data = self._buffer[offset:offset + count * itemsize].cast(typecode)
+        if SWAP_BYTES:
+            data = array(typecode, data)
+            data.byteswap()
+        return data
+
+    def string(self, index):
+        if index < 0:
+            return None
+        text = self._strings[index]
+        if text is None:
+            start = self._string_data + self._string_offsets[index]
+            end = self._string_data + self._string_offsets[index + 1]
+            text = self._strings[index] = str(self._buffer[start:end], "utf-8")
+        return text
+
+    def __len__(self):
+        return self.round_count
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.round_count:
+            raise IndexError(position)
+        record = ROUND_RECORD.unpack_from(self._map, self._index_offset + position * ROUND_RECORD.size)
+        return RoundView(self, record)
+
+    def __iter__(self):
+        for position in range(self.round_count):
+            yield self[position]
+
+    def score_history(self, players=None):
+        """Strokes over par and buchi record per player, as RoundArchive.score_history.
+
+        Reads the score, par and buchi arrays directly; no Game is built.
+        """
+        wanted = None if players is None else set(players)
+        history = {}
+        for round_view in self:
+            width = round_view.player_count
+            pars = round_view.pars
+            scores = round_view.scores
+            buchi = round_view.buchi
+            for column, player_name in enumerate(round_view.player_names):
+                if wanted is not None and player_name not in wanted:
+                    continue
+                record = history.setdefault(
+                    player_name, {"offsets": [], "buchi_holes": 0, "buchi_played": 0, "buchi_won": 0})
+                offsets = record["offsets"]
+                for row, par in enumerate(pars):
+                    score = scores[row * width + column]
+                    if par <= 0 or score <= 0:
+                        continue
+                    offsets.append(score - par)
+                    if round_view.buchi_enabled:
+                        flags = buchi[row * width + column]
+                        record["buchi_holes"] += 1
+                        if flags & BUCHI_PLAYED:
+                            record["buchi_played"] += 1
+                            record["buchi_won"] += bool(flags & BUCHI_WON)
+        return history
+
+    def close(self):
+        """Unmap the file, or leave that to the last view still held elsewhere."""
+        if self._map is None:
+            return
+        self._strings = None
+        if isinstance(self._string_offsets, memoryview):
+            self._string_offsets.release()
+        self._string_offsets = None
+        self._buffer.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # views are still held; the mapping goes when the last of them does
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,393 @@
+"""Streaming import of scorecard CSV files.
+
+The file has one row per player per hole, with the rows of a round next to
+each other:
+
+    round,date,course,game_mode,scoring_type,hole,par,value,player,score,buchi,voor
+    R1,2024-06-01,Pondok Indah,face_to_face,par,1,4,10,Player 1,4,won,Player 2:1
+    R1,,,,,1,4,10,Player 2,5,played,
+
+round, hole, par, value, player and score are required. The round settings
+(date, course, game_mode, scoring_type, buchi_enabled, voor_enabled) are
+read from the first row of the round that has them. buchi is empty, "played"
+or "won". voor lists what the row's player receives against opponents as
+"Opponent:strokes;Opponent:strokes". buchi_enabled and voor_enabled default
+to whether the round has any buchi or voor.
+
+The import is a chain of generator stages: parse_rows -> validate_rows ->
+group_rounds -> settle_stream -> the caller. group_rounds holds one round
+and settle_stream two chunks of rounds, so memory stays flat however big
+the file is. Bad rows come down the chain as RowError items next to the
+rounds instead of stopping it. A round with a bad row is skipped, because
+settling it without that row would move the wrong money.
+
+This module must never import PyQt5 so it can run on machines without a display.
+"""
+import csv
+import functools
+import itertools
+import json
+import logging
+import multiprocessing
+import time
+
+from src.models import batch, money, scoring, settlement
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ("round", "hole", "par", "value", "player", "score")
+ROUND_COLUMNS = ("date", "course", "game_mode", "scoring_type", "buchi_enabled", "voor_enabled")
+GAME_MODES = ("single_winner", "face_to_face")
+BUCHI_VALUES = {"": None, "played": "played", "won": "won"}
+BOOLEAN_VALUES = {"1": True, "true": True, "yes": True, "y": True,
+                  "0": False, "false": False, "no": False, "n": False}
+
+CHUNK_ROUNDS = 256  # rounds handed to the worker pool at a time
+
+
+class RowError:
+    """A row that could not be imported, or a round skipped because of its rows."""
+
+    def __init__(self, line, round_id, message, round_skipped=False):
+        self.line = line  # line number in the file, counting the header as line 1
+        self.round_id = round_id
+        self.message = message
+        self.round_skipped = round_skipped
+
+    def to_dict(self):
+        return {"line": self.line, "round": self.round_id, "error": self.message}
+
+    def __repr__(self):
+        return f"RowError(line={self.line}, round={self.round_id!r}, {self.message!r})"
+
+
+class CardRow:
+    """One validated row: a player's score on a hole of a round."""
+
+    __slots__ = ("line", "round_id", "hole", "par", "value", "player", "score", "buchi", "voor", "settings")
+
+    def __init__(self, line, round_id, hole, par, value, player, score, buchi, voor, settings):
+        self.line = line
+        self.round_id = round_id
+        self.hole = hole
+        self.par = par
+        self.value = value
+        self.player = player
+        self.score = score
+        self.buchi = buchi  # None, "played" or "won"
+        self.voor = voor  # opponent: strokes the player receives
+        self.settings = settings  # the round settings given on this row
+
+
+def parse_rows(f):
+    """Yield (line number, row dictionary) for every data row of an open CSV file."""
+    reader = csv.DictReader(f)
+    columns = [name.strip() for name in reader.fieldnames or []]
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"The CSV file has no {', '.join(missing)} column")
+    reader.fieldnames = columns
+    for row in reader:
+        yield reader.line_num, row
+
+
+def validate_rows(rows):
+    """Turn parsed rows into CardRows, or RowErrors for the rows that do not make sense."""
+    for line, row in rows:
+        round_id = (row.get("round") or "").strip()
+        try:
+            yield _card_row(line, round_id, row)
+        except ValueError as e:
+            yield RowError(line, round_id or None, str(e))
+
+
+def _card_row(line, round_id, row):
+    def text(column):
+        value = row.get(column)
+        return value.strip() if value else ""
+
+    def whole_number(column):
+        value = text(column)
+        try:
+            number = int(value)
+        except ValueError:
+            raise ValueError(f"{column} must be a whole number, got {value!r}")
+        if number < 1:
+            raise ValueError(f"{column} must be at least 1, got {number}")
+        return number
+
+    if not round_id:
+        raise ValueError("round is empty")
+    player = text("player")
+    if not player:
+        raise ValueError("player is empty")
+
+    value = text("value")
+    try:
+        value = float(value)
+    except ValueError:
+        raise ValueError(f"value must be a number, got {value!r}")
+    if not 0 <= value < float("inf"):
+        raise ValueError(f"value must be at least 0, got {value:g}")
+    if value.is_integer():
+        value = int(value)
+
+    buchi = text("buchi").lower()
+    if buchi not in BUCHI_VALUES:
+        raise ValueError(f"buchi must be empty, played or won, got {buchi!r}")
+
+    voor = {}
+    for entry in filter(None, (part.strip() for part in text("voor").split(";"))):
+        opponent, _, strokes = entry.rpartition(":")
+        try:
+            strokes = int(strokes)
+        except ValueError:
+            opponent = ""
+        if not opponent.strip():
+            raise ValueError(f"voor entries must be Opponent:strokes, got {entry!r}")
+        voor[opponent.strip()] = strokes
+
+    settings = {}
+    for column in ROUND_COLUMNS:
+        setting = text(column)
+        if not setting:
+            continue
+        if column in ("buchi_enabled", "voor_enabled"):
+            if setting.lower() not in BOOLEAN_VALUES:
+                raise ValueError(f"{column} must be true or false, got {setting!r}")
+            setting = BOOLEAN_VALUES[setting.lower()]
+        elif column == "game_mode" and setting not in GAME_MODES:
+            raise ValueError(f"game_mode must be {' or '.join(GAME_MODES)}, got {setting!r}")
+        elif column == "scoring_type":
+            scoring.named_rules(setting)  # ValueError for an unknown rule set
+        settings[column] = setting
+
+    return CardRow(line, round_id, whole_number("hole"), whole_number("par"), value, player,
+                   whole_number("score"), BUCHI_VALUES[buchi], voor, settings)
+
+
+def group_rounds(items):
+    """Gather each round's consecutive rows into a round dictionary (see batch.py).
+
+    A round's bad rows come out when the round ends, followed by a
+    round_skipped RowError instead of the round. Bad rows with no round id
+    are passed on as they come.
+    """
+    current = None
+    for item in items:
+        if current is not None and item.round_id == current.round_id:
+            current.add(item)
+            continue
+        if isinstance(item, RowError) and item.round_id is None:
+            yield item
+            continue
+        if current is not None:
+            yield from current.finish()
+        current = _RoundBuilder(item)
+    if current is not None:
+        yield from current.finish()
+
+
+class _RoundBuilder:
+    def __init__(self, item):
+        self.round_id = item.round_id
+        self.first_line = item.line
+        self.settings = {}
+        self.players = {}  # player_name: None, in the order they first appear
+        self.holes = {}  # hole_number: hole dictionary
+        self.voor = {}
+        self.errors = []
+        self.add(item)
+
+    def add(self, item):
+        if isinstance(item, RowError):
+            self.errors.append(item)
+            return
+        try:
+            self._add(item)
+        except ValueError as e:
+            self.errors.append(RowError(item.line, self.round_id, str(e)))
+
+    def _add(self, row):
+        for column, setting in row.settings.items():
+            if self.settings.setdefault(column, setting) != setting:
+                raise ValueError(f"{column} is {setting!r} here but {self.settings[column]!r} earlier in the round")
+
+        hole = self.holes.get(row.hole)
+        if hole is None:
+            hole = self.holes[row.hole] = {"hole": row.hole, "value": row.value, "par": row.par, "scores": {},
+                                           "buchi": {"participants": [], "winners": []}}
+        elif (hole["par"], hole["value"]) != (row.par, row.value):
+            raise ValueError(f"hole {row.hole} has par {row.par} and value {row.value} here "
+                             f"but par {hole['par']} and value {hole['value']} earlier")
+        if row.player in hole["scores"]:
+            raise ValueError(f"{row.player} already has a score on hole {row.hole}")
+        if row.voor and self.voor.setdefault(row.player, row.voor) != row.voor:
+            raise ValueError(f"{row.player}'s voor differs from earlier in the round")
+
+        self.players.setdefault(row.player)
+        hole["scores"][row.player] = row.score
+        if row.buchi:
+            hole["buchi"]["participants"].append(row.player)
+            if row.buchi == "won":
+                hole["buchi"]["winners"].append(row.player)
+
+    def finish(self):
+        """[round dictionary], or the round's bad rows and a round_skipped RowError."""
+        if self.errors:
+            return self.errors + [RowError(self.first_line, self.round_id,
+                                           f"round skipped: {len(self.errors)} bad row(s)", True)]
+
+        unknown = sorted({opponent for adjustments in self.voor.values() for opponent in adjustments
+                          if opponent not in self.players})
+        if unknown:
+            return [RowError(self.first_line, self.round_id,
+                             f"round skipped: voor against {', '.join(unknown)}, who has no scores", True)]
+
+        # A missing score would settle as 0, the lowest score on the hole
+        missing = [f"hole {number} {player_name}" for number in sorted(self.holes)
+                   for player_name in self.players if player_name not in self.holes[number]["scores"]]
+        if missing:
+            return [RowError(self.first_line, self.round_id,
+                             f"round skipped: no score for {', '.join(missing)}", True)]
+
+        settings = dict(self.settings)
+        holes = [self.holes[number] for number in sorted(self.holes)]
+        settings.setdefault("buchi_enabled", any(hole["buchi"]["participants"] for hole in holes))
+        settings.setdefault("voor_enabled", bool(self.voor))
+        settings["number_of_holes"] = len(holes)
+        round_data = {"id": self.round_id}
+        if "date" in settings:
+            round_data["date"] = settings.pop("date")
+        round_data.update(settings=settings, players=list(self.players), voor=self.voor, holes=holes)
+        return [round_data]
+
+
+def rounds_and_errors(path):
+    """Round dictionaries and RowErrors from a scorecard CSV file, in file order."""
+    with open(path, "r", newline="") as f:
+        yield from group_rounds(validate_rows(parse_rows(f)))
+
+
+def read_csv_rounds(path, on_error=None):
+    """Yield the round dictionaries of a scorecard CSV file.
+
+    Bad rows and skipped rounds go to on_error(RowError), or are logged as
+    warnings when no callback is given.
+    """
+    for item in rounds_and_errors(path):
+        if not isinstance(item, RowError):
+            yield item
+        elif on_error is not None:
+            on_error(item)
+        else:
+            logger.warning("%s line %s: %s", path, item.line, item.message)
+
+
+def _settle_item(item, vectorized=False):
+    """Pool worker: settle a round dictionary; RowErrors are passed back as they are."""
+    if isinstance(item, RowError):
+        return item
+    return batch._settle_round_safely(item, vectorized)
+
+
+def settle_stream(items, processes=None, chunk_rounds=CHUNK_ROUNDS, vectorized=False):
+    """Settle the rounds in a stream of rounds and RowErrors, yielding results in input order.
+
+    Items go to the worker pool chunk_rounds at a time, and the next chunk
+    is read while the pool settles the current one, so at most two chunks
+    are held in memory (Pool.imap would read the whole stream up front).
+    Round results are the dictionaries batch.settle_round returns; RowErrors
+    are passed through. With processes=1 everything runs in the calling
+    process.
+    """
+    worker = functools.partial(_settle_item, vectorized=vectorized)
+    if processes == 1:
+        for item in items:
+            yield worker(item)
+        return
+
+    processes = processes or batch.default_process_count()
+    chunksize = max(1, chunk_rounds // (processes * 4))
+    items = iter(items)
+    with multiprocessing.Pool(processes=processes) as pool:
+        pending = None
+        while True:
+            chunk = list(itertools.islice(items, chunk_rounds))
+            current = pool.map_async(worker, chunk, chunksize=chunksize) if chunk else None
+            if pending is not None:
+                yield from pending.get()
+            if current is None:
+                return
+            pending = current
+
+
+class ImportReport(batch.BatchReport):
+    def __init__(self):
+        super().__init__()
+        self.bad_rows = 0
+        self.skipped_rounds = 0
+
+    def summary(self):
+        return f"{super().summary()}; {self.skipped_rounds} rounds skipped, {self.bad_rows} bad rows"
+
+
+def import_csv(input_path, output_path, errors_path=None, processes=None, chunk_rounds=CHUNK_ROUNDS,
+               vectorized=False, rounds_path=None):
+    """Settle every round of a scorecard CSV file, writing one JSON result line per round.
+
+    Bad rows and skipped rounds are written to errors_path as CSV (line,
+    round, error), or logged when it is not given. rounds_path, if given,
+    receives the parsed rounds as JSON lines, ready for archive.py import,
+    settle.py or tournament.py.
+    """
+    report = ImportReport()
+    start = time.perf_counter()
+    errors_file = open(errors_path, "w", newline="") if errors_path else None
+    rounds_file = open(rounds_path, "w") if rounds_path else None
+
+    def write_rounds(items):
+        for item in items:
+            if not isinstance(item, RowError):
+                rounds_file.write(json.dumps(item))
+                rounds_file.write("\n")
+            yield item
+
+    try:
+        errors_out = None
+        if errors_file:
+            errors_out = csv.writer(errors_file)
+            errors_out.writerow(["line", "round", "error"])
+
+        items = rounds_and_errors(input_path)
+        if rounds_file:
+            items = write_rounds(items)
+
+        with open(output_path, "w") as out:
+            for result in settle_stream(items, processes, chunk_rounds, vectorized):
+                if isinstance(result, RowError):
+                    if result.round_skipped:
+                        report.skipped_rounds += 1
+                    else:
+                        report.bad_rows += 1
+                    if errors_out is not None:
+                        errors_out.writerow([result.line, result.round_id or "", result.message])
+                    else:
+                        logger.warning("%s line %s: %s", input_path, result.line, result.message)
+                    continue
+
+                report.rounds += 1
+                if "error" in result:
+                    report.errors += 1
+                else:
+                    settlement.net_balances(money.payments_to_minor(result["final_payments"]), report.balances)
+                out.write(json.dumps(result))
+                out.write("\n")
+    finally:
+        if errors_file:
+            errors_file.close()
+        if rounds_file:
+            rounds_file.close()
+
+    report.elapsed = time.perf_counter() - start
+    return report
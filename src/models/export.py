@@ -0,0 +1,140 @@
+"""Export per-hole payments, player summaries and final payments to CSV or JSON lines.
+
+An export is a directory with three files, one record per line or row:
+
+    hole_payments     round, hole, from, to, amount
+    players           round, player, total_score, paid, received, net
+    final_payments    round, from, to, amount
+
+Amounts are in major units. Records are generated straight from a Game (or,
+for archived rounds, from the archive's tables) and written as they come,
+so exporting many games holds one game at a time, and nothing is laid out
+in widgets.
+
+This module must never import PyQt5 so it can run on machines without a display.
+"""
+import csv
+import json
+import os
+
+from src.models import money
+
+FORMATS = ("csv", "jsonl")
+FIELDS = {
+    "hole_payments": ("round", "hole", "from", "to", "amount"),
+    "players": ("round", "player", "total_score", "paid", "received", "net"),
+    "final_payments": ("round", "from", "to", "amount")
+}
+
+
+def hole_payment_records(game, round_id=None):
+    for hole_number, hole in sorted(game.holes.items()):
+        for from_player, to_players in hole.payments.items():
+            for to_player, amount in to_players.items():
+                yield {"round": round_id, "hole": hole_number, "from": from_player, "to": to_player,
+                       "amount": money.to_major(amount)}
+
+
+def player_records(game, round_id=None):
+    for player_name, totals in game.get_player_totals().items():
+        yield {"round": round_id, "player": player_name, "total_score": totals["total_score"],
+               "paid": money.to_major(totals["paid"]), "received": money.to_major(totals["received"]),
+               "net": money.to_major(totals["net"])}
+
+
+def final_payment_records(game, round_id=None):
+    for from_player, to_players in game.final_payments.items():
+        for to_player, amount in to_players.items():
+            yield {"round": round_id, "from": from_player, "to": to_player, "amount": money.to_major(amount)}
+
+
+GAME_RECORDS = {
+    "hole_payments": hole_payment_records,
+    "players": player_records,
+    "final_payments": final_payment_records
+}
+
+
+class ExportWriter:
+    """The three export files of one directory, open for writing."""
+
+    def __init__(self, directory, fmt="csv"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown export format {fmt!r}; use {' or '.join(FORMATS)}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.format = fmt
+        self.counts = dict.fromkeys(FIELDS, 0)  # records written per file
+        self._files = {}
+        self._writers = {}
+        for kind, fields in FIELDS.items():
+            f = open(self.path(kind), "w", newline="" if fmt == "csv" else None)
+            self._files[kind] = f
+            if fmt == "csv":
+                writer = csv.DictWriter(f, fields)
+                writer.writeheader()
+                self._writers[kind] = writer.writerow
+            else:
+                self._writers[kind] = lambda record, f=f: f.write(json.dumps(record) + "\n")
+
+    def path(self, kind):
+        return os.path.join(self.directory, f"{kind}.{self.format}")
+
+    def write(self, kind, records):
+        write = self._writers[kind]
+        count = 0
+        for record in records:
+            write(record)
+            count += 1
+        self.counts[kind] += count
+
+    def write_game(self, game, round_id=None):
+        """All three kinds of record for one settled game."""
+        for kind, records in GAME_RECORDS.items():
+            self.write(kind, records(game, round_id))
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def export_game(game, directory, fmt="csv", round_id=None):
+    """Export one settled game; returns the record count per file."""
+    with ExportWriter(directory, fmt) as writer:
+        writer.write_game(game, round_id)
+    return writer.counts
+
+
+def export_games(games, directory, fmt="csv"):
+    """Export settled games one after another into one set of files.
+
+    games is an iterable of Game objects or (round_id, Game) pairs and is
+    consumed lazily, so only one game needs to exist at a time.
+    """
+    with ExportWriter(directory, fmt) as writer:
+        for item in games:
+            if isinstance(item, tuple):
+                round_id, game = item
+            else:
+                round_id, game = None, item
+            writer.write_game(game, round_id)
+    return writer.counts
+
+
+def export_archive(archive, directory, fmt="csv", player=None, course=None, start=None, end=None):
+    """Export archived rounds straight from the archive's tables, without rebuilding any game.
+
+    The filters are those of RoundArchive.find_rounds. Rounds without an
+    external id are labelled with their archive id.
+    """
+    with ExportWriter(directory, fmt) as writer:
+        for kind in FIELDS:
+            writer.write(kind, archive.export_records(kind, player, course, start, end))
+    return writer.counts
@@ -1,14 +1,37 @@
+import copy
+import logging
+from datetime import date
+
+from src.models import money, scoring, settlement
+from src.models.ledger import PaymentLedger
+from src.models.score_matrix import ScoreMatrix
+from src.models.trace import CalculationTrace
+
+logger = logging.getLogger(__name__)
+
+
+def _no_payment_result(winner_score, par):
+    """Trace result for a winner whose score pays a multiplier of 0."""
+    return "above_par" if winner_score > par else "no_payment"
+
+
+def _vectorized_available():
+    # Imported on first use: loading NumPy would dominate the app's start-up time
+    from src.models import vectorized
+    return vectorized.available()
+
+
 class Player:
-    def __init__(self, name):
+    def __init__(self, name, score_matrix=None):
         self.name = name
-        self.scores = {}  # hole_number: score
+        if score_matrix is None:
+            score_matrix = ScoreMatrix()
+        score_matrix.add_player(name)
+        self.scores = score_matrix.player_view(name)  # hole_number: score
         self.voor_adjustments = {}  # player_name: adjustment
         self.buchi_participations = {}  # hole_number: boolean
         self.buchi_wins = {}  # hole_number: boolean
 
-    def add_score(self, hole_number, score):
-        self.scores[hole_number] = score
-
     def add_voor_adjustment(self, player_name, adjustment):
         self.voor_adjustments[player_name] = adjustment
 
@@ -31,22 +54,29 @@ class GameSettings:
         self.number_of_holes = 9
         self.game_mode = "single_winner"  # or "face_to_face"
         self.buchi_enabled = False
-        self.scoring_type = "par"  # or "bogey"
+        self.scoring_type = "par"  # name of a rule set in scoring.SCORING_RULES (or the rules file)
+        self.scoring_rules = None  # the game's own rule set; None plays by the named one
         self.voor_enabled = False
+        self.course = ""
 
 
 class HoleData:
-    def __init__(self, hole_number, value=0, par=0):
+    def __init__(self, hole_number, value=0, par=0, score_matrix=None):
         self.hole_number = hole_number
         self.value = value
         self.par = par
-        self.player_scores = {}  # player_name: score
+        if score_matrix is None:
+            score_matrix = ScoreMatrix()
+        score_matrix.add_hole(hole_number)
+        self.score_matrix = score_matrix
         self.buchi_participants = []
         self.buchi_winners = []
-        self.payments = {}  # from_player: {to_player: amount}
+        self.payments = {}  # from_player: {to_player: amount in minor units}
 
-    def add_player_score(self, player_name, score):
-        self.player_scores[player_name] = score
+    @property
+    def player_scores(self):
+        """player_name: score, read from the game's score matrix (set scores with Game.set_player_score)."""
+        return self.score_matrix.hole_view(self.hole_number)
 
     def add_buchi_participant(self, player_name):
         if player_name not in self.buchi_participants:
@@ -56,6 +86,15 @@ class HoleData:
         if player_name not in self.buchi_winners:
             self.buchi_winners.append(player_name)
 
+    def remove_buchi_participant(self, player_name):
+        if player_name in self.buchi_participants:
+            self.buchi_participants.remove(player_name)
+        self.remove_buchi_winner(player_name)
+
+    def remove_buchi_winner(self, player_name):
+        if player_name in self.buchi_winners:
+            self.buchi_winners.remove(player_name)
+
     def record_payment(self, from_player, to_player, amount):
         if from_player not in self.payments:
             self.payments[from_player] = {}
@@ -67,72 +106,263 @@ class HoleData:
             self.payments[from_player][to_player] = amount
 
 
+class HoleCorrection:
+    """What a correction did to one hole's payments (see Game.correct_hole)."""
+
+    def __init__(self, hole_number, previous, current):
+        self.hole_number = hole_number
+        self.old_payments = previous.payments if previous is not None else {}
+        self.new_payments = current.payments if current is not None else {}
+        # player_name: change in net balance, in minor units
+        self.balance_changes = {}
+        for entry, sign in ((previous, -1), (current, 1)):
+            if entry is None:
+                continue
+            for player_name, amount in entry.received.items():
+                self.balance_changes[player_name] = self.balance_changes.get(player_name, 0) + sign * amount
+            for player_name, amount in entry.paid.items():
+                self.balance_changes[player_name] = self.balance_changes.get(player_name, 0) - sign * amount
+
+    @property
+    def changed(self):
+        """True if the hole's payments are different now."""
+        return self.old_payments != self.new_payments
+
+    @property
+    def affected_players(self):
+        """Players whose net balance moved."""
+        return [player_name for player_name, change in self.balance_changes.items() if change]
+
+
 class Game:
     def __init__(self, settings):
         self.settings = settings
         self.players = {}  # player_name: Player object
         self.holes = {}  # hole_number: HoleData
-        self.current_hole = 1
-        self.final_payments = {}  # from_player: {to_player: amount}
+        self.score_matrix = ScoreMatrix()  # the only copy of every score
+        self.journal = None  # GameJournal recording every mutation, if attached
+        self._current_hole = 1
+        self.played_on = date.today().isoformat()
+        self.final_payments = {}  # from_player: {to_player: amount in minor units}
+        self.settlement = None  # SettlementResult for final_payments
+        self.ledger = PaymentLedger()  # running balances of every settled hole
+        self._voor_version = 0  # bumped whenever voor changes, part of each hole's cache key
+        self.trace = None  # CalculationTrace while tracing is enabled
+        self._scoring_table = None  # compiled from the scoring settings on first use
+        self._scoring_key = None  # (scoring_type, scoring_rules) the table was compiled from
+        
+        # Caches for voor-adjusted queries, invalidated by the setters below
+        self._effective_voor = {}  # player_name: most voor received from any opponent
+        self._adjusted_scores = {}  # player_name: {hole_number: adjusted score}
+        self._adjusted_totals = {}  # player_name: adjusted total score
+        self.use_vectorized_kernel = False  # NumPy face-to-face kernel, if available (not used while tracing)
+
+    @property
+    def current_hole(self):
+        return self._current_hole
+
+    @current_hole.setter
+    def current_hole(self, hole_number):
+        self._current_hole = hole_number
+        if self.journal is not None:
+            self.journal.record("current_hole", (hole_number,))
 
     def add_player(self, player_name):
-        self.players[player_name] = Player(player_name)
+        self.players[player_name] = Player(player_name, self.score_matrix)
+        # A new opponent can change everyone's effective voor
+        self._invalidate_adjusted_scores()
+        if self.journal is not None:
+            self.journal.record("add_player", (player_name,))
 
     def add_hole(self, hole_number, value, par):
-        self.holes[hole_number] = HoleData(hole_number, value, par)
+        self.holes[hole_number] = HoleData(hole_number, value, par, self.score_matrix)
+        self.ledger.remove_hole(hole_number)
+        # Re-adding a hole clears its scores
+        for player_name in self.players:
+            self._invalidate_adjusted_scores(player_name, hole_number)
+        if self.journal is not None:
+            self.journal.record("add_hole", (hole_number, value, par))
+
+    def set_hole_details(self, hole_number, value, par):
+        if hole_number in self.holes:
+            hole = self.holes[hole_number]
+            hole.value = value
+            hole.par = par
+            if self.journal is not None:
+                self.journal.record("set_hole_details", (hole_number, value, par))
 
     def set_player_score(self, hole_number, player_name, score):
         if hole_number in self.holes and player_name in self.players:
-            self.holes[hole_number].add_player_score(player_name, score)
-            self.players[player_name].add_score(hole_number, score)
+            # Player.scores and HoleData.player_scores share this one cell
+            self.score_matrix.set(hole_number, player_name, score)
+            self._invalidate_adjusted_scores(player_name, hole_number)
+            if self.journal is not None:
+                self.journal.record("set_player_score", (hole_number, player_name, score))
 
     def set_voor_adjustment(self, player_name, opponent_name, adjustment):
         if player_name in self.players and opponent_name in self.players:
             self.players[player_name].add_voor_adjustment(opponent_name, adjustment)
+            self._voor_version += 1
+            self._invalidate_adjusted_scores(player_name)
+            if self.journal is not None:
+                self.journal.record("set_voor_adjustment", (player_name, opponent_name, adjustment))
 
     def set_buchi_participation(self, hole_number, player_name, participated):
         if hole_number in self.holes and player_name in self.players:
             self.players[player_name].set_buchi_participation(hole_number, participated)
             if participated:
                 self.holes[hole_number].add_buchi_participant(player_name)
+            else:
+                self.holes[hole_number].remove_buchi_participant(player_name)
+                self.players[player_name].set_buchi_win(hole_number, False)
+            if self.journal is not None:
+                self.journal.record("set_buchi_participation", (hole_number, player_name, participated))
 
     def set_buchi_win(self, hole_number, player_name, won):
         if hole_number in self.holes and player_name in self.players:
             self.players[player_name].set_buchi_win(hole_number, won)
             if won:
                 self.holes[hole_number].add_buchi_winner(player_name)
+            else:
+                self.holes[hole_number].remove_buchi_winner(player_name)
+            if self.journal is not None:
+                self.journal.record("set_buchi_win", (hole_number, player_name, won))
+
+    def enable_trace(self):
+        """Start recording calculation details for every hole settled from now on."""
+        if self.trace is None:
+            self.trace = CalculationTrace()
+        return self.trace
+
+    def disable_trace(self):
+        self.trace = None
+
+    @property
+    def scoring_table(self):
+        """The compiled multiplier table for the current scoring settings."""
+        key = (self.settings.scoring_type, self.settings.scoring_rules)
+        if self._scoring_table is None or key != self._scoring_key:
+            self._scoring_table = scoring.compile_rules(scoring.rules_for(self.settings))
+            self._scoring_key = copy.deepcopy(key)
+        return self._scoring_table
 
     def calculate_payments_for_hole(self, hole_number):
-        """Calculate payments for a specific hole based on game rules."""
+        """Calculate payments for a specific hole based on game rules.
+
+        The hole's payments are recalculated from scratch and replace its
+        previous entry in the ledger. If nothing the payments depend on has
+        changed since the last call, the cached result is kept as is.
+        """
         if hole_number not in self.holes:
             return
             
         hole = self.holes[hole_number]
+        key = self._hole_key(hole)
+        if self.ledger.is_current(hole_number, key):
+            return
+        
+        hole.payments = {}
+        if self.trace is not None:
+            self.trace.discard_hole(hole_number)
         
         # First calculate main game payments
         if self.settings.game_mode == "single_winner":
             self._calculate_single_winner_payments(hole)
+        elif self.use_vectorized_kernel and self.trace is None and _vectorized_available():
+            from src.models import vectorized
+            vectorized.face_to_face_payments(self, hole)
         else:  # face_to_face
             self._calculate_face_to_face_payments(hole)
             
         # Then calculate buchi payments if enabled
         if self.settings.buchi_enabled and hole.buchi_participants:
             self._calculate_buchi_payments(hole)
+        
+        self.ledger.record_hole(hole_number, key, hole.payments)
+
+    def correct_hole(self, hole_number, value=None, par=None, scores=None, buchi_participants=None,
+                     buchi_winners=None):
+        """Fix the inputs of a hole that may already be settled, and re-settle only that hole.
+
+        Only the given inputs change: scores is {player_name: score} for the
+        players being corrected, and buchi_participants / buchi_winners
+        replace the hole's lists. The hole's payments are recalculated and
+        swapped into the ledger, which moves the running totals by the
+        difference, and final payments are settled again from the new
+        balances if they had been worked out already. No other hole is
+        touched, so a correction costs one hole's players x players
+        comparisons whatever the length of the round.
+        Every change goes through the journaled setters, and the whole
+        correction is checked first, so a ValueError leaves the hole as it was.
+        Returns a HoleCorrection.
+        """
+        if hole_number not in self.holes:
+            raise ValueError(f"Hole {hole_number} has not been played")
+        hole = self.holes[hole_number]
+        for player_name in list(scores or ()) + list(buchi_participants or ()) + list(buchi_winners or ()):
+            if player_name not in self.players:
+                raise ValueError(f"Unknown player {player_name!r}")
+        for player_name, score in (scores or {}).items():
+            if not isinstance(score, int) or isinstance(score, bool) or score < 1:
+                raise ValueError(f"{player_name}'s score must be a whole number of strokes, got {score!r}")
+        if buchi_winners is not None:
+            participants = hole.buchi_participants if buchi_participants is None else buchi_participants
+            if any(player_name not in participants for player_name in buchi_winners):
+                raise ValueError("Every buchi winner must be a participant")
+
+        previous = self.ledger.entries.get(hole_number)
+
+        if value is not None or par is not None:
+            self.set_hole_details(hole_number,
+                                  hole.value if value is None else value,
+                                  hole.par if par is None else par)
+        for player_name, score in (scores or {}).items():
+            self.set_player_score(hole_number, player_name, score)
+        if buchi_participants is not None:
+            for player_name in self.players:
+                self.set_buchi_participation(hole_number, player_name, player_name in buchi_participants)
+        if buchi_winners is not None:
+            for player_name in self.players:
+                self.set_buchi_win(hole_number, player_name, player_name in buchi_winners)
+
+        self.calculate_payments_for_hole(hole_number)
+        if self.settlement is not None:
+            self._optimize_payments()
+        return HoleCorrection(hole_number, previous, self.ledger.entries.get(hole_number))
+
+    def correct_score(self, hole_number, player_name, score):
+        """correct_hole for a single mistyped score."""
+        return self.correct_hole(hole_number, scores={player_name: score})
+
+    def record_hole_payments(self, hole_number, payments):
+        """Store payments calculated elsewhere (e.g. in a worker process) for the hole as it is now."""
+        hole = self.holes[hole_number]
+        hole.payments = payments
+        self.ledger.record_hole(hole_number, self._hole_key(hole), payments)
+
+    def _hole_key(self, hole):
+        """Everything a hole's payments depend on, used to skip unchanged holes."""
+        return (
+            hole.value,
+            hole.par,
+            tuple(self.players),
+            hole.score_matrix.row(hole.hole_number).tobytes(),
+            tuple(hole.buchi_participants),
+            tuple(hole.buchi_winners),
+            self._voor_version,
+            self.settings.game_mode,
+            self.scoring_table.signature,
+            self.settings.buchi_enabled
+        )
 
     def _calculate_single_winner_payments(self, hole):
         """Calculate payments for Single Winner mode."""
         scores = {}
         
-        # Get adjusted scores considering voor
+        # Get adjusted scores considering voor (best adjustment against any opponent)
+        hole_scores = hole.player_scores
         for player_name in self.players:
-            min_score = float('inf')
-            for opponent_name in self.players:
-                if player_name != opponent_name:
-                    adjusted_score = self.players[player_name].get_adjusted_score(
-                        hole.hole_number, opponent_name)
-                    min_score = min(min_score, adjusted_score)
-            
-            scores[player_name] = min_score if min_score != float('inf') else hole.player_scores.get(player_name, 0)
+            scores[player_name] = hole_scores.get(player_name, 0) - self.get_effective_voor(player_name)
         
         # Find the minimum score
         min_score = min(scores.values()) if scores else 0
@@ -140,44 +370,48 @@ class Game:
         
         # If there's more than one winner, no payments
         if len(winners) > 1:
+            if self.trace is not None:
+                self.trace.record(hole.hole_number, "single_winner", result="tie",
+                                  winners=winners, adjusted_scores=scores)
             return
             
         winner = winners[0]
         winner_score = min_score
         
-        # Calculate payment multiplier based on score relative to par
-        multiplier = 1
-        print(f"Winner score: {winner_score}, Par: {hole.par}")  # Debug log
-        if winner_score == 1:  # Hole in one
-            multiplier = 8
-            print("Hole in one - 8x multiplier")  # Debug log
-        elif winner_score == hole.par - 2:  # 2 below par
-            multiplier = 4
-            print("2 below par - 4x multiplier")  # Debug log
-        elif winner_score == hole.par - 1:  # 1 below par
-            multiplier = 2
-            print("1 below par - 2x multiplier")  # Debug log
-        elif winner_score == hole.par:  # At par
-            multiplier = 1
-            print("At par - 1x multiplier")  # Debug log
-        elif winner_score > hole.par:
-            if self.settings.scoring_type == "par":
-                # Above par in par mode - no payments
-                print("Above par in par mode - no payment")  # Debug log
-                return
-            else:  # bogey mode
-                multiplier = 0.5
-                print("Above par in bogey mode - 0.5x multiplier")  # Debug log
+        # Payment multiplier from the scoring rules; 0 means the winner collects nothing
+        multiplier = self.scoring_table.multiplier(winner_score, hole.par)
+        if not multiplier:
+            if self.trace is not None:
+                self.trace.record(hole.hole_number, "single_winner", result=_no_payment_result(winner_score, hole.par),
+                                  winner=winner, winner_score=winner_score, par=hole.par,
+                                  adjusted_scores=scores)
+            return
+        
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Hole %s: %s wins with %s (par %s), %sx multiplier",
+                         hole.hole_number, winner, winner_score, hole.par, multiplier)
             
         # Record payments
         for player_name, score in scores.items():
             if player_name != winner and score > winner_score:
-                payment = hole.value * multiplier
-                print(f"Payment from {player_name} to {winner}: {payment} (value: {hole.value}, multiplier: {multiplier})")  # Debug log
+                payment = money.payment(hole.value, multiplier)
+                if debug:
+                    logger.debug("Payment from %s to %s: %s (value: %s, multiplier: %s)",
+                                 player_name, winner, payment, hole.value, multiplier)
+                if self.trace is not None:
+                    self.trace.record(hole.hole_number, "single_winner", result="paid",
+                                      winner=winner, loser=player_name,
+                                      winner_score=winner_score, loser_score=score, par=hole.par,
+                                      multiplier=multiplier, payment=payment)
                 hole.record_payment(player_name, winner, payment)
 
     def _calculate_face_to_face_payments(self, hole):
         """Calculate payments for Face to Face mode."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        trace = self.trace
+        scoring_table = self.scoring_table
+        
         # Get all players and their scores
         players = list(self.players.keys())
         scores = {player: hole.player_scores.get(player, 0) for player in players}
@@ -200,42 +434,40 @@ class Game:
                 
                 # Skip if scores are equal after adjustment
                 if adjusted_player1_score == adjusted_player2_score:
+                    if trace is not None:
+                        trace.record(hole.hole_number, "face_to_face", result="tie",
+                                     players=[player1, player2],
+                                     adjusted_scores=[adjusted_player1_score, adjusted_player2_score])
                     continue
                 
                 # Determine winner and loser
                 if adjusted_player1_score < adjusted_player2_score:
                     winner, loser = player1, player2
                     winner_score = player1_score
+                    adjusted_scores = (adjusted_player1_score, adjusted_player2_score)
                 else:
                     winner, loser = player2, player1
                     winner_score = player2_score
+                    adjusted_scores = (adjusted_player2_score, adjusted_player1_score)
                 
-                # Calculate payment amount
-                multiplier = 1
-                print(f"Winner score: {winner_score}, Par: {hole.par}")  # Debug log
-                if winner_score == 1:  # Hole in one
-                    multiplier = 8
-                    print("Hole in one - 8x multiplier")  # Debug log
-                elif winner_score == hole.par - 2:  # 2 below par
-                    multiplier = 4
-                    print("2 below par - 4x multiplier")  # Debug log
-                elif winner_score == hole.par - 1:  # 1 below par
-                    multiplier = 2
-                    print("1 below par - 2x multiplier")  # Debug log
-                elif winner_score == hole.par:  # At par
-                    multiplier = 1
-                    print("At par - 1x multiplier")  # Debug log
-                elif winner_score > hole.par:
-                    if self.settings.scoring_type == "par":
-                        # Above par in par mode - no payments
-                        print("Above par in par mode - no payment")  # Debug log
-                        continue
-                    else:  # bogey mode
-                        multiplier = 0.5
-                        print("Above par in bogey mode - 0.5x multiplier")  # Debug log
+                # Payment multiplier from the scoring rules; 0 means the winner collects nothing
+                multiplier = scoring_table.multiplier(winner_score, hole.par)
+                if not multiplier:
+                    if trace is not None:
+                        trace.record(hole.hole_number, "face_to_face", result=_no_payment_result(winner_score, hole.par),
+                                     winner=winner, loser=loser, winner_score=winner_score,
+                                     par=hole.par, adjusted_scores=list(adjusted_scores))
+                    continue
                 
-                payment = hole.value * multiplier
-                print(f"Payment from {loser} to {winner}: {payment} (value: {hole.value}, multiplier: {multiplier})")  # Debug log
+                payment = money.payment(hole.value, multiplier)
+                if debug:
+                    logger.debug("Hole %s: payment from %s to %s: %s (winner score: %s, par: %s, multiplier: %s)",
+                                 hole.hole_number, loser, winner, payment, winner_score, hole.par, multiplier)
+                if trace is not None:
+                    trace.record(hole.hole_number, "face_to_face", result="paid",
+                                 winner=winner, loser=loser, winner_score=winner_score, par=hole.par,
+                                 adjusted_scores=list(adjusted_scores),
+                                 multiplier=multiplier, payment=payment)
                 
                 # Clear any existing payment between these players before recording new one
                 if loser in hole.payments and winner in hole.payments[loser]:
@@ -252,66 +484,66 @@ class Game:
         # Calculate payments from losers to winners
         losers = [p for p in hole.buchi_participants if p not in hole.buchi_winners]
         
+        # Pay only the hole value for buchi winners
+        payment = money.payment(hole.value)
         for loser in losers:
             for winner in hole.buchi_winners:
-                # Pay only the hole value for buchi winners
-                hole.record_payment(loser, winner, hole.value)
+                if self.trace is not None:
+                    self.trace.record(hole.hole_number, "buchi", result="paid",
+                                      winner=winner, loser=loser, payment=payment)
+                hole.record_payment(loser, winner, payment)
 
     def calculate_all_payments(self):
-        """Calculate payments for all holes and optimize final payments."""
-        # Calculate payments for each hole
+        """Settle any holes not yet in the ledger and optimize final payments."""
+        # Holes already settled with the same inputs are skipped
         for hole_number in self.holes:
             self.calculate_payments_for_hole(hole_number)
-            
-        # Initialize final payments
-        for player in self.players:
-            self.final_payments[player] = {}
-        
-        # Sum up all payments across holes
-        for hole_number, hole in self.holes.items():
-            for payer, recipients in hole.payments.items():
-                for recipient, amount in recipients.items():
-                    if recipient not in self.final_payments[payer]:
-                        self.final_payments[payer][recipient] = 0
-                    self.final_payments[payer][recipient] += amount
         
         # Optimize payments
         self._optimize_payments()
 
     def _optimize_payments(self):
-        """Optimize payments to minimize transactions."""
-        # Create a copy of current payments
-        optimized_payments = {}
-        for payer in self.final_payments:
-            optimized_payments[payer] = self.final_payments[payer].copy()
-        
-        # Find reciprocal payments and cancel them out
-        for payer, recipients in list(optimized_payments.items()):
-            for recipient, amount in list(recipients.items()):
-                # Check if recipient also pays the payer
-                if recipient in optimized_payments and payer in optimized_payments[recipient]:
-                    reciprocal_amount = optimized_payments[recipient][payer]
-                    
-                    # If amounts are equal, cancel both
-                    if amount == reciprocal_amount:
-                        del optimized_payments[payer][recipient]
-                        del optimized_payments[recipient][payer]
-                    # If payer pays more
-                    elif amount > reciprocal_amount:
-                        optimized_payments[payer][recipient] -= reciprocal_amount
-                        del optimized_payments[recipient][payer]
-                    # If recipient pays more
-                    else:
-                        optimized_payments[recipient][payer] -= amount
-                        del optimized_payments[payer][recipient]
-        
-        # Update final payments
-        self.final_payments = optimized_payments
-        
-        # Remove empty payment entries
-        for payer in list(self.final_payments.keys()):
-            if not self.final_payments[payer]:
-                del self.final_payments[payer]
+        """Optimize payments to minimize transactions.
+
+        Settlement works on each player's net balance from the ledger, so the
+        transfers can differ from the per-hole payments but every player ends
+        up paying or receiving the same total.
+        """
+        self.settlement = settlement.settle_balances(self.ledger.balances)
+        self.final_payments = self.settlement.payments
+
+    def get_player_totals(self):
+        """Total score, paid, received and net (in minor units) for every player.
+
+        Payment totals come from the ledger, which keeps them current as
+        holes are settled, so this never scans the holes' payments.
+        Returns {player: {"total_score": s, "paid": x, "received": y, "net": y - x}}.
+        """
+        totals = {}
+        for player_name in self.players:
+            paid, received, net = self.ledger.player_totals(player_name)
+            totals[player_name] = {
+                "total_score": self.score_matrix.total(player_name),
+                "paid": paid,
+                "received": received,
+                "net": net
+            }
+        return totals
+
+    def get_pairwise_net(self):
+        """Net settled between every pair of players.
+
+        Returns {player: {opponent: amount}} in minor units, where a positive amount is what
+        the opponent has paid the player on balance; every pair is included.
+        """
+        pairwise = self.ledger.pairwise
+        return {
+            player_name: {
+                opponent: pairwise.get(player_name, {}).get(opponent, 0)
+                for opponent in self.players if opponent != player_name
+            }
+            for player_name in self.players
+        }
 
     def get_hole_par(self, hole_number):
         """Get the par for a specific hole"""
@@ -322,56 +554,155 @@ class Game:
     def get_player_score(self, hole_number, player_name):
         """Get a player's score for a specific hole"""
         if hole_number in self.holes and player_name in self.players:
-            return self.holes[hole_number].player_scores.get(player_name)
+            return self.score_matrix.get(hole_number, player_name)
         return None
 
     def get_total_score(self, player_name):
         """Get a player's total score across all holes"""
         if player_name not in self.players:
             return None
-            
-        total = 0
-        for hole_number in range(1, self.settings.number_of_holes + 1):
-            score = self.get_player_score(hole_number, player_name)
-            if score is not None:
-                total += score
-        return total
+        return self.score_matrix.total(player_name)
 
     def get_adjusted_total_score(self, player_name):
         """Get a player's total score adjusted by voor across all holes"""
         if player_name not in self.players or not self.settings.voor_enabled:
             return self.get_total_score(player_name)
-            
-        total = 0
-        for hole_number in range(1, self.settings.number_of_holes + 1):
-            score = self.get_player_score(hole_number, player_name)
-            if score is not None:
-                # Find minimum adjusted score against all opponents
-                min_adjusted = float('inf')
-                for opponent in self.players:
-                    if opponent != player_name:
-                        adjusted = self.players[player_name].get_adjusted_score(hole_number, opponent)
-                        min_adjusted = min(min_adjusted, adjusted)
-                if min_adjusted != float('inf'):
-                    total += min_adjusted
-                else:
-                    total += score
+        
+        total = self._adjusted_totals.get(player_name)
+        if total is None:
+            # Every scored hole is adjusted by the same effective voor
+            scored_holes = self.score_matrix.scored_hole_count(player_name)
+            total = self.score_matrix.total(player_name) - self.get_effective_voor(player_name) * scored_holes
+            self._adjusted_totals[player_name] = total
         return total
 
     def get_adjusted_score(self, player_name, hole_number):
         """Get a player's score adjusted by voor for a specific hole"""
         if not self.settings.voor_enabled or player_name not in self.players:
             return self.get_player_score(hole_number, player_name)
+        
+        player_cache = self._adjusted_scores.setdefault(player_name, {})
+        if hole_number in player_cache:
+            return player_cache[hole_number]
             
         score = self.get_player_score(hole_number, player_name)
-        if score is None:
-            return None
-            
-        # Find minimum adjusted score against all opponents
-        min_adjusted = float('inf')
-        for opponent in self.players:
-            if opponent != player_name:
-                adjusted = self.players[player_name].get_adjusted_score(hole_number, opponent)
-                min_adjusted = min(min_adjusted, adjusted)
-                
-        return min_adjusted if min_adjusted != float('inf') else score
\ No newline at end of file
+        adjusted = None if score is None else score - self.get_effective_voor(player_name)
+        player_cache[hole_number] = adjusted
+        return adjusted
+
+    def get_effective_voor(self, player_name):
+        """The most voor a player receives from any opponent.
+
+        A player's lowest adjusted score against all opponents is their score
+        minus this value, so it is all the adjusted-score queries need.
+        """
+        voor = self._effective_voor.get(player_name)
+        if voor is None:
+            adjustments = self.players[player_name].voor_adjustments
+            voor = max((adjustments.get(opponent, 0) for opponent in self.players if opponent != player_name),
+                       default=0)
+            self._effective_voor[player_name] = voor
+        return voor
+
+    def _invalidate_adjusted_scores(self, player_name=None, hole_number=None):
+        """Drop cached voor-adjusted values touched by a change.
+
+        With no arguments everything is dropped; with only a player all of
+        their cached values go; with both only that cell and their total go.
+        """
+        if player_name is None:
+            self._effective_voor = {}
+            self._adjusted_scores = {}
+            self._adjusted_totals = {}
+            return
+        
+        self._adjusted_totals.pop(player_name, None)
+        if hole_number is None:
+            self._effective_voor.pop(player_name, None)
+            self._adjusted_scores.pop(player_name, None)
+        elif player_name in self._adjusted_scores:
+            self._adjusted_scores[player_name].pop(hole_number, None)
+
+    def to_dict(self, hole_numbers=None):
+        """Serialize the game's settings and inputs to a plain dictionary.
+
+        hole_numbers limits the holes included (default: every hole).
+        """
+        holes = []
+        for hole_number, hole in sorted(self.holes.items()):
+            if hole_numbers is not None and hole_number not in hole_numbers:
+                continue
+            holes.append({
+                "hole": hole_number,
+                "value": hole.value,
+                "par": hole.par,
+                "scores": hole.player_scores.as_dict(),
+                "buchi": {
+                    "participants": list(hole.buchi_participants),
+                    "winners": list(hole.buchi_winners)
+                }
+            })
+
+        voor = {}
+        for player_name, player in self.players.items():
+            if player.voor_adjustments:
+                voor[player_name] = dict(player.voor_adjustments)
+
+        return {
+            "settings": {
+                "number_of_players": self.settings.number_of_players,
+                "number_of_holes": self.settings.number_of_holes,
+                "game_mode": self.settings.game_mode,
+                "scoring_type": self.settings.scoring_type,
+                "scoring_rules": self.settings.scoring_rules,
+                "buchi_enabled": self.settings.buchi_enabled,
+                "voor_enabled": self.settings.voor_enabled,
+                "course": self.settings.course
+            },
+            "date": self.played_on,
+            "players": list(self.players),
+            "voor": voor,
+            "holes": holes,
+            "current_hole": self.current_hole
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a game from a dictionary produced by to_dict (or a scorecard file)."""
+        settings = GameSettings()
+        for key, value in data.get("settings", {}).items():
+            if hasattr(settings, key):
+                setattr(settings, key, value)
+
+        players = data.get("players", [])
+        # A game saved before its players were added still has its chosen player count
+        if "number_of_players" not in data.get("settings", {}):
+            settings.number_of_players = len(players)
+        holes = data.get("holes", [])
+        if "number_of_holes" not in data.get("settings", {}):
+            settings.number_of_holes = len(holes)
+
+        game = cls(settings)
+        for player_name in players:
+            game.add_player(player_name)
+
+        for player_name, adjustments in data.get("voor", {}).items():
+            for opponent_name, adjustment in adjustments.items():
+                game.set_voor_adjustment(player_name, opponent_name, adjustment)
+
+        for hole_data in holes:
+            hole_number = hole_data["hole"]
+            game.add_hole(hole_number, hole_data.get("value", 0), hole_data.get("par", 0))
+            for player_name, score in hole_data.get("scores", {}).items():
+                game.set_player_score(hole_number, player_name, score)
+
+            buchi = hole_data.get("buchi", {})
+            for player_name in buchi.get("participants", []):
+                game.set_buchi_participation(hole_number, player_name, True)
+            for player_name in buchi.get("winners", []):
+                game.set_buchi_win(hole_number, player_name, True)
+
+        game.current_hole = data.get("current_hole", len(holes) + 1)
+        if data.get("date"):
+            game.played_on = data["date"]
+        return game
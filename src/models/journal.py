@@ -0,0 +1,195 @@
+"""Append-only journal of game mutations for crash recovery.
+
+Every mutating Game call is appended to the journal as one compact JSON
+line, `[seq, operation, *arguments]`, where operation is the Game method
+name (or "current_hole" for the property). Lines are flushed to the OS
+straight away, so an application crash loses nothing; fsync is batched
+(every `sync_every` records or `sync_interval` seconds, and whenever sync()
+is called) so score entry never waits on the disk.
+
+Every `snapshot_every` records the whole game is written to a snapshot
+file (Game.to_dict plus the last sequence number) and the journal is
+truncated, so recovery loads the snapshot and replays only the tail.
+A torn last line from a crash mid-write is ignored.
+"""
+import json
+import logging
+import os
+import time
+
+from src.models.game import Game
+
+logger = logging.getLogger(__name__)
+
+# Game methods that are journaled, besides the current_hole property
+JOURNALED_METHODS = {
+    "add_player",
+    "add_hole",
+    "set_hole_details",
+    "set_player_score",
+    "set_voor_adjustment",
+    "set_buchi_participation",
+    "set_buchi_win"
+}
+
+
+def default_journal_path():
+    """Where the GUI journals the game in progress: ~/.golf_bet_tracker/current_game.jsonl"""
+    return os.path.join(os.path.expanduser("~"), ".golf_bet_tracker", "current_game.jsonl")
+
+
+def apply_record(game, operation, arguments):
+    """Repeat one journaled mutation on game."""
+    if operation == "current_hole":
+        game.current_hole = arguments[0]
+    elif operation in JOURNALED_METHODS:
+        getattr(game, operation)(*arguments)
+    else:
+        raise ValueError(f"Unknown journal operation: {operation}")
+
+
+class GameJournal:
+    def __init__(self, path, sync_every=32, sync_interval=1.0, snapshot_every=100):
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        self.game = None
+        self.seq = 0  # sequence number of the last record written
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._since_snapshot = 0
+
+    def start(self, game):
+        """Begin journaling a new game, replacing any previous journal."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.game = game
+        self.seq = 0
+        self.snapshot()
+        game.journal = self
+        return self
+
+    @classmethod
+    def recover(cls, path, **options):
+        """Rebuild the journaled game and keep journaling it; None if there is nothing to recover."""
+        journal = cls(path, **options)
+        if not os.path.exists(journal.snapshot_path):
+            return None
+        with open(journal.snapshot_path, "r") as f:
+            snapshot = json.load(f)
+
+        game = Game.from_dict(snapshot["game"])
+        journal.seq = snapshot["seq"]
+        replayed = 0
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                for line in f:
+                    try:
+                        seq, operation, *arguments = json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash mid-write
+                        logger.warning("Ignoring unreadable journal line after record %d", journal.seq)
+                        break
+                    if seq <= journal.seq:
+                        continue  # already in the snapshot
+                    apply_record(game, operation, arguments)
+                    journal.seq = seq
+                    replayed += 1
+
+        logger.info("Recovered game from %s (%d records replayed)", path, replayed)
+        journal.game = game
+        # Start from a fresh snapshot so a torn line is never appended to
+        journal.snapshot()
+        game.journal = journal
+        return journal
+
+    def record(self, operation, arguments):
+        """Append one mutation; called by Game."""
+        if self._file is None:
+            return
+        self.seq += 1
+        try:
+            self._file.write(json.dumps([self.seq, operation, *arguments], separators=(",", ":")) + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            self._since_snapshot += 1
+            if self._since_snapshot >= self.snapshot_every:
+                self.snapshot()
+            elif (self._unsynced >= self.sync_every
+                  or time.monotonic() - self._last_sync >= self.sync_interval):
+                self.sync()
+        except OSError:
+            self._fail()
+
+    def sync(self):
+        """Make every record written so far durable."""
+        if self._file is None or not self._unsynced:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError:
+            self._fail()
+            return
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def snapshot(self):
+        """Write the whole game to the snapshot file and start an empty journal."""
+        temporary_path = self.snapshot_path + ".tmp"
+        try:
+            with open(temporary_path, "w") as f:
+                json.dump({"seq": self.seq, "game": self.game.to_dict()}, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary_path, self.snapshot_path)
+
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.path, "w")
+        except OSError:
+            self._fail()
+            return
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._since_snapshot = 0
+
+    def close(self):
+        """Sync and stop journaling; the files stay for recovery."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.game is not None and self.game.journal is self:
+            self.game.journal = None
+
+    def discard(self):
+        """Stop journaling and delete the files, e.g. once the round is finished."""
+        self.close()
+        for path in (self.path, self.snapshot_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _fail(self):
+        # A failing journal must never stop the game itself
+        logger.exception("Game journal %s failed; continuing without it", self.path)
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+        if self.game is not None and self.game.journal is self:
+            self.game.journal = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
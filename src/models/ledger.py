@@ -0,0 +1,108 @@
+class LedgerEntry:
+    def __init__(self, key, payments, paid, received):
+        self.key = key  # the hole inputs these payments were calculated from
+        self.payments = payments  # from_player: {to_player: amount}
+        self.paid = paid  # player_name: amount paid on this hole
+        self.received = received  # player_name: amount received on this hole
+
+
+class PaymentLedger:
+    """Running totals built up one settled hole at a time.
+
+    Each hole's contribution is stored with the inputs it was calculated
+    from. Re-settling a hole replaces its old contribution instead of adding
+    to it, so settling the same hole twice never double-counts.
+
+    Besides each player's net balance the ledger keeps what each player has
+    paid and received in total. The net between every pair of players costs
+    a pass over every payment, and only summaries read it, so holes settled
+    since the last read are folded into it when pairwise is next read.
+    Recorded payments dicts are replaced, never changed in place, when a
+    hole is settled again. Amounts are whole minor units (see money), so
+    removing a hole takes its contribution back out exactly.
+    """
+
+    def __init__(self):
+        self.balances = {}  # player_name: net amount owed to the player
+        self.paid = {}  # player_name: total paid on every settled hole
+        self.received = {}  # player_name: total received on every settled hole
+        self.entries = {}  # hole_number: LedgerEntry
+        self._pairwise = {}  # player_name: {opponent: net amount the opponent has paid the player}
+        self._pairwise_holes = {}  # hole_number: payments currently counted in _pairwise
+        self._pairwise_dirty = set()  # holes recorded or removed since _pairwise was brought up to date
+
+    def is_current(self, hole_number, key):
+        """True if the hole has already been settled with exactly these inputs."""
+        entry = self.entries.get(hole_number)
+        return entry is not None and entry.key == key
+
+    def record_hole(self, hole_number, key, payments):
+        """Replace the hole's contribution to the totals."""
+        self.remove_hole(hole_number)
+
+        paid = {from_player: sum(to_players.values()) for from_player, to_players in payments.items()}
+        received = {}
+        for to_players in payments.values():
+            for to_player, amount in to_players.items():
+                received[to_player] = received.get(to_player, 0) + amount
+
+        self._apply(paid, received, 1)
+        self.entries[hole_number] = LedgerEntry(key, payments, paid, received)
+        self._pairwise_dirty.add(hole_number)
+
+    def remove_hole(self, hole_number):
+        entry = self.entries.pop(hole_number, None)
+        if entry is None:
+            return
+        self._apply(entry.paid, entry.received, -1)
+        self._pairwise_dirty.add(hole_number)
+
+    def _apply(self, paid, received, sign):
+        balances = self.balances
+        for player_name, amount in paid.items():
+            amount *= sign
+            balances[player_name] = balances.get(player_name, 0) - amount
+            self.paid[player_name] = self.paid.get(player_name, 0) + amount
+        for player_name, amount in received.items():
+            amount *= sign
+            balances[player_name] = balances.get(player_name, 0) + amount
+            self.received[player_name] = self.received.get(player_name, 0) + amount
+
+    @property
+    def pairwise(self):
+        """player_name: {opponent: net amount the opponent has paid the player}."""
+        for hole_number in self._pairwise_dirty:
+            previous = self._pairwise_holes.pop(hole_number, None)
+            if previous is not None:
+                self._apply_pairwise(previous, -1)
+            entry = self.entries.get(hole_number)
+            if entry is not None:
+                self._apply_pairwise(entry.payments, 1)
+                self._pairwise_holes[hole_number] = entry.payments
+        self._pairwise_dirty.clear()
+        return self._pairwise
+
+    def _apply_pairwise(self, payments, sign):
+        pairwise = self._pairwise
+        for from_player, to_players in payments.items():
+            from_row = pairwise.setdefault(from_player, {})
+            for to_player, amount in to_players.items():
+                amount *= sign
+                from_row[to_player] = from_row.get(to_player, 0) - amount
+                to_row = pairwise.setdefault(to_player, {})
+                to_row[from_player] = to_row.get(from_player, 0) + amount
+
+    def player_totals(self, player_name):
+        """(paid, received, net) for one player across every settled hole."""
+        return (self.paid.get(player_name, 0),
+                self.received.get(player_name, 0),
+                self.balances.get(player_name, 0))
+
+    def clear(self):
+        self.balances = {}
+        self.paid = {}
+        self.received = {}
+        self.entries = {}
+        self._pairwise = {}
+        self._pairwise_holes = {}
+        self._pairwise_dirty = set()
@@ -0,0 +1,60 @@
+"""Money as whole minor units (cents).
+
+Every payment, balance and settlement amount in the models is an int number
+of minor units, so sums are exact and opposite amounts cancel to exactly 0.
+Hole values are still entered in major units; payment() converts a hole
+value and applies the scoring multiplier in one step, and it is the only
+place amounts are rounded: to the nearest minor unit, halves away from zero.
+
+Amounts go back to major units only where people or other programs read
+them: the GUI, the CLI reports and the JSON the batch settler and the
+scoring server write.
+"""
+import functools
+from decimal import Decimal, ROUND_HALF_UP
+
+MINOR_UNITS = 100  # minor units per major unit
+
+
+@functools.lru_cache(maxsize=1024)
+def payment(value, multiplier=1):
+    """What a hole worth value (major units) pays at multiplier, in minor units."""
+    if isinstance(value, int) and isinstance(multiplier, int):
+        return value * multiplier * MINOR_UNITS
+    amount = Decimal(str(value)) * Decimal(str(multiplier)) * MINOR_UNITS
+    return int(amount.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def to_minor(amount):
+    """A major-unit amount (e.g. read back from JSON) in minor units."""
+    return payment(amount)
+
+
+def to_major(amount):
+    """A minor-unit amount in major units: an int when it is whole, else a float."""
+    if amount % MINOR_UNITS == 0:
+        return amount // MINOR_UNITS
+    return amount / MINOR_UNITS
+
+
+def format_amount(amount):
+    """A minor-unit amount for display: "10", "-2.50"."""
+    if amount % MINOR_UNITS == 0:
+        return str(amount // MINOR_UNITS)
+    return f"{amount / MINOR_UNITS:.2f}"
+
+
+def payments_to_major(payments):
+    """from_player: {to_player: amount} with the amounts in major units."""
+    return {from_player: {to_player: to_major(amount) for to_player, amount in to_players.items()}
+            for from_player, to_players in payments.items()}
+
+
+def payments_to_minor(payments):
+    """The inverse of payments_to_major."""
+    return {from_player: {to_player: to_minor(amount) for to_player, amount in to_players.items()}
+            for from_player, to_players in payments.items()}
+
+
+def balances_to_major(balances):
+    return {player_name: to_major(amount) for player_name, amount in balances.items()}
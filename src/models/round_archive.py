@@ -0,0 +1,412 @@
+"""SQLite archive of completed rounds.
+
+Every finished Game is stored with its settings, players, voor, holes,
+scores, buchi, per-hole payments and final payments. Payment amounts are
+stored as whole minor units (see money), so totals summed in SQL are exact.
+The database runs in WAL mode so the GUI can keep writing rounds while
+reports read them.
+"""
+import json
+import os
+import sqlite3
+
+from src.models import money
+from src.models.game import Game
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    external_id TEXT,
+    played_on TEXT NOT NULL,
+    course TEXT NOT NULL DEFAULT '',
+    game_mode TEXT NOT NULL,
+    scoring_type TEXT NOT NULL,
+    scoring_rules TEXT,
+    buchi_enabled INTEGER NOT NULL,
+    voor_enabled INTEGER NOT NULL,
+    number_of_holes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS round_players (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    player TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (round_id, player)
+);
+CREATE TABLE IF NOT EXISTS voor (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    player TEXT NOT NULL,
+    opponent TEXT NOT NULL,
+    adjustment INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS holes (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    hole INTEGER NOT NULL,
+    value REAL NOT NULL,
+    par INTEGER NOT NULL,
+    PRIMARY KEY (round_id, hole)
+);
+CREATE TABLE IF NOT EXISTS scores (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    hole INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (round_id, hole, player)
+);
+CREATE TABLE IF NOT EXISTS buchi (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    hole INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    PRIMARY KEY (round_id, hole, player)
+);
+CREATE TABLE IF NOT EXISTS hole_payments (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    hole INTEGER NOT NULL,
+    from_player TEXT NOT NULL,
+    to_player TEXT NOT NULL,
+    amount INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS final_payments (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    from_player TEXT NOT NULL,
+    to_player TEXT NOT NULL,
+    amount INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_rounds_played_on ON rounds(played_on);
+CREATE INDEX IF NOT EXISTS idx_rounds_course ON rounds(course, played_on);
+CREATE INDEX IF NOT EXISTS idx_round_players_player ON round_players(player, round_id);
+CREATE INDEX IF NOT EXISTS idx_scores_player ON scores(player);
+CREATE INDEX IF NOT EXISTS idx_hole_payments_round ON hole_payments(round_id, hole);
+CREATE INDEX IF NOT EXISTS idx_final_payments_from ON final_payments(from_player, round_id);
+CREATE INDEX IF NOT EXISTS idx_final_payments_to ON final_payments(to_player, round_id);
+"""
+
+
+def default_archive_path():
+    """Where the GUI keeps its archive: ~/.golf_bet_tracker/rounds.db"""
+    return os.path.join(os.path.expanduser("~"), ".golf_bet_tracker", "rounds.db")
+
+
+class RoundArchive:
+    def __init__(self, path=None):
+        self.path = path or default_archive_path()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # Writing
+
+    def save_game(self, game, external_id=None):
+        """Store one completed game and return its round id."""
+        with self.connection:
+            return self._insert_game(game, external_id)
+
+    def save_games(self, games):
+        """Bulk insert many games in a single transaction.
+
+        games is an iterable of Game objects or (external_id, Game) pairs.
+        Returns the number of rounds stored.
+        """
+        count = 0
+        with self.connection:
+            for item in games:
+                if isinstance(item, tuple):
+                    external_id, game = item
+                else:
+                    external_id, game = None, item
+                self._insert_game(game, external_id)
+                count += 1
+        return count
+
+    def import_rounds(self, rounds):
+        """Settle round dictionaries (batch/scorecard format) and store them in bulk."""
+        def settled_games():
+            for round_data in rounds:
+                game = Game.from_dict(round_data)
+                game.calculate_all_payments()
+                yield round_data.get("id"), game
+        return self.save_games(settled_games())
+
+    def _insert_game(self, game, external_id):
+        settings = game.settings
+        cursor = self.connection.execute(
+            "INSERT INTO rounds (external_id, played_on, course, game_mode, scoring_type, scoring_rules,"
+            " buchi_enabled, voor_enabled, number_of_holes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (None if external_id is None else str(external_id), game.played_on, settings.course,
+             settings.game_mode, settings.scoring_type,
+             None if settings.scoring_rules is None else json.dumps(settings.scoring_rules),
+             int(settings.buchi_enabled),
+             int(settings.voor_enabled), settings.number_of_holes))
+        round_id = cursor.lastrowid
+
+        self.connection.executemany(
+            "INSERT INTO round_players (round_id, player, position) VALUES (?, ?, ?)",
+            [(round_id, player_name, position) for position, player_name in enumerate(game.players)])
+
+        self.connection.executemany(
+            "INSERT INTO voor (round_id, player, opponent, adjustment) VALUES (?, ?, ?, ?)",
+            [(round_id, player_name, opponent, adjustment)
+             for player_name, player in game.players.items()
+             for opponent, adjustment in player.voor_adjustments.items()])
+
+        holes = sorted(game.holes.items())
+        self.connection.executemany(
+            "INSERT INTO holes (round_id, hole, value, par) VALUES (?, ?, ?, ?)",
+            [(round_id, hole_number, hole.value, hole.par) for hole_number, hole in holes])
+
+        self.connection.executemany(
+            "INSERT INTO scores (round_id, hole, player, score) VALUES (?, ?, ?, ?)",
+            [(round_id, hole_number, player_name, score)
+             for hole_number, hole in holes
+             for player_name, score in hole.player_scores.items()])
+
+        self.connection.executemany(
+            "INSERT INTO buchi (round_id, hole, player, won) VALUES (?, ?, ?, ?)",
+            [(round_id, hole_number, player_name, int(player_name in hole.buchi_winners))
+             for hole_number, hole in holes
+             for player_name in hole.buchi_participants])
+
+        self.connection.executemany(
+            "INSERT INTO hole_payments (round_id, hole, from_player, to_player, amount) VALUES (?, ?, ?, ?, ?)",
+            [(round_id, hole_number, from_player, to_player, amount)
+             for hole_number, hole in holes
+             for from_player, to_players in hole.payments.items()
+             for to_player, amount in to_players.items()])
+
+        self.connection.executemany(
+            "INSERT INTO final_payments (round_id, from_player, to_player, amount) VALUES (?, ?, ?, ?)",
+            [(round_id, from_player, to_player, amount)
+             for from_player, to_players in game.final_payments.items()
+             for to_player, amount in to_players.items()])
+
+        return round_id
+
+    # Reading
+
+    def load_game(self, round_id):
+        """Rebuild a stored round as a settled Game."""
+        row = self.connection.execute(
+            "SELECT external_id, played_on, course, game_mode, scoring_type, scoring_rules, buchi_enabled,"
+            " voor_enabled, number_of_holes FROM rounds WHERE id = ?", (round_id,)).fetchone()
+        if row is None:
+            raise KeyError(round_id)
+        (external_id, played_on, course, game_mode, scoring_type, scoring_rules,
+         buchi_enabled, voor_enabled, number_of_holes) = row
+
+        players = [player for (player,) in self.connection.execute(
+            "SELECT player FROM round_players WHERE round_id = ? ORDER BY position", (round_id,))]
+
+        voor = {}
+        for player, opponent, adjustment in self.connection.execute(
+                "SELECT player, opponent, adjustment FROM voor WHERE round_id = ? ORDER BY rowid", (round_id,)):
+            voor.setdefault(player, {})[opponent] = adjustment
+
+        holes = {}
+        for hole_number, value, par in self.connection.execute(
+                "SELECT hole, value, par FROM holes WHERE round_id = ? ORDER BY hole", (round_id,)):
+            holes[hole_number] = {"hole": hole_number, "value": _number(value), "par": par,
+                                  "scores": {}, "buchi": {"participants": [], "winners": []}}
+        for hole_number, player, score in self.connection.execute(
+                "SELECT hole, player, score FROM scores WHERE round_id = ?", (round_id,)):
+            holes[hole_number]["scores"][player] = score
+        for hole_number, player, won in self.connection.execute(
+                "SELECT hole, player, won FROM buchi WHERE round_id = ? ORDER BY rowid", (round_id,)):
+            holes[hole_number]["buchi"]["participants"].append(player)
+            if won:
+                holes[hole_number]["buchi"]["winners"].append(player)
+
+        game = Game.from_dict({
+            "id": external_id,
+            "date": played_on,
+            "settings": {
+                "number_of_holes": number_of_holes,
+                "game_mode": game_mode,
+                "scoring_type": scoring_type,
+                "scoring_rules": None if scoring_rules is None else json.loads(scoring_rules),
+                "buchi_enabled": bool(buchi_enabled),
+                "voor_enabled": bool(voor_enabled),
+                "course": course
+            },
+            "players": players,
+            "voor": voor,
+            "holes": list(holes.values())
+        })
+        game.calculate_all_payments()
+        return game
+
+    def iter_games(self, player=None, course=None, start=None, end=None):
+        """(external id, settled Game) for every round find_rounds matches, oldest first."""
+        for round_id, played_on, course_name in self.find_rounds(player, course, start, end):
+            (external_id,) = self.connection.execute(
+                "SELECT external_id FROM rounds WHERE id = ?", (round_id,)).fetchone()
+            yield external_id, self.load_game(round_id)
+
+    def find_rounds(self, player=None, course=None, start=None, end=None):
+        """Round ids (with date and course) matching every given filter, oldest first."""
+        query = "SELECT r.id, r.played_on, r.course FROM rounds r"
+        conditions, params = self._round_filters(course, start, end)
+        if player is not None:
+            query += " JOIN round_players rp ON rp.round_id = r.id"
+            conditions.append("rp.player = ?")
+            params.append(player)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY r.played_on, r.id"
+        return self.connection.execute(query, params).fetchall()
+
+    def player_totals(self, player=None, course=None, start=None, end=None):
+        """Rounds played, paid, received and net per player from final payments.
+
+        Dates are ISO strings and the range is inclusive. Returns
+        {player: {"rounds": n, "paid": x, "received": y, "net": y - x}}
+        with the amounts in minor units.
+        """
+        conditions, params = self._round_filters(course, start, end)
+        where = (" AND " + " AND ".join(conditions)) if conditions else ""
+        player_filter = ""
+        player_params = []
+        if player is not None:
+            player_filter = " AND rp.player = ?"
+            player_params = [player]
+
+        totals = {}
+        for name, rounds in self.connection.execute(
+                "SELECT rp.player, COUNT(*) FROM round_players rp JOIN rounds r ON r.id = rp.round_id"
+                " WHERE 1 = 1" + where + player_filter + " GROUP BY rp.player",
+                params + player_params):
+            totals[name] = {"rounds": rounds, "paid": 0, "received": 0, "net": 0}
+
+        for column, key in (("from_player", "paid"), ("to_player", "received")):
+            query = (f"SELECT fp.{column}, SUM(fp.amount) FROM final_payments fp"
+                     f" JOIN rounds r ON r.id = fp.round_id WHERE 1 = 1" + where)
+            query_params = list(params)
+            if player is not None:
+                query += f" AND fp.{column} = ?"
+                query_params.append(player)
+            query += f" GROUP BY fp.{column}"
+            for name, amount in self.connection.execute(query, query_params):
+                if name in totals:
+                    totals[name][key] = amount
+
+        for summary in totals.values():
+            summary["net"] = summary["received"] - summary["paid"]
+        return totals
+
+    def score_history(self, players=None, course=None, start=None, end=None):
+        """Strokes over par and buchi record per player, for fitting simulator player models.
+
+        Returns {player: {"offsets": [score - par, ...], "buchi_holes": n,
+        "buchi_played": k, "buchi_won": w}} in the shape of
+        simulator.score_history. Holes without a par or a score are skipped.
+        """
+        conditions, params = self._round_filters(course, start, end)
+        if players is not None:
+            players = list(players)
+            conditions.append(f"s.player IN ({', '.join('?' * len(players))})")
+            params.extend(players)
+        where = (" AND " + " AND ".join(conditions)) if conditions else ""
+
+        history = {}
+        for name, offset, buchi_enabled, played, won in self.connection.execute(
+                "SELECT s.player, s.score - h.par, r.buchi_enabled, b.player IS NOT NULL, COALESCE(b.won, 0)"
+                " FROM scores s"
+                " JOIN holes h ON h.round_id = s.round_id AND h.hole = s.hole"
+                " JOIN rounds r ON r.id = s.round_id"
+                " LEFT JOIN buchi b ON b.round_id = s.round_id AND b.hole = s.hole AND b.player = s.player"
+                " WHERE h.par > 0 AND s.score > 0" + where, params):
+            record = history.setdefault(name, {"offsets": [], "buchi_holes": 0, "buchi_played": 0, "buchi_won": 0})
+            record["offsets"].append(offset)
+            if buchi_enabled:
+                record["buchi_holes"] += 1
+                record["buchi_played"] += played
+                record["buchi_won"] += won
+        return history
+
+    def export_records(self, kind, player=None, course=None, start=None, end=None):
+        """Stream one kind of export record (see export.FIELDS) for the matching rounds, oldest first.
+
+        Records come straight from the stored rows, with amounts in major
+        units. Player paid and received are the round's per-hole payments,
+        as in Game.get_player_totals.
+        """
+        conditions, params = self._round_filters(course, start, end)
+        if player is not None:
+            conditions.append("r.id IN (SELECT round_id FROM round_players WHERE player = ?)")
+            params.append(player)
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+        round_label = "COALESCE(r.external_id, r.id)"
+
+        if kind == "hole_payments":
+            rows = self.connection.execute(
+                f"SELECT {round_label}, hp.hole, hp.from_player, hp.to_player, hp.amount"
+                " FROM rounds r JOIN hole_payments hp ON hp.round_id = r.id" + where +
+                " ORDER BY r.played_on, r.id, hp.hole, hp.rowid", params)
+            for round_id, hole_number, from_player, to_player, amount in rows:
+                yield {"round": round_id, "hole": hole_number, "from": from_player, "to": to_player,
+                       "amount": money.to_major(amount)}
+        elif kind == "players":
+            # The unary + keeps SQLite on the scores primary key instead of idx_scores_player,
+            # which would scan every score the player ever posted for each row
+            rows = self.connection.execute(
+                f"SELECT {round_label}, rp.player,"
+                " (SELECT COALESCE(SUM(s.score), 0) FROM scores s"
+                "  WHERE s.round_id = r.id AND +s.player = rp.player),"
+                " (SELECT COALESCE(SUM(hp.amount), 0) FROM hole_payments hp"
+                "  WHERE hp.round_id = r.id AND hp.from_player = rp.player),"
+                " (SELECT COALESCE(SUM(hp.amount), 0) FROM hole_payments hp"
+                "  WHERE hp.round_id = r.id AND hp.to_player = rp.player)"
+                " FROM rounds r JOIN round_players rp ON rp.round_id = r.id" + where +
+                " ORDER BY r.played_on, r.id, rp.position", params)
+            for round_id, player_name, total_score, paid, received in rows:
+                yield {"round": round_id, "player": player_name, "total_score": total_score,
+                       "paid": money.to_major(paid), "received": money.to_major(received),
+                       "net": money.to_major(received - paid)}
+        elif kind == "final_payments":
+            rows = self.connection.execute(
+                f"SELECT {round_label}, fp.from_player, fp.to_player, fp.amount"
+                " FROM rounds r JOIN final_payments fp ON fp.round_id = r.id" + where +
+                " ORDER BY r.played_on, r.id, fp.rowid", params)
+            for round_id, from_player, to_player, amount in rows:
+                yield {"round": round_id, "from": from_player, "to": to_player, "amount": money.to_major(amount)}
+        else:
+            raise ValueError(f"Unknown export record kind {kind!r}")
+
+    def round_count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM rounds").fetchone()[0]
+
+    def _round_filters(self, course, start, end):
+        conditions = []
+        params = []
+        if course is not None:
+            conditions.append("r.course = ?")
+            params.append(course)
+        if start is not None:
+            conditions.append("r.played_on >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("r.played_on <= ?")
+            params.append(end)
+        return conditions, params
+
+
+def _number(value):
+    """SQLite hands back REAL columns as floats; keep whole hole values as ints."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
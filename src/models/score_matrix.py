@@ -0,0 +1,183 @@
+from array import array
+from collections.abc import Mapping
+
+# Scores are stroke counts, so 0 marks a cell with no score yet
+NO_SCORE = 0
+
+
+class ScoreMatrix:
+    """Every score in a game, stored once as a holes x players array of ints.
+
+    Player names and hole numbers are interned to column and row indices in
+    the order they were added. Rows are laid out one after another, so a hole
+    is a contiguous slice and a player is a strided slice of the same array;
+    totals are reductions over those slices.
+    """
+
+    def __init__(self):
+        self.player_index = {}  # player_name: column
+        self.hole_index = {}  # hole_number: row
+        self.data = array("i")
+
+    @property
+    def width(self):
+        return len(self.player_index)
+
+    def add_player(self, player_name):
+        """Add a column for the player (existing scores are kept)."""
+        if player_name in self.player_index:
+            return self.player_index[player_name]
+
+        old_width = self.width
+        self.player_index[player_name] = old_width
+        if self.hole_index:
+            # Re-lay out the rows with one more column each
+            data = array("i")
+            for row in range(len(self.hole_index)):
+                data.extend(self.data[row * old_width:(row + 1) * old_width])
+                data.append(NO_SCORE)
+            self.data = data
+        return old_width
+
+    def add_hole(self, hole_number):
+        """Add an empty row for the hole, or clear it if it already exists."""
+        row = self.hole_index.get(hole_number)
+        if row is None:
+            row = len(self.hole_index)
+            self.hole_index[hole_number] = row
+            self.data.extend([NO_SCORE] * self.width)
+        else:
+            start = row * self.width
+            self.data[start:start + self.width] = array("i", [NO_SCORE] * self.width)
+        return row
+
+    def _offset(self, hole_number, player_name):
+        row = self.hole_index.get(hole_number)
+        col = self.player_index.get(player_name)
+        if row is None or col is None:
+            return None
+        return row * self.width + col
+
+    def set(self, hole_number, player_name, score):
+        if score < 1:
+            raise ValueError(f"Score must be a positive number of strokes, got {score}")
+        if player_name not in self.player_index:
+            self.add_player(player_name)
+        if hole_number not in self.hole_index:
+            self.add_hole(hole_number)
+        self.data[self._offset(hole_number, player_name)] = score
+
+    def get(self, hole_number, player_name):
+        """The score, or None if the cell has no score."""
+        offset = self._offset(hole_number, player_name)
+        if offset is None:
+            return None
+        score = self.data[offset]
+        return None if score == NO_SCORE else score
+
+    def clear(self, hole_number, player_name):
+        offset = self._offset(hole_number, player_name)
+        if offset is not None:
+            self.data[offset] = NO_SCORE
+
+    def row(self, hole_number):
+        """Scores for one hole in player column order (NO_SCORE where missing)."""
+        row = self.hole_index.get(hole_number)
+        if row is None:
+            return array("i", [NO_SCORE] * self.width)
+        start = row * self.width
+        return self.data[start:start + self.width]
+
+    def column(self, player_name):
+        """Scores for one player in hole row order (NO_SCORE where missing)."""
+        col = self.player_index.get(player_name)
+        if col is None or not self.width:
+            return array("i")
+        return self.data[col::self.width]
+
+    def total(self, player_name):
+        """Sum of the player's scores; missing cells count as 0."""
+        return sum(self.column(player_name))
+
+    def scored_hole_count(self, player_name):
+        column = self.column(player_name)
+        return len(column) - column.count(NO_SCORE)
+
+    def player_view(self, player_name):
+        return PlayerScoresView(self, player_name)
+
+    def hole_view(self, hole_number):
+        return HoleScoresView(self, hole_number)
+
+
+class PlayerScoresView(Mapping):
+    """Read-only hole_number: score mapping over one column of a ScoreMatrix."""
+
+    def __init__(self, matrix, player_name):
+        self.matrix = matrix
+        self.player_name = player_name
+
+    def __getitem__(self, hole_number):
+        score = self.matrix.get(hole_number, self.player_name)
+        if score is None:
+            raise KeyError(hole_number)
+        return score
+
+    def get(self, hole_number, default=None):
+        score = self.matrix.get(hole_number, self.player_name)
+        return default if score is None else score
+
+    def __iter__(self):
+        column = self.matrix.column(self.player_name)
+        for hole_number, row in self.matrix.hole_index.items():
+            if column[row] != NO_SCORE:
+                yield hole_number
+
+    def __len__(self):
+        return self.matrix.scored_hole_count(self.player_name)
+
+    def as_dict(self):
+        """A plain dict copy, reading the column once instead of a lookup per hole."""
+        column = self.matrix.column(self.player_name)
+        return {hole_number: column[row] for hole_number, row in self.matrix.hole_index.items()
+                if column[row] != NO_SCORE}
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class HoleScoresView(Mapping):
+    """Read-only player_name: score mapping over one row of a ScoreMatrix."""
+
+    def __init__(self, matrix, hole_number):
+        self.matrix = matrix
+        self.hole_number = hole_number
+
+    def __getitem__(self, player_name):
+        score = self.matrix.get(self.hole_number, player_name)
+        if score is None:
+            raise KeyError(player_name)
+        return score
+
+    def get(self, player_name, default=None):
+        score = self.matrix.get(self.hole_number, player_name)
+        return default if score is None else score
+
+    def __iter__(self):
+        row = self.matrix.row(self.hole_number)
+        for player_name, col in self.matrix.player_index.items():
+            if row[col] != NO_SCORE:
+                yield player_name
+
+    def __len__(self):
+        row = self.matrix.row(self.hole_number)
+        return len(row) - row.count(NO_SCORE)
+
+    def as_dict(self):
+        """A plain dict copy, reading the row once instead of a lookup per player."""
+        row = self.matrix.row(self.hole_number)
+        return {player_name: row[col] for player_name, col in self.matrix.player_index.items()
+                if row[col] != NO_SCORE}
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -0,0 +1,129 @@
+"""Scoring rules as data: what the winner of a hole collects from each loser.
+
+A rule set is a plain dictionary of multipliers of the hole value:
+
+    {
+        "label": "Par",
+        "hole_in_one": 8,                          # a hole in one on any par (null: use the rules below)
+        "multipliers": {"-2": 4, "-1": 2, "0": 1},  # by score minus par
+        "over_par": 0,                              # any other score above par
+        "otherwise": 1                              # any other score at or below par
+    }
+
+A multiplier of 0 means the winner collects nothing. Games pick a rule set
+by name through GameSettings.scoring_type; a game with its own rules keeps
+them in GameSettings.scoring_rules instead, so they travel with the game.
+More named rule sets can be added in ~/.golf_bet_tracker/scoring_rules.json
+as {"name": {rules}}.
+
+compile_rules turns a rule set into a ScoringTable: one dense list of
+multipliers indexed by score minus par, looked up once per comparison.
+"""
+import json
+import os
+
+SCORING_RULES = {
+    "par": {
+        "label": "Par",
+        "hole_in_one": 8,
+        "multipliers": {"-2": 4, "-1": 2, "0": 1},
+        "over_par": 0,
+        "otherwise": 1
+    },
+    "bogey": {
+        "label": "Bogey",
+        "hole_in_one": 8,
+        "multipliers": {"-2": 4, "-1": 2, "0": 1},
+        "over_par": 0.5,
+        "otherwise": 1
+    }
+}
+
+# Scores minus par the compiled table covers; anything further out is clamped to the ends
+LOWEST_OFFSET = -10
+HIGHEST_OFFSET = 20
+
+
+def default_rules_path():
+    """Where extra named rule sets are read from: ~/.golf_bet_tracker/scoring_rules.json"""
+    return os.path.join(os.path.expanduser("~"), ".golf_bet_tracker", "scoring_rules.json")
+
+
+def load_scoring_rules(path=None):
+    """The built-in rule sets plus any valid ones from the rules file, by name."""
+    presets = dict(SCORING_RULES)
+    path = path or default_rules_path()
+    if not os.path.exists(path):
+        return presets
+    with open(path, "r") as f:
+        for name, rules in json.load(f).items():
+            validate_rules(rules)
+            presets[name] = rules
+    return presets
+
+
+def named_rules(name):
+    """The built-in or rules-file rule set called name."""
+    presets = SCORING_RULES if name in SCORING_RULES else load_scoring_rules()
+    if name not in presets:
+        raise ValueError(f"Unknown scoring type {name!r}")
+    return presets[name]
+
+
+def rules_for(settings):
+    """The rule set a game plays by: its own rules, or the named preset."""
+    if settings.scoring_rules is not None:
+        return settings.scoring_rules
+    return named_rules(settings.scoring_type)
+
+
+def validate_rules(rules):
+    """Raise ValueError if the rule set cannot be compiled."""
+    if not isinstance(rules, dict):
+        raise ValueError("Scoring rules must be a dictionary")
+    values = [rules.get("over_par", 0), rules.get("otherwise", 1)]
+    if rules.get("hole_in_one") is not None:
+        values.append(rules["hole_in_one"])
+    for offset, multiplier in rules.get("multipliers", {}).items():
+        try:
+            offset = int(offset)
+        except (TypeError, ValueError):
+            raise ValueError(f"Scoring rule offsets must be whole numbers, got {offset!r}")
+        if not LOWEST_OFFSET < offset < HIGHEST_OFFSET:
+            raise ValueError(f"Scoring rule offset {offset} is outside {LOWEST_OFFSET + 1}..{HIGHEST_OFFSET - 1}")
+        values.append(multiplier)
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise ValueError(f"Scoring rule multipliers must be numbers of at least 0, got {value!r}")
+
+
+class ScoringTable:
+    """A compiled rule set: the winner's multiplier for any score and par."""
+
+    def __init__(self, rules):
+        validate_rules(rules)
+        multipliers = {int(offset): value for offset, value in rules.get("multipliers", {}).items()}
+        over_par = rules.get("over_par", 0)
+        otherwise = rules.get("otherwise", 1)
+
+        self.hole_in_one = rules.get("hole_in_one")
+        # table[score - par - LOWEST_OFFSET]; the ends stand for every offset beyond them
+        self.table = [
+            multipliers.get(offset, over_par if offset > 0 else otherwise)
+            for offset in range(LOWEST_OFFSET, HIGHEST_OFFSET + 1)
+        ]
+        self.signature = (self.hole_in_one,) + tuple(self.table)
+
+    def multiplier(self, score, par):
+        if score == 1 and self.hole_in_one is not None:
+            return self.hole_in_one
+        offset = score - par
+        if offset <= LOWEST_OFFSET:
+            return self.table[0]
+        if offset >= HIGHEST_OFFSET:
+            return self.table[-1]
+        return self.table[offset - LOWEST_OFFSET]
+
+
+def compile_rules(rules):
+    return ScoringTable(rules)
@@ -0,0 +1,226 @@
+"""Settle net balances with as few transfers as possible.
+
+Only the net balance of each player matters for settling up: whoever is
+down money pays, whoever is up receives. Small groups are solved exactly by
+finding the largest number of zero-sum subgroups (each subgroup of size m
+settles with m - 1 transfers); large groups use a greedy matcher whose
+result is reported together with a lower bound on the optimum.
+
+Amounts are whole minor units (see money), so a balance or a subgroup is
+settled exactly when it sums to 0.
+"""
+import heapq
+import time
+
+# Up to this many non-zero balances the exact search is used (2^n states)
+EXACT_LIMIT = 12
+
+
+class SettlementResult:
+    def __init__(self, payments, engine, solve_time, lower_bound):
+        self.payments = payments  # from_player: {to_player: amount}
+        self.engine = engine  # "exact" or "greedy"
+        self.solve_time = solve_time  # seconds
+        self.lower_bound = lower_bound  # no settlement can use fewer transfers
+
+    @property
+    def transaction_count(self):
+        return sum(len(recipients) for recipients in self.payments.values())
+
+    @property
+    def quality_bound(self):
+        """Worst-case ratio between this settlement and the optimal one."""
+        if not self.lower_bound:
+            return 1.0
+        return self.transaction_count / self.lower_bound
+
+    def summary(self):
+        return (f"{self.transaction_count} transfers ({self.engine}, "
+                f"{self.solve_time * 1000:.2f} ms)")
+
+    def to_dict(self):
+        return {
+            "engine": self.engine,
+            "transaction_count": self.transaction_count,
+            "lower_bound": self.lower_bound,
+            "solve_time": self.solve_time
+        }
+
+
+def net_balances(payments, balances=None):
+    """Net amount each player is owed (positive) or owes (negative)."""
+    if balances is None:
+        balances = {}
+    for payer, recipients in payments.items():
+        for recipient, amount in recipients.items():
+            balances[payer] = balances.get(payer, 0) - amount
+            balances[recipient] = balances.get(recipient, 0) + amount
+    return balances
+
+
+def settle_balances(balances, exact_limit=EXACT_LIMIT):
+    """Turn net balances into a minimal set of transfers.
+
+    The engine is chosen by the number of players with a non-zero balance.
+    """
+    start = time.perf_counter()
+
+    players = [player for player, balance in balances.items() if balance != 0]
+    amounts = [balances[player] for player in players]
+    lower_bound = (len(players) + 1) // 2
+
+    if len(players) <= exact_limit:
+        engine = "exact"
+        groups = _zero_sum_groups(amounts)
+        lower_bound = len(players) - len(groups)
+        payments = {}
+        for group in groups:
+            _match_greedily([(players[i], amounts[i]) for i in group], payments)
+    else:
+        engine = "greedy"
+        payments = _settle_greedily(list(zip(players, amounts)))
+
+    return SettlementResult(payments, engine, time.perf_counter() - start, lower_bound)
+
+
+def settle_payments(payment_sets, exact_limit=EXACT_LIMIT):
+    """Settle several payment dictionaries (e.g. many rounds) as one."""
+    balances = {}
+    for payments in payment_sets:
+        net_balances(payments, balances)
+    return settle_balances(balances, exact_limit)
+
+
+def _zero_sum_groups(amounts):
+    """Partition the amounts into the largest number of zero-sum groups.
+
+    best[mask] is the most zero-sum prefixes any ordering of mask can have;
+    the full set then needs len(amounts) - best[full] transfers.
+    """
+    size = len(amounts)
+    if size == 0:
+        return []
+
+    full = (1 << size) - 1
+    sums = [0] * (full + 1)
+    best = [0] * (full + 1)
+    last = [0] * (full + 1)
+
+    for mask in range(1, full + 1):
+        low_bit = mask & -mask
+        index = low_bit.bit_length() - 1
+        sums[mask] = sums[mask ^ low_bit] + amounts[index]
+
+        best_count = -1
+        best_index = 0
+        remaining = mask
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            count = best[mask ^ bit]
+            if count > best_count:
+                best_count = count
+                best_index = bit.bit_length() - 1
+
+        if sums[mask] == 0:
+            best_count += 1
+        best[mask] = best_count
+        last[mask] = best_index
+
+    # Walk back from the full set to recover the order, then cut it at zero-sum prefixes
+    order = []
+    mask = full
+    while mask:
+        index = last[mask]
+        order.append(index)
+        mask ^= 1 << index
+    order.reverse()
+
+    groups = []
+    group = []
+    running = 0
+    for index in order:
+        group.append(index)
+        running += amounts[index]
+        if running == 0:
+            groups.append(group)
+            group = []
+            running = 0
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _record(payments, debtor, creditor, amount):
+    if debtor not in payments:
+        payments[debtor] = {}
+    payments[debtor][creditor] = payments[debtor].get(creditor, 0) + amount
+
+
+def _match_greedily(entries, payments):
+    """Settle a zero-sum group with at most len(entries) - 1 transfers."""
+    debtors = [[player, -amount] for player, amount in entries if amount < 0]
+    creditors = [[player, amount] for player, amount in entries if amount > 0]
+
+    d = c = 0
+    while d < len(debtors) and c < len(creditors):
+        debtor, owed = debtors[d]
+        creditor, due = creditors[c]
+        amount = min(owed, due)
+        _record(payments, debtor, creditor, amount)
+
+        debtors[d][1] -= amount
+        creditors[c][1] -= amount
+        if debtors[d][1] == 0:
+            d += 1
+        if creditors[c][1] == 0:
+            c += 1
+
+
+def _settle_greedily(entries):
+    """Greedy settlement for large groups.
+
+    Debtors and creditors with exactly matching amounts are paired first, then
+    the largest debtor repeatedly pays the largest creditor. This never uses
+    more than n - 1 transfers.
+    """
+    payments = {}
+
+    # Exact matches close a pair in a single transfer
+    creditors_by_amount = {}
+    for player, amount in entries:
+        if amount > 0:
+            creditors_by_amount.setdefault(amount, []).append(player)
+
+    debtors = []
+    matched = set()
+    for player, amount in entries:
+        if amount >= 0:
+            continue
+        candidates = creditors_by_amount.get(-amount)
+        if candidates:
+            creditor = candidates.pop()
+            matched.add(creditor)
+            _record(payments, player, creditor, -amount)
+        else:
+            debtors.append((amount, player))  # negative amount: largest debt first
+
+    creditors = [(-amount, player) for player, amount in entries
+                 if amount > 0 and player not in matched]
+    heapq.heapify(debtors)
+    heapq.heapify(creditors)
+
+    while debtors and creditors:
+        owed, debtor = heapq.heappop(debtors)
+        due, creditor = heapq.heappop(creditors)
+        amount = min(-owed, -due)
+        _record(payments, debtor, creditor, amount)
+
+        owed += amount
+        due += amount
+        if owed < 0:
+            heapq.heappush(debtors, (owed, debtor))
+        if due < 0:
+            heapq.heappush(creditors, (due, creditor))
+
+    return payments
@@ -0,0 +1,612 @@
+"""Monte Carlo simulation of rounds, to judge and choose voor.
+
+Every player is a PlayerModel: how many strokes over or under par they
+take on a hole (fitted from past rounds or entered by hand) and how often
+they play and win buchi. VoorSimulator plays a large number of rounds on a
+course with those players and scores them with the game's rules (single
+winner or face to face, par or bogey scoring, buchi). It reports each
+player's expected payout per round for a voor matrix. It can also search
+for the voor that brings every player's expected payout closest to zero.
+
+Rounds are drawn in chunks of NumPy arrays and the chunks are spread over
+a process pool. Each chunk has its own fixed seed, so every pass over the
+rounds sees the same scores and voor settings are compared on identical
+rounds. Searching does not replay the rounds once per candidate:
+
+- Face to face: a pair's result depends only on the difference between the
+  voor each receives from the other. One pass records every pair's gains
+  at each possible difference, and any matrix is scored from that table.
+- Single winner: only each player's effective voor (the most they receive
+  from anyone) matters. One pass counts how often each combination of
+  scores came up on each par, and every effective-voor vector is scored
+  from those counts.
+
+NumPy is required (pip install numpy). Like batch.py, this module never
+imports PyQt5.
+"""
+import itertools
+import math
+import multiprocessing
+import time
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from src.models.scoring import compile_rules, named_rules
+from src.models.vectorized import multipliers
+
+OFFSETS = tuple(range(-3, 7))  # strokes relative to par a player model can take on a hole
+VOOR_LEVELS = (0, 1, 2)
+DEFAULT_PARS = (4, 4, 3, 4, 5, 4, 3, 4, 5, 4, 4, 3, 4, 5, 4, 3, 4, 5)
+CHUNK_ROUNDS = 20000  # rounds simulated per worker task
+HISTOGRAM_LIMIT = 100000  # most score combinations per par for the single winner search table
+EXHAUSTIVE_LIMIT = 100000  # most voor settings the search tries one by one
+
+# Lowest voor-adjusted score the multiplier lookup covers: a 1 with the most voor
+LOWEST_SCORE = 1 - max(VOOR_LEVELS)
+
+
+def available():
+    """Return True if simulations can run (NumPy is installed)."""
+    return np is not None
+
+
+class PlayerModel:
+    """How one player scores: a probability for each number of strokes over par."""
+
+    def __init__(self, name, probabilities, buchi_rate=0.0, buchi_win_rate=0.0):
+        if len(probabilities) != len(OFFSETS):
+            raise ValueError(f"Expected {len(OFFSETS)} probabilities (for {OFFSETS[0]} to {OFFSETS[-1]} over par)")
+        total = float(sum(probabilities))
+        if total <= 0:
+            raise ValueError(f"Score probabilities for {name} add up to zero")
+        self.name = name
+        self.probabilities = [float(p) / total for p in probabilities]
+        self.buchi_rate = buchi_rate  # share of holes the player plays buchi
+        self.buchi_win_rate = buchi_win_rate  # share of buchi the player wins
+
+    @classmethod
+    def from_average(cls, name, average, spread=1.0, buchi_rate=0.0, buchi_win_rate=0.0):
+        """A hand-entered player: about `average` strokes over par per hole, give or take `spread`."""
+        weights = [math.exp(-((offset - average) ** 2) / (2 * spread ** 2)) for offset in OFFSETS]
+        return cls(name, weights, buchi_rate, buchi_win_rate)
+
+    @classmethod
+    def from_history(cls, name, history, prior=None, prior_weight=5.0):
+        """Fit a player from score_history() output.
+
+        prior is a list of probabilities (e.g. every player pooled) worth
+        prior_weight holes, so a player with few holes on record is not
+        judged on them alone.
+        """
+        counts = [0.0] * len(OFFSETS)
+        for offset in history.get("offsets", []):
+            counts[_offset_index(offset)] += 1
+        if prior is not None:
+            counts = [count + prior_weight * p for count, p in zip(counts, prior)]
+        elif not any(counts):
+            raise ValueError(f"No scores on record for {name}")
+
+        buchi_holes = history.get("buchi_holes", 0)
+        buchi_played = history.get("buchi_played", 0)
+        buchi_rate = buchi_played / buchi_holes if buchi_holes else 0.0
+        buchi_win_rate = history.get("buchi_won", 0) / buchi_played if buchi_played else 0.0
+        return cls(name, counts, buchi_rate, buchi_win_rate)
+
+    @property
+    def expected_offset(self):
+        return sum(offset * p for offset, p in zip(OFFSETS, self.probabilities))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "probabilities": {str(offset): p for offset, p in zip(OFFSETS, self.probabilities)},
+            "buchi_rate": self.buchi_rate,
+            "buchi_win_rate": self.buchi_win_rate
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        probabilities = data["probabilities"]
+        if isinstance(probabilities, dict):
+            probabilities = [float(probabilities.get(str(offset), 0)) for offset in OFFSETS]
+        return cls(data["name"], probabilities, data.get("buchi_rate", 0.0), data.get("buchi_win_rate", 0.0))
+
+
+def _offset_index(offset):
+    return min(max(offset, OFFSETS[0]), OFFSETS[-1]) - OFFSETS[0]
+
+
+def score_history(rounds):
+    """Strokes over par and buchi record per player from round dictionaries.
+
+    Returns {player: {"offsets": [...], "buchi_holes": n, "buchi_played": k,
+    "buchi_won": w}}, the same shape as RoundArchive.score_history.
+    Holes without a par or a score are skipped.
+    """
+    history = {}
+    for round_data in rounds:
+        buchi_enabled = round_data.get("settings", {}).get("buchi_enabled", False)
+        for hole in round_data.get("holes", []):
+            par = hole.get("par", 0)
+            buchi = hole.get("buchi", {})
+            participants = set(buchi.get("participants", []))
+            winners = set(buchi.get("winners", []))
+            for player_name, score in hole.get("scores", {}).items():
+                if not par or not score:
+                    continue
+                record = history.setdefault(player_name, _empty_history())
+                record["offsets"].append(score - par)
+                if buchi_enabled:
+                    record["buchi_holes"] += 1
+                    record["buchi_played"] += player_name in participants
+                    record["buchi_won"] += player_name in winners
+    return history
+
+
+def _empty_history():
+    return {"offsets": [], "buchi_holes": 0, "buchi_played": 0, "buchi_won": 0}
+
+
+def fit_players(history, names=None, prior_weight=5.0):
+    """PlayerModels for the named players (default: everyone in the history).
+
+    Every player is pulled towards the pooled distribution of all players;
+    players with no history at all get the pooled distribution itself.
+    """
+    pooled = [0.0] * len(OFFSETS)
+    for record in history.values():
+        for offset in record["offsets"]:
+            pooled[_offset_index(offset)] += 1
+    total = sum(pooled)
+    if not total:
+        raise ValueError("No scores on record to fit players from")
+    prior = [count / total for count in pooled]
+
+    if names is None:
+        names = sorted(history)
+    return [PlayerModel.from_history(name, history.get(name, _empty_history()), prior, prior_weight)
+            for name in names]
+
+
+class PayoutEstimate:
+    """Expected payout per round for each player under one voor setting."""
+
+    def __init__(self, players, voor, mean, stderr, rounds):
+        self.players = players  # player names in simulation order
+        self.voor = voor  # player: {opponent: voor received}
+        self.mean = mean  # player: expected payout per round (positive: receives)
+        self.stderr = stderr  # player: standard error of the mean
+        self.rounds = rounds
+
+    @property
+    def spread(self):
+        """Root mean square of the expected payouts: 0 when every player breaks even."""
+        return math.sqrt(sum(value ** 2 for value in self.mean.values()) / len(self.mean))
+
+    def to_dict(self):
+        return {
+            "rounds": self.rounds,
+            "voor": self.voor,
+            "mean": self.mean,
+            "stderr": self.stderr,
+            "spread": self.spread
+        }
+
+
+class VoorSearchResult:
+    def __init__(self, estimate, baseline, candidates, elapsed):
+        self.estimate = estimate  # PayoutEstimate for the best voor found
+        self.baseline = baseline  # PayoutEstimate for the voor the search started from
+        self.candidates = candidates  # voor settings compared
+        self.elapsed = elapsed
+
+    @property
+    def voor(self):
+        return self.estimate.voor
+
+    def to_dict(self):
+        return {
+            "best": self.estimate.to_dict(),
+            "baseline": self.baseline.to_dict(),
+            "candidates": self.candidates,
+            "elapsed": self.elapsed
+        }
+
+
+class VoorSimulator:
+    """Plays simulated rounds for a group of players on one course.
+
+    pars has one entry per hole; values is the hole value, either one number
+    for every hole or one per hole. scoring_type names a rule set in
+    src.models.scoring; scoring_rules, if given, is used instead. With
+    processes=1 everything runs in the calling process.
+    """
+
+    def __init__(self, players, pars=DEFAULT_PARS, values=10, game_mode="face_to_face",
+                 scoring_type="par", buchi_enabled=False, rounds=1000000, processes=None, seed=0,
+                 scoring_rules=None):
+        if not available():
+            raise RuntimeError("The simulator needs NumPy (pip install numpy)")
+        if len(players) < 2:
+            raise ValueError("A simulation needs at least two players")
+        if isinstance(values, (int, float)):
+            values = [values] * len(pars)
+        if len(values) != len(pars):
+            raise ValueError("Give one hole value per par")
+
+        self.players = list(players)
+        self.names = [player.name for player in self.players]
+        self.rounds = rounds
+        self.processes = processes
+        self.spec = {
+            "cdf": np.cumsum([player.probabilities for player in self.players], axis=1),
+            "buchi_rates": np.array([player.buchi_rate for player in self.players]),
+            "buchi_win_rates": np.array([player.buchi_win_rate for player in self.players]),
+            "pars": np.asarray(pars, dtype=np.int64),
+            "values": np.asarray(values, dtype=np.float64),
+            "game_mode": game_mode,
+            "scoring_table": compile_rules(scoring_rules or named_rules(scoring_type)),
+            "buchi_enabled": buchi_enabled,
+            "seed": seed
+        }
+        self.pool = None
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # Public API
+
+    def evaluate(self, voor=None):
+        """Expected payout per round for every player with the given voor ({player: {opponent: n}})."""
+        matrix = self.voor_matrix(voor)
+        sums, squares = self._run(_evaluate_chunk, [matrix])
+        return self._estimate(matrix, sums[0], squares[0])
+
+    def search(self, voor=None):
+        """Find the voor (0 to 2 strokes per pair) that makes expected payouts as equal as possible.
+
+        Payouts add up to zero, so this minimizes the sum of their squares.
+        voor is the starting point reported as the baseline (default: none).
+        """
+        start = time.perf_counter()
+        if self.spec["game_mode"] == "face_to_face":
+            best, candidates = self._search_face_to_face()
+        else:
+            best, candidates = self._search_single_winner()
+
+        # One more pass over the same rounds for the standard errors of both settings
+        matrices = [self.voor_matrix(voor), best]
+        sums, squares = self._run(_evaluate_chunk, matrices)
+        baseline, estimate = [self._estimate(*arrays) for arrays in zip(matrices, sums, squares)]
+        return VoorSearchResult(estimate, baseline, candidates, time.perf_counter() - start)
+
+    def voor_matrix(self, voor):
+        """voor as a players x players array: [i, j] is the voor player i receives against player j."""
+        size = len(self.names)
+        matrix = np.zeros((size, size), dtype=np.int64)
+        for i, name in enumerate(self.names):
+            adjustments = (voor or {}).get(name, {})
+            for j, opponent in enumerate(self.names):
+                if i != j:
+                    matrix[i, j] = adjustments.get(opponent, 0)
+        return matrix
+
+    def voor_dict(self, matrix):
+        """The non-zero entries of a voor matrix, in the Game.to_dict "voor" format."""
+        voor = {}
+        for i, name in enumerate(self.names):
+            adjustments = {self.names[j]: int(matrix[i, j]) for j in range(len(self.names))
+                           if i != j and matrix[i, j]}
+            if adjustments:
+                voor[name] = adjustments
+        return voor
+
+    # Searches
+
+    def _search_face_to_face(self):
+        gains, buchi = self._run(_pair_table_chunk)
+        levels = len(VOOR_LEVELS) * 2 - 1
+        shift = max(VOOR_LEVELS)  # gains[i, j, d + shift]: i's gains from j when V[i, j] - V[j, i] == d
+        base = buchi / self.rounds
+        gains = gains / self.rounds
+        pairs = list(itertools.combinations(range(len(self.names)), 2))
+
+        def payouts(choice):
+            # choice: (candidates, pairs) array of indices into the difference axis
+            result = np.tile(base, (choice.shape[0], 1))
+            for pair, (i, j) in enumerate(pairs):
+                gain = gains[i, j, choice[:, pair]]
+                result[:, i] += gain
+                result[:, j] -= gain
+            return result
+
+        if levels ** len(pairs) <= EXHAUSTIVE_LIMIT:
+            choices = np.array(np.unravel_index(np.arange(levels ** len(pairs)), (levels,) * len(pairs))).T
+            objective = (payouts(choices) ** 2).sum(axis=1)
+            best = _least_voor(choices, objective, shift)
+            candidates = len(choices)
+        else:
+            # Coordinate descent from every pair being as fair as it can be on its own
+            best = np.array([np.abs(gains[i, j]).argmin() for i, j in pairs])
+            current = (payouts(best[None, :]) ** 2).sum()
+            candidates = 1
+            improved = True
+            while improved:
+                improved = False
+                for pair in range(len(pairs)):
+                    trial = np.tile(best, (levels, 1))
+                    trial[:, pair] = np.arange(levels)
+                    objective = (payouts(trial) ** 2).sum(axis=1)
+                    candidates += levels
+                    if objective.min() < current - 1e-12:
+                        best = trial[objective.argmin()]
+                        current = objective.min()
+                        improved = True
+
+        matrix = np.zeros((len(self.names), len(self.names)), dtype=np.int64)
+        for pair, (i, j) in enumerate(pairs):
+            difference = int(best[pair]) - shift
+            matrix[i, j] = max(difference, 0)
+            matrix[j, i] = max(-difference, 0)
+        return matrix, candidates
+
+    def _search_single_winner(self):
+        size = len(self.names)
+        choices = np.array(list(itertools.product(range(len(VOOR_LEVELS)), repeat=size)))
+        levels = np.asarray(VOOR_LEVELS)
+
+        if len(OFFSETS) ** size <= HISTOGRAM_LIMIT:
+            counts, buchi = self._run(_score_histogram_chunk)
+            table = _ScoreTable(self.spec, size, counts)
+            base = buchi / self.rounds
+            objective = np.array([((table.payouts(levels[choice]) / self.rounds + base) ** 2).sum()
+                                  for choice in choices])
+            best = _least_voor(choices, objective, 0)
+            candidates = len(choices)
+        else:
+            # Too many score combinations to count: compare neighbouring voor settings directly
+            best = np.zeros(size, dtype=np.int64)
+            current = None
+            candidates = 0
+            while True:
+                trials = [best]
+                for i in range(size):
+                    for step in (-1, 1):
+                        if 0 <= best[i] + step < len(VOOR_LEVELS):
+                            trial = best.copy()
+                            trial[i] += step
+                            trials.append(trial)
+                sums, _ = self._run(_evaluate_chunk, [self._effective_matrix(levels[t]) for t in trials])
+                objective = ((sums / self.rounds) ** 2).sum(axis=1)
+                candidates += len(trials)
+                if current is not None and objective.min() >= current - 1e-12:
+                    break
+                best = trials[int(objective.argmin())]
+                current = objective.min()
+
+        return self._effective_matrix(levels[best]), candidates
+
+    def _effective_matrix(self, effective):
+        # Single winner only uses the most voor a player gets from anyone, so give it against everyone
+        matrix = np.repeat(np.asarray(effective, dtype=np.int64)[:, None], len(self.names), axis=1)
+        np.fill_diagonal(matrix, 0)
+        return matrix
+
+    # Running chunks
+
+    def _tasks(self, *args):
+        chunks = -(-self.rounds // CHUNK_ROUNDS)
+        for chunk in range(chunks):
+            size = min(CHUNK_ROUNDS, self.rounds - chunk * CHUNK_ROUNDS)
+            yield (self.spec, chunk, size) + args
+
+    def _run(self, worker, *args):
+        """Run worker over every chunk and add up the arrays it returns."""
+        if self.processes == 1:
+            results = map(worker, self._tasks(*args))
+        else:
+            if self.pool is None:
+                self.pool = multiprocessing.Pool(processes=self.processes)
+            results = self.pool.imap_unordered(worker, self._tasks(*args))
+
+        totals = None
+        for result in results:
+            if totals is None:
+                totals = [np.array(part, dtype=np.float64) for part in result]
+            else:
+                for total, part in zip(totals, result):
+                    total += part
+        return totals
+
+    def _estimate(self, matrix, sums, squares):
+        mean = sums / self.rounds
+        variance = np.maximum(squares / self.rounds - mean ** 2, 0.0)
+        stderr = np.sqrt(variance / self.rounds)
+        return PayoutEstimate(
+            self.names, self.voor_dict(matrix),
+            {name: float(value) for name, value in zip(self.names, mean)},
+            {name: float(value) for name, value in zip(self.names, stderr)},
+            self.rounds)
+
+
+def _least_voor(choices, objective, shift):
+    """The best choice, preferring the fewest voor strokes among (near) ties."""
+    best = objective.min()
+    tied = np.nonzero(objective <= best + 1e-9 * max(1.0, abs(best)))[0]
+    strokes = np.abs(choices[tied] - shift).sum(axis=1)
+    return choices[tied[strokes.argmin()]]
+
+
+# Worker side: everything below runs inside the pool processes
+
+def _chunk_rng(spec, chunk, stream):
+    return np.random.default_rng([spec["seed"], chunk, stream])
+
+
+def _sample_scores(spec, chunk, size):
+    """(rounds, holes, players) indices into OFFSETS and the matching raw scores."""
+    rng = _chunk_rng(spec, chunk, 0)
+    thresholds = spec["cdf"][:, :-1].astype(np.float32)
+    draws = rng.random((size, len(spec["pars"]), thresholds.shape[0]), dtype=np.float32)
+    # Inverse CDF: count the thresholds each draw passes
+    indices = np.zeros(draws.shape, dtype=np.int8)
+    for column in range(thresholds.shape[1]):
+        indices += draws >= thresholds[:, column]
+    scores = np.maximum(indices + (spec["pars"][None, :, None] + OFFSETS[0]), 1).astype(np.int8)
+    return indices, scores
+
+
+def _highest_score(pars):
+    return int(np.max(pars)) + OFFSETS[-1]
+
+
+def _multiplier_lookup(pars, scoring_table):
+    """[par index, score - LOWEST_SCORE]: the winner's multiplier, from the game's own table."""
+    scores = np.arange(LOWEST_SCORE, _highest_score(pars) + 1)
+    return np.array([multipliers(scores, par, scoring_table) for par in np.asarray(pars).tolist()],
+                    dtype=np.float64)
+
+
+def _hole_payments(spec):
+    """[hole, score - LOWEST_SCORE]: what a winner with that score collects from each loser."""
+    return spec["values"][:, None] * _multiplier_lookup(spec["pars"], spec["scoring_table"])
+
+
+def _buchi_payouts(spec, chunk, size):
+    """(rounds, players) buchi winnings; losers pay every winner the hole value."""
+    players = len(spec["buchi_rates"])
+    if not spec["buchi_enabled"]:
+        return np.zeros((size, players))
+    rng = _chunk_rng(spec, chunk, 1)
+    holes = len(spec["pars"])
+    played = rng.random((size, holes, players), dtype=np.float32) < spec["buchi_rates"]
+    won = played & (rng.random((size, holes, players), dtype=np.float32) < spec["buchi_win_rates"])
+    winners = won.sum(axis=2, dtype=np.int8)
+    participants = played.sum(axis=2, dtype=np.int8)
+    # No payments when nobody or every participant won
+    settled = (winners > 0) & (winners < participants)
+    # A winner collects the hole value from every loser, a loser pays every winner
+    shares = won * participants[:, :, None] - played * winners[:, :, None]
+    return np.einsum("rhp,rh,h->rp", shares, settled, spec["values"])
+
+
+def _round_payouts(spec, scores, payments, matrix):
+    """(rounds, players) main game winnings under one voor matrix, hole by hole as the Game scores them."""
+    size, holes, players = scores.shape
+    hole_index = np.arange(holes)[None, :]
+    totals = np.zeros((size, players))
+
+    if spec["game_mode"] == "face_to_face":
+        # What each player collects from a beaten opponent, by their raw score
+        collect = payments[np.arange(holes)[None, :, None], scores - LOWEST_SCORE]
+        for i, j in itertools.combinations(range(players), 2):
+            difference = scores[:, :, i].astype(np.int64) - scores[:, :, j]
+            margin = matrix[i, j] - matrix[j, i]
+            gain = (np.where(difference < margin, collect[:, :, i], 0.0)
+                    - np.where(difference > margin, collect[:, :, j], 0.0)).sum(axis=1)
+            totals[:, i] += gain
+            totals[:, j] -= gain
+        return totals
+
+    # Single winner: scores adjusted by each player's effective voor, a unique lowest score wins
+    adjusted = scores - matrix.max(axis=1)[None, None, :]
+    lowest = adjusted.min(axis=2)
+    unique = (adjusted == lowest[:, :, None]).sum(axis=2) == 1
+    winner = adjusted.argmin(axis=2)
+    payment = np.where(unique, payments[hole_index, lowest - LOWEST_SCORE], 0.0)
+    won = winner[:, :, None] == np.arange(players)
+    return (won * payment[:, :, None]).sum(axis=1) * players - payment.sum(axis=1)[:, None]
+
+
+def _evaluate_chunk(task):
+    """Sum and sum of squares of every player's round payout, for each voor matrix."""
+    spec, chunk, size, matrices = task
+    _, scores = _sample_scores(spec, chunk, size)
+    payments = _hole_payments(spec)
+    buchi = _buchi_payouts(spec, chunk, size)
+    sums = []
+    squares = []
+    for matrix in matrices:
+        totals = _round_payouts(spec, scores, payments, matrix) + buchi
+        sums.append(totals.sum(axis=0))
+        squares.append((totals ** 2).sum(axis=0))
+    return np.array(sums), np.array(squares)
+
+
+def _pair_table_chunk(task):
+    """[i, j, d + 2]: i's winnings from j when i gets d more voor from j than j gets from i."""
+    spec, chunk, size = task
+    _, scores = _sample_scores(spec, chunk, size)
+    payments = _hole_payments(spec)
+    holes, players = scores.shape[1:]
+    collect = payments[np.arange(holes)[None, :, None], scores - LOWEST_SCORE]
+
+    shift = max(VOOR_LEVELS)
+    margins = np.arange(-shift, shift + 1)
+    spread = _highest_score(spec["pars"]) - 1  # largest raw score difference
+    table = np.zeros((players, players, len(margins)))
+    for i, j in itertools.combinations(range(players), 2):
+        # Winnings of each side by raw score difference, then summed for each voor margin
+        difference = (scores[:, :, i].astype(np.int64) - scores[:, :, j] + spread).ravel()
+        i_collects = np.bincount(difference, weights=collect[:, :, i].ravel(), minlength=2 * spread + 1)
+        j_collects = np.bincount(difference, weights=collect[:, :, j].ravel(), minlength=2 * spread + 1)
+        i_below = np.concatenate(([0.0], np.cumsum(i_collects)))  # i_below[k]: difference < k - spread
+        j_above = np.cumsum(j_collects[::-1])[::-1]  # j_above[k]: difference >= k - spread
+        j_above = np.concatenate((j_above, [0.0]))
+        for index, margin in enumerate(margins):
+            gain = i_below[margin + spread] - j_above[margin + spread + 1]
+            table[i, j, index] = gain
+            table[j, i, len(margins) - 1 - index] = -gain
+    return table, _buchi_payouts(spec, chunk, size).sum(axis=0)
+
+
+class _ScoreTable:
+    """The (par, combination of offsets) cells that came up, for scoring single winner counts."""
+
+    def __init__(self, spec, players, counts):
+        pars = np.unique(spec["pars"])
+        par_index, cell = np.nonzero(counts)
+        combos = np.array(np.unravel_index(cell, (len(OFFSETS),) * players)).T
+        self.scores = np.maximum(combos + OFFSETS[0] + pars[par_index][:, None], 1).astype(np.int8)
+        self.par_index = par_index
+        self.counts = counts[par_index, cell]  # hole values summed over every time the cell came up
+        self.multipliers = _multiplier_lookup(pars, spec["scoring_table"])
+
+    def payouts(self, effective):
+        """Total winnings per player with the given effective voor per player."""
+        players = self.scores.shape[1]
+        adjusted = self.scores - np.asarray(effective, dtype=np.int8)
+        lowest = adjusted.min(axis=1)
+        unique = (adjusted == lowest[:, None]).sum(axis=1) == 1
+        winner = adjusted.argmin(axis=1)
+        weight = np.where(unique, self.counts * self.multipliers[self.par_index, lowest - LOWEST_SCORE], 0.0)
+        return np.bincount(winner, weights=weight, minlength=players) * players - weight.sum()
+
+
+def _score_histogram_chunk(task):
+    """Hole values summed by (par, combination of offsets), for the single winner search."""
+    spec, chunk, size = task
+    indices, _ = _sample_scores(spec, chunk, size)
+    players = indices.shape[2]
+    pars = np.unique(spec["pars"])
+    par_index = np.searchsorted(pars, spec["pars"])
+    combination = np.zeros(indices.shape[:2], dtype=np.int64)
+    for player in range(players):
+        combination = combination * len(OFFSETS) + indices[:, :, player]
+    cells = len(OFFSETS) ** players
+    cell = (par_index[None, :] * cells + combination).ravel()
+    weights = np.broadcast_to(spec["values"][None, :], indices.shape[:2]).ravel()
+    counts = np.bincount(cell, weights=weights, minlength=len(pars) * cells).reshape(len(pars), cells)
+    return counts, _buchi_payouts(spec, chunk, size).sum(axis=0)
@@ -0,0 +1,171 @@
+"""Tournament mode: many groups playing at the same time.
+
+A Tournament owns one Game per group. Holes are posted as each group
+finishes them (in the scorecard hole format used by src/models/batch.py);
+the hole's inputs are applied to the group's Game straight away and its
+payments are settled on a worker pool. collect() applies the settled holes
+that have come back and returns only the standings entries that changed,
+so a standings view can update those rows instead of recomputing every
+group whenever one group posts a hole.
+
+Holes should only be changed through post_hole: each post gets a version
+number and results for anything but the latest version of a hole are
+dropped.
+
+This module must never import PyQt5 so it can run on machines without a display.
+"""
+import logging
+import multiprocessing
+import queue
+
+from src.models.batch import default_process_count
+from src.models.game import Game
+
+logger = logging.getLogger(__name__)
+
+
+def settle_hole(task):
+    """Pool worker: the payments for one hole of one group."""
+    group_id, hole_number, version, round_data = task
+    try:
+        game = Game.from_dict(round_data)
+        game.calculate_payments_for_hole(hole_number)
+        return group_id, hole_number, version, game.holes[hole_number].payments, None
+    except Exception as e:
+        return group_id, hole_number, version, None, f"{type(e).__name__}: {e}"
+
+
+class Tournament:
+    def __init__(self, processes=None):
+        self.groups = {}  # group_id: Game
+        self.processes = processes or default_process_count()
+        self.entries = {}  # (group_id, player_name): standings entry
+        self.errors = []  # (group_id, hole_number, message) for holes that failed to settle
+        self._versions = {}  # (group_id, hole_number): latest posted version
+        self._results = queue.SimpleQueue()  # settled holes waiting to be applied
+        self._outstanding = 0
+        self._changed = set()  # standings keys changed since the last collect()
+        self._pool = None
+
+    def add_group(self, group_id, game):
+        if group_id in self.groups:
+            raise ValueError(f"Group {group_id!r} already exists")
+        self.groups[group_id] = game
+        self._refresh_group(group_id)
+        return game
+
+    def create_group(self, group_id, round_data):
+        """Add a group from a round dictionary (settings, players and voor; holes are optional)."""
+        game = Game.from_dict(round_data)
+        for hole_number in game.holes:
+            game.calculate_payments_for_hole(hole_number)
+        return self.add_group(group_id, game)
+
+    def post_hole(self, group_id, hole_data):
+        """Record a finished hole for a group and queue it for settlement."""
+        game = self.groups[group_id]
+        hole_number = hole_data["hole"]
+
+        game.add_hole(hole_number, hole_data.get("value", 0), hole_data.get("par", 0))
+        for player_name, score in hole_data.get("scores", {}).items():
+            game.set_player_score(hole_number, player_name, score)
+        buchi = hole_data.get("buchi", {})
+        for player_name in buchi.get("participants", []):
+            game.set_buchi_participation(hole_number, player_name, True)
+        for player_name in buchi.get("winners", []):
+            game.set_buchi_win(hole_number, player_name, True)
+        if game.current_hole <= hole_number:
+            game.current_hole = hole_number + 1
+
+        version = self._versions.get((group_id, hole_number), 0) + 1
+        self._versions[(group_id, hole_number)] = version
+        task = (group_id, hole_number, version, game.to_dict(hole_numbers={hole_number}))
+
+        self._outstanding += 1
+        if self.processes == 1:
+            self._results.put(settle_hole(task))
+        else:
+            self._get_pool().apply_async(settle_hole, (task,), callback=self._results.put)
+
+        # Strokes and holes played change now; net follows when the payments come back
+        self._refresh_group(group_id)
+
+    def collect(self, wait=False):
+        """Apply the holes settled so far and return the standings keys that changed.
+
+        With wait=True, blocks until every posted hole has been settled.
+        """
+        while self._outstanding:
+            try:
+                result = self._results.get(block=wait)
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            self._apply(*result)
+
+        changed, self._changed = self._changed, set()
+        return changed
+
+    @property
+    def pending(self):
+        """Number of posted holes not yet applied."""
+        return self._outstanding
+
+    def standings(self):
+        """Every player in the tournament, best net first."""
+        return sorted(self.entries.values(),
+                      key=lambda entry: (-entry["net"], entry["strokes"], str(entry["group"]), entry["player"]))
+
+    def finish(self):
+        """Settle every group's final payments once all holes are in."""
+        self.collect(wait=True)
+        final_payments = {}
+        for group_id, game in self.groups.items():
+            # Every hole is already in the ledger, so this only finds the transfers
+            game.calculate_all_payments()
+            final_payments[group_id] = game.final_payments
+        return final_payments
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(processes=self.processes)
+        return self._pool
+
+    def _apply(self, group_id, hole_number, version, payments, error):
+        if version != self._versions.get((group_id, hole_number)):
+            return  # the hole was posted again since; a newer result is on its way
+        if error is not None:
+            logger.error("Could not settle hole %s of group %s: %s", hole_number, group_id, error)
+            self.errors.append((group_id, hole_number, error))
+            return
+        self.groups[group_id].record_hole_payments(hole_number, payments)
+        self._refresh_group(group_id)
+
+    def _refresh_group(self, group_id):
+        """Update the standings entries of one group's players."""
+        game = self.groups[group_id]
+        matrix = game.score_matrix
+        for player_name in game.players:
+            entry = {
+                "group": group_id,
+                "player": player_name,
+                "holes": matrix.scored_hole_count(player_name),
+                "strokes": matrix.total(player_name),
+                "net": game.ledger.balances.get(player_name, 0)  # minor units
+            }
+            key = (group_id, player_name)
+            if self.entries.get(key) != entry:
+                self.entries[key] = entry
+                self._changed.add(key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
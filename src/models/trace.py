@@ -0,0 +1,52 @@
+import json
+
+
+class CalculationTrace:
+    """Opt-in record of how each hole's payments were decided.
+
+    Every entry is a flat dictionary with at least "hole" and "kind"
+    ("single_winner", "face_to_face" or "buchi"). Payment decisions carry the
+    winner, loser, scores, multiplier and payment (in minor units, as in the
+    ledger); holes or pairs that did not pay out carry a "result" explaining
+    why (e.g. "tie", "above_par").
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def record(self, hole_number, kind, **fields):
+        entry = {"hole": hole_number, "kind": kind}
+        entry.update(fields)
+        self.entries.append(entry)
+
+    def discard_hole(self, hole_number):
+        """Drop entries for a hole that is about to be recalculated."""
+        self.entries = [entry for entry in self.entries if entry["hole"] != hole_number]
+
+    def query(self, hole_number=None, player=None, kind=None):
+        """Entries matching every given filter; player matches winner or loser."""
+        results = []
+        for entry in self.entries:
+            if hole_number is not None and entry["hole"] != hole_number:
+                continue
+            if kind is not None and entry["kind"] != kind:
+                continue
+            if player is not None and player not in (entry.get("winner"), entry.get("loser")):
+                continue
+            results.append(entry)
+        return results
+
+    def write_jsonl(self, f, **extra):
+        """Write one JSON line per entry to an open file, adding any extra fields."""
+        for entry in self.entries:
+            if extra:
+                entry = dict(extra, **entry)
+            f.write(json.dumps(entry))
+            f.write("\n")
+
+    def dump_jsonl(self, path):
+        with open(path, "w") as f:
+            self.write_jsonl(f)
+
+    def clear(self):
+        self.entries = []
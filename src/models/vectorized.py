@@ -0,0 +1,135 @@
+"""NumPy kernels for the per-hole payment calculations.
+
+NumPy is optional. When it is not installed `available()` returns False and
+Game keeps using the scalar code paths.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from src.models import money
+from src.models.scoring import LOWEST_OFFSET, HIGHEST_OFFSET
+
+
+def available():
+    """Return True if the vectorized kernels can be used."""
+    return np is not None
+
+
+def score_vector(game, hole, players):
+    """Raw scores for the hole, one entry per player (missing scores count as 0)."""
+    matrix = hole.score_matrix
+    if list(matrix.player_index) == players:
+        # The score matrix row is already in player order
+        return np.frombuffer(matrix.row(hole.hole_number), dtype=np.intc).astype(np.int64)
+    return np.fromiter(
+        (hole.player_scores.get(player, 0) for player in players),
+        dtype=np.int64, count=len(players))
+
+
+def voor_matrix(game, players):
+    """V[i, j] is the voor player i receives against player j."""
+    size = len(players)
+    matrix = np.zeros((size, size), dtype=np.int64)
+    for i, player in enumerate(players):
+        adjustments = game.players[player].voor_adjustments
+        if not adjustments:
+            continue
+        for j, opponent in enumerate(players):
+            if i != j:
+                matrix[i, j] = adjustments.get(opponent, 0)
+    return matrix
+
+
+def table_indices(scores, par, scoring_table):
+    """Index into scoring_table.table for each possible winner score.
+
+    A hole in one indexes one past the end, where multipliers() puts the
+    table's hole-in-one multiplier.
+    """
+    indices = np.clip(scores - par, LOWEST_OFFSET, HIGHEST_OFFSET) - LOWEST_OFFSET
+    if scoring_table.hole_in_one is not None:
+        indices = np.where(scores == 1, len(scoring_table.table), indices)
+    return indices
+
+
+def multipliers(scores, par, scoring_table):
+    """The winner's multiplier for each possible winner score, as Python numbers."""
+    lookup = scoring_table.table + [scoring_table.hole_in_one]
+    return [lookup[index] for index in table_indices(scores, par, scoring_table).tolist()]
+
+
+def face_to_face_payments(game, hole):
+    """Vectorized equivalent of Game._calculate_face_to_face_payments.
+
+    The adjusted-score matrix is A[i, j] = score[i] - V[i, j]; player i beats
+    player j when A[i, j] < A[j, i]. Payments are recorded pair by pair in the
+    same order as the scalar path so HoleData.payments comes out identical.
+    """
+    players = list(game.players.keys())
+    if len(players) < 2:
+        return
+
+    scores = score_vector(game, hole, players)
+    adjusted = scores[:, None] - voor_matrix(game, players)
+
+    # wins[i, j] is True when i beats j; only look at each pair once (i < j)
+    wins = adjusted < adjusted.T
+    decided = np.triu(wins | wins.T, k=1)
+
+    payments = [money.payment(hole.value, multiplier) if multiplier else None
+                for multiplier in multipliers(scores, hole.par, game.scoring_table)]
+
+    rows, cols = np.nonzero(decided)
+    row_wins = wins[rows, cols].tolist()
+    for i, j, i_wins in zip(rows.tolist(), cols.tolist(), row_wins):
+        if i_wins:
+            winner, loser = i, j
+        else:
+            winner, loser = j, i
+
+        payment = payments[winner]
+        if payment is None:
+            continue
+
+        winner_name = players[winner]
+        loser_name = players[loser]
+
+        # Clear any existing payment between these players before recording new one
+        if loser_name in hole.payments and winner_name in hole.payments[loser_name]:
+            del hole.payments[loser_name][winner_name]
+
+        hole.record_payment(loser_name, winner_name, payment)
+
+
+def check_face_to_face_equivalence(game, hole_number):
+    """Run both face-to-face paths on copies of a hole and compare the payments.
+
+    Returns a tuple (equivalent, scalar_payments, vectorized_payments). The
+    game's own HoleData is left untouched.
+    """
+    from src.models.game import HoleData
+
+    source = game.holes[hole_number]
+
+    def blank_copy():
+        # The copy has its own score matrix, so filling it leaves the game alone
+        hole = HoleData(source.hole_number, source.value, source.par)
+        for player_name, score in source.player_scores.items():
+            hole.score_matrix.set(hole.hole_number, player_name, score)
+        return hole
+
+    # Keep the comparison run out of the game's calculation trace
+    trace = game.trace
+    game.trace = None
+    try:
+        scalar_hole = blank_copy()
+        game._calculate_face_to_face_payments(scalar_hole)
+    finally:
+        game.trace = trace
+
+    vector_hole = blank_copy()
+    face_to_face_payments(game, vector_hole)
+
+    return scalar_hole.payments == vector_hole.payments, scalar_hole.payments, vector_hole.payments
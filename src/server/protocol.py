@@ -0,0 +1,186 @@
+"""Just enough HTTP/1.1 and WebSocket (RFC 6455) on asyncio streams for the scoring server.
+
+Standard library only, so the server runs offline on any machine that can
+run the models. Requests are read with keep-alive; WebSocket support covers
+text frames, ping/pong and close, which is all the scoring clients use.
+"""
+import base64
+import hashlib
+import json
+import struct
+from urllib.parse import urlsplit, parse_qs
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_BODY = 1024 * 1024
+MAX_FRAME = 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    101: "Switching Protocols",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error"
+}
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+OPCODES = (OPCODE_CONTINUATION, OPCODE_TEXT, OPCODE_BINARY, OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG)
+
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_TOO_BIG = 1009
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class HttpRequest:
+    def __init__(self, method, target, version, headers, body):
+        self.method = method
+        self.version = version
+        self.headers = headers  # lower-case name: value
+        self.body = body
+        parts = urlsplit(target)
+        self.path = parts.path
+        self.query = parse_qs(parts.query)
+
+    @property
+    def segments(self):
+        return [segment for segment in self.path.split("/") if segment]
+
+    @property
+    def keep_alive(self):
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    @property
+    def is_websocket(self):
+        return (self.headers.get("upgrade", "").lower() == "websocket"
+                and "sec-websocket-key" in self.headers)
+
+    def json(self):
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except ValueError as e:
+            raise HttpError(400, f"Invalid JSON body: {e}")
+        if not isinstance(data, dict):
+            raise HttpError(400, "Body must be a JSON object")
+        return data
+
+
+async def read_request(reader):
+    """Read one request from the stream; None when the client closed the connection."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise HttpError(400, "Invalid Content-Length")
+    if length > MAX_BODY:
+        raise HttpError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return HttpRequest(method.upper(), target, version, headers, body)
+
+
+def encode_response(status, body=b"", content_type="application/json", keep_alive=True):
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def json_body(data):
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def websocket_accept_response(request):
+    """The 101 response completing a WebSocket handshake."""
+    key = request.headers["sec-websocket-key"]
+    accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+    return ("HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode("latin-1")
+
+
+def encode_frame(payload, opcode=OPCODE_TEXT, mask_key=None):
+    """One unfragmented frame. Servers send unmasked frames; clients pass a 4-byte mask_key."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    length = len(payload)
+    mask_bit = 0x80 if mask_key else 0
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, length)
+    if mask_key:
+        return header + mask_key + _mask(payload, mask_key)
+    return header + payload
+
+
+async def read_frame(reader, from_client=False):
+    """Read one frame; returns (opcode, payload bytes).
+
+    Frames from a client (from_client) must be masked, as RFC 6455 requires.
+    """
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    if opcode not in OPCODES:
+        raise HttpError(400, f"Unknown WebSocket opcode {opcode:#x}")
+    masked = second & 0x80
+    if from_client and not masked:
+        raise HttpError(400, "WebSocket frames from a client must be masked")
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_FRAME:
+        raise HttpError(413, "WebSocket frame too large")
+    mask_key = await reader.readexactly(4) if masked else None
+    payload = await reader.readexactly(length)
+    if mask_key:
+        payload = _mask(payload, mask_key)
+    return opcode, payload
+
+
+def _mask(payload, mask_key):
+    # XOR with the repeated 4-byte key, done on whole integers rather than byte by byte
+    repeated = (mask_key * (len(payload) // 4 + 1))[:len(payload)]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(len(payload), "big")
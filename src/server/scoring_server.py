@@ -0,0 +1,384 @@
+"""Local scoring server so several devices can enter scores into the same games.
+
+Endpoints (JSON in and out):
+
+    GET  /games                 id, players and version of every game
+    POST /games                 create a game from a round dictionary (see batch.py; "holes" optional)
+    GET  /games/<id>            the game's inputs, hole payments, final payments and balances
+    POST /games/<id>/holes      {"hole": 3, "value": 10, "par": 4}
+    POST /games/<id>/scores     {"hole": 3, "scores": {"Player 1": 4}} or {"hole": 3, "player": ..., "score": 4}
+    POST /games/<id>/voor       {"player": ..., "opponent": ..., "adjustment": 1}
+    POST /games/<id>/buchi      {"hole": 3, "participants": [...], "winners": [...]} (replaces the hole's buchi)
+    GET  /games/<id>/ws         WebSocket: the current settlement, then one message per change
+
+Writes to a game are serialized by that game's lock. A write applies its
+change, re-settles what it touched (a hole once every player has a score,
+or every hole after a voor change) and finds the final transfers (on a
+worker thread for big groups), then commits: the new state becomes what readers see and is
+pushed to the game's subscribers. Readers never take the lock; they get
+the state of the last committed write, so they are never held up by a
+write in progress and never see half of one. Amounts are sent in major
+units, like the hole values.
+
+Standard library only; bind to 127.0.0.1 for one machine or 0.0.0.0 for the LAN.
+"""
+import asyncio
+import logging
+
+from src.models import money, settlement
+from src.models.game import Game
+from src.server.protocol import (
+    HttpError, read_request, encode_response, json_body, websocket_accept_response,
+    encode_frame, read_frame, OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG, CLOSE_PROTOCOL_ERROR, CLOSE_TOO_BIG
+)
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 64  # pending updates per WebSocket client before the oldest are dropped
+# Settling up to this many players takes well under a millisecond, less than handing it to a thread
+INLINE_SETTLEMENT_PLAYERS = 8
+
+
+class GameSession:
+    """One game on the server with its write lock, committed state and subscribers."""
+
+    def __init__(self, game_id, game):
+        self.game_id = game_id
+        self.game = game
+        self.lock = asyncio.Lock()
+        self.version = 0
+        self.subscribers = set()  # asyncio.Queue of encoded messages, one per WebSocket client
+        self.state = None  # the last committed state, as served to readers
+        self._state_body = None  # self.state encoded, built on first read
+        self._holes = {}  # hole_number: committed hole dictionary (as in Game.to_dict)
+        self._hole_payments = {}  # str(hole_number): committed payments, in major units
+
+    def commit(self, hole_number=None):
+        """Make the game as it is now visible to readers and push it to subscribers.
+
+        hole_number is the only hole the write changed; None means any of them may have.
+        """
+        game = self.game
+        self.version += 1
+
+        # Only the changed hole is serialized again; the others keep their committed copies
+        changed = None if hole_number is None else {hole_number}
+        data = game.to_dict(hole_numbers=changed)
+        if changed is None:
+            self._holes = {}
+            self._hole_payments = {}
+        for hole_data in data["holes"]:
+            number = hole_data["hole"]
+            self._holes[number] = hole_data
+            payments = game.holes[number].payments
+            if payments:
+                self._hole_payments[str(number)] = money.payments_to_major(payments)
+            else:
+                self._hole_payments.pop(str(number), None)
+        data["holes"] = [self._holes[number] for number in sorted(self._holes)]
+
+        self.state = {
+            "id": self.game_id,
+            "version": self.version,
+            "game": data,
+            "hole_payments": dict(self._hole_payments),
+            "final_payments": money.payments_to_major(game.final_payments),
+            "balances": money.balances_to_major(game.ledger.balances),
+            "settlement": game.settlement.to_dict() if game.settlement else None
+        }
+        self._state_body = None
+
+        update = json_body(self.update_message(hole_number))
+        for queue in list(self.subscribers):
+            if queue.full():
+                queue.get_nowait()  # a slow client only needs the latest settlement
+            queue.put_nowait(update)
+
+    def update_message(self, hole_number=None):
+        hole = self.game.holes.get(hole_number)
+        return {
+            "type": "settlement",
+            "game": self.game_id,
+            "version": self.version,
+            "hole": hole_number,
+            "hole_payments": self._hole_payments.get(str(hole_number), {}) if hole else None,
+            "final_payments": self.state["final_payments"],
+            "balances": self.state["balances"]
+        }
+
+    def state_body(self):
+        if self._state_body is None:
+            self._state_body = json_body(self.state)
+        return self._state_body
+
+    def summary(self):
+        return {"id": self.game_id, "players": list(self.game.players), "version": self.version}
+
+
+class ScoringServer:
+    def __init__(self):
+        self.sessions = {}  # game_id: GameSession
+        self._next_id = 1
+
+    def create_game(self, round_data):
+        """Add a game from a round dictionary and return its session."""
+        if round_data.get("id") is not None:
+            game_id = str(round_data["id"])
+            if game_id in self.sessions:
+                raise HttpError(409, f"Game {game_id} already exists")
+        else:
+            while str(self._next_id) in self.sessions:
+                self._next_id += 1
+            game_id = str(self._next_id)
+
+        try:
+            game = Game.from_dict(round_data)
+        except (KeyError, TypeError, ValueError) as e:
+            raise HttpError(400, f"Invalid game: {e}")
+        for hole_number in game.holes:
+            self._settle_hole(game, hole_number)
+        game.calculate_all_payments()
+
+        session = GameSession(game_id, game)
+        session.commit()
+        self.sessions[game_id] = session
+        return session
+
+    async def start(self, host="127.0.0.1", port=8765):
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    writer.write(encode_response(e.status, json_body({"error": e.message}), keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                if request.is_websocket:
+                    await self.serve_websocket(request, reader, writer)
+                    break
+
+                try:
+                    status, body = await self.handle_request(request)
+                except HttpError as e:
+                    status, body = e.status, json_body({"error": e.message})
+                except Exception:
+                    logger.exception("Error handling %s %s", request.method, request.path)
+                    status, body = 500, json_body({"error": "Internal server error"})
+
+                writer.write(encode_response(status, body, keep_alive=request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, request):
+        """Route one HTTP request; returns (status, encoded body)."""
+        segments = request.segments
+        if not segments or segments[0] != "games":
+            raise HttpError(404, f"No such path: {request.path}")
+
+        if len(segments) == 1:
+            if request.method == "GET":
+                return 200, json_body([session.summary() for session in self.sessions.values()])
+            if request.method == "POST":
+                session = self.create_game(request.json())
+                return 201, session.state_body()
+            raise HttpError(405, "Use GET or POST")
+
+        session = self.get_session(segments[1])
+        if len(segments) == 2:
+            if request.method != "GET":
+                raise HttpError(405, "Use GET")
+            return 200, session.state_body()
+
+        if len(segments) == 3 and request.method == "POST":
+            mutation = self.MUTATIONS.get(segments[2])
+            if mutation is not None:
+                data = request.json()
+                await self.write(session, lambda game: mutation(self, game, data))
+                return 200, session.state_body()
+        raise HttpError(404, f"No such path: {request.method} {request.path}")
+
+    def get_session(self, game_id):
+        session = self.sessions.get(game_id)
+        if session is None:
+            raise HttpError(404, f"No game {game_id}")
+        return session
+
+    async def write(self, session, mutate):
+        """Apply one mutation under the game's lock, re-settle and commit."""
+        async with session.lock:
+            game = session.game
+            hole_number = mutate(game)
+
+            balances = dict(game.ledger.balances)
+            if len(balances) <= INLINE_SETTLEMENT_PLAYERS:
+                result = settlement.settle_balances(balances)
+            else:
+                # Finding the transfers takes milliseconds for big groups; keep the loop free for readers
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(None, settlement.settle_balances, balances)
+            game.settlement = result
+            game.final_payments = result.payments
+
+            session.commit(hole_number)
+
+    async def serve_websocket(self, request, reader, writer):
+        segments = request.segments
+        if len(segments) != 3 or segments[0] != "games" or segments[2] != "ws" or segments[1] not in self.sessions:
+            writer.write(encode_response(404, json_body({"error": f"No such path: {request.path}"}),
+                                         keep_alive=False))
+            await writer.drain()
+            return
+
+        session = self.sessions[segments[1]]
+        writer.write(websocket_accept_response(request))
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        queue.put_nowait(json_body(session.update_message()))
+        session.subscribers.add(queue)
+        sender = asyncio.create_task(self._send_updates(queue, writer))
+        try:
+            while True:
+                opcode, payload = await read_frame(reader, from_client=True)
+                if opcode == OPCODE_CLOSE:
+                    writer.write(encode_frame(payload[:2], OPCODE_CLOSE))
+                    break
+                if opcode == OPCODE_PING:
+                    writer.write(encode_frame(payload, OPCODE_PONG))
+                # Clients have nothing to say over the socket; other frames are ignored
+        except HttpError as e:
+            code = CLOSE_TOO_BIG if e.status == 413 else CLOSE_PROTOCOL_ERROR
+            writer.write(encode_frame(code.to_bytes(2, "big") + e.message.encode("utf-8")[:120], OPCODE_CLOSE))
+            await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass  # the client went away without a close frame
+        finally:
+            session.subscribers.discard(queue)
+            sender.cancel()
+
+    async def _send_updates(self, queue, writer):
+        while True:
+            message = await queue.get()
+            writer.write(encode_frame(message))
+            await writer.drain()
+
+    # Mutations: validate everything first so a bad request changes nothing,
+    # then apply and return the hole that changed (None if several did)
+
+    def _set_hole(self, game, data):
+        hole_number = _require_int(data, "hole")
+        if hole_number < 1:
+            raise HttpError(400, '"hole" must be 1 or more')
+        value = _require_int(data, "value")
+        par = _require_int(data, "par")
+        if value < 0 or par < 0:
+            raise HttpError(400, '"value" and "par" cannot be negative')
+        if hole_number in game.holes:
+            game.set_hole_details(hole_number, value, par)
+        else:
+            game.add_hole(hole_number, value, par)
+        if game.current_hole <= hole_number:
+            game.current_hole = hole_number + 1
+        self._settle_hole(game, hole_number)
+        return hole_number
+
+    def _set_scores(self, game, data):
+        hole_number = self._require_hole(game, data)
+        if "scores" in data:
+            scores = data["scores"]
+            if not isinstance(scores, dict):
+                raise HttpError(400, '"scores" must be an object of player: score')
+        else:
+            scores = {data.get("player"): data.get("score")}
+        for player_name, score in scores.items():
+            _require_player(game, player_name)
+            if not isinstance(score, int) or isinstance(score, bool) or score < 1:
+                raise HttpError(400, f"Invalid score for {player_name}: {score!r}")
+
+        for player_name, score in scores.items():
+            game.set_player_score(hole_number, player_name, score)
+        self._settle_hole(game, hole_number)
+        return hole_number
+
+    def _set_voor(self, game, data):
+        player_name = _require_player(game, data.get("player"))
+        opponent_name = _require_player(game, data.get("opponent"))
+        adjustment = _require_int(data, "adjustment")
+        if adjustment < 0:
+            raise HttpError(400, '"adjustment" cannot be negative')
+        game.set_voor_adjustment(player_name, opponent_name, adjustment)
+        # Voor changes every hole's adjusted scores
+        for hole_number in game.holes:
+            self._settle_hole(game, hole_number)
+        return None
+
+    def _set_buchi(self, game, data):
+        hole_number = self._require_hole(game, data)
+        participants = data.get("participants", [])
+        winners = data.get("winners", [])
+        if not isinstance(participants, list) or not isinstance(winners, list):
+            raise HttpError(400, '"participants" and "winners" must be lists of players')
+        for player_name in participants + winners:
+            _require_player(game, player_name)
+        if any(player_name not in participants for player_name in winners):
+            raise HttpError(400, "Every buchi winner must be a participant")
+
+        # The message replaces the hole's buchi, so a wrong entry can be taken back
+        for player_name in game.players:
+            game.set_buchi_participation(hole_number, player_name, player_name in participants)
+        for player_name in game.players:
+            game.set_buchi_win(hole_number, player_name, player_name in winners)
+        self._settle_hole(game, hole_number)
+        return hole_number
+
+    MUTATIONS = {
+        "holes": _set_hole,
+        "scores": _set_scores,
+        "voor": _set_voor,
+        "buchi": _set_buchi
+    }
+
+    def _require_hole(self, game, data):
+        hole_number = _require_int(data, "hole")
+        if hole_number not in game.holes:
+            raise HttpError(404, f"No hole {hole_number}; create it with POST /games/<id>/holes")
+        return hole_number
+
+    def _settle_hole(self, game, hole_number):
+        # Scores arrive one device at a time; a hole is only settled once it is complete
+        hole = game.holes.get(hole_number)
+        if hole is not None and len(hole.player_scores) == len(game.players):
+            game.calculate_payments_for_hole(hole_number)
+
+
+def _require_int(data, key):
+    value = data.get(key)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise HttpError(400, f'"{key}" must be an integer')
+    return value
+
+
+def _require_player(game, player_name):
+    if player_name not in game.players:
+        raise HttpError(404, f"No player {player_name!r}")
+    return player_name
+
+
+async def serve(host="127.0.0.1", port=8765, rounds=()):
+    """Run a scoring server until cancelled."""
+    server = ScoringServer()
+    for round_data in rounds:
+        server.create_game(round_data)
+    listener = await server.start(host, port)
+    for socket in listener.sockets:
+        logger.info("Scoring server listening on %s:%s", *socket.getsockname()[:2])
+    async with listener:
+        await listener.serve_forever()
@@ -0,0 +1,91 @@
+"""Start-up profiling for `python main.py --profile-startup`.
+
+ImportTimer is installed at the front of sys.meta_path and times the
+execution of every module imported after it, so the report shows where
+start-up time goes without needing `python -X importtime`.
+"""
+import sys
+import time
+
+
+class _TimedLoader:
+    """Wraps a module loader to time create_module and exec_module; everything else is passed through.
+
+    Extension modules do most of their work in create_module, Python modules in exec_module.
+    """
+
+    def __init__(self, loader, timer):
+        self._loader = loader
+        self._timer = timer
+        self._start = None
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        self._timer.enter()
+        self._start = time.perf_counter()
+        try:
+            create = getattr(self._loader, "create_module", None)
+            return create(spec) if create else None
+        except BaseException:
+            self._timer.leave(spec.name, time.perf_counter() - self._start)
+            raise
+
+    def exec_module(self, module):
+        # Leave the real loader on the module for anything that inspects it later
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(module.__name__, time.perf_counter() - self._start)
+
+
+class ImportTimer:
+    """Records self and cumulative import time for each module."""
+
+    def __init__(self):
+        self.timings = []  # (module, self seconds, cumulative seconds) in completion order
+        self._child_time = []  # time spent in nested imports, one entry per open import
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def enter(self):
+        self._child_time.append(0.0)
+
+    def leave(self, name, elapsed):
+        children = self._child_time.pop()
+        if self._child_time:
+            self._child_time[-1] += elapsed
+        self.timings.append((name, elapsed - children, elapsed))
+
+    def total(self):
+        """Wall time of all top-level imports."""
+        return sum(self_time for _, self_time, _ in self.timings)
+
+    def report(self, limit=20, file=None):
+        file = file or sys.stderr
+        print(f"{'module':<45} {'self ms':>9} {'cumulative ms':>14}", file=file)
+        for name, self_time, cumulative in sorted(self.timings, key=lambda t: -t[1])[:limit]:
+            print(f"{name:<45} {self_time * 1000:>9.2f} {cumulative * 1000:>14.2f}", file=file)
+        print(f"{len(self.timings)} modules imported in {self.total() * 1000:.1f} ms", file=file)
@@ -24,10 +24,10 @@ class BuchiScreen(QWidget):
         main_layout.setContentsMargins(30, 30, 30, 30)
         
         # Header
-        header_label = QLabel(f"Buchi for Hole {self.hole_number}")
-        header_label.setObjectName("headerLabel")
-        header_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(header_label)
+        self.header_label = QLabel(f"Buchi for Hole {self.hole_number}")
+        self.header_label.setObjectName("headerLabel")
+        self.header_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.header_label)
         
         # Card-style form container
         form_container = QWidget()
@@ -36,15 +36,10 @@ class BuchiScreen(QWidget):
         
         # Buchi participants group
         participants_group = QGroupBox("Who played Buchi?")
-        participants_layout = QVBoxLayout()
+        self.participants_layout = QVBoxLayout()
+        self.create_participant_checkboxes()
         
-        # Add checkbox for each player
-        for player_name in self.game.players:
-            checkbox = QCheckBox(player_name)
-            self.participant_checkboxes[player_name] = checkbox
-            participants_layout.addWidget(checkbox)
-        
-        participants_group.setLayout(participants_layout)
+        participants_group.setLayout(self.participants_layout)
         form_layout.addWidget(participants_group)
         
         # Buchi winners group (initially hidden, will be shown if needed)
@@ -56,10 +51,6 @@ class BuchiScreen(QWidget):
         self.winners_group.hide()  # Hide initially
         form_layout.addWidget(self.winners_group)
         
-        # Connect participant checkboxes to update winners
-        for checkbox in self.participant_checkboxes.values():
-            checkbox.stateChanged.connect(self.update_winner_options)
-        
         main_layout.addWidget(form_container)
         
         # Buttons
@@ -74,6 +65,34 @@ class BuchiScreen(QWidget):
         # Set the layout
         self.setLayout(main_layout)
     
+    def create_participant_checkboxes(self):
+        """Add a checkbox for each player, updating the winner options when toggled."""
+        for player_name in self.game.players:
+            checkbox = QCheckBox(player_name)
+            checkbox.stateChanged.connect(self.update_winner_options)
+            self.participant_checkboxes[player_name] = checkbox
+            self.participants_layout.addWidget(checkbox)
+    
+    def reset(self, game, hole_number):
+        """Reuse this screen for another hole (and possibly another game)."""
+        self.game = game
+        self.hole_number = hole_number
+        self.header_label.setText(f"Buchi for Hole {hole_number}")
+        
+        if list(self.participant_checkboxes) != list(game.players):
+            # Different players: rebuild the participant checkboxes
+            for checkbox in self.participant_checkboxes.values():
+                checkbox.deleteLater()
+            self.participant_checkboxes = {}
+            self.create_participant_checkboxes()
+        else:
+            for checkbox in self.participant_checkboxes.values():
+                checkbox.blockSignals(True)
+                checkbox.setChecked(False)
+                checkbox.blockSignals(False)
+        
+        self.update_winner_options()
+    
     def update_winner_options(self):
         """Update the winner options based on selected participants."""
         # Clear existing winner checkboxes
@@ -1,8 +1,119 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QGroupBox, QGridLayout, QTableWidget, QTableWidgetItem, QTabWidget
+    QTableWidget, QTableWidgetItem, QTabWidget, QTableView, QHeaderView,
+    QFileDialog, QMessageBox
 )
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QBrush, QColor
+
+from src.models import export, money
+
+
+class HoleByHoleModel(QAbstractTableModel):
+    """Every hole's scores and payments, one row per player per hole.
+
+    Row r is player r % players on the r // players-th hole, so nothing is
+    laid out up front; cells are read from the game as the view paints them.
+    A player's payments for the hole are listed in the Pays and Receives
+    columns, and the hole's number, value and par head its first row.
+    """
+
+    HEADERS = ["Hole", "Value", "Par", "Player", "Score", "Pays", "Receives"]
+    HOLE_SHADE = QColor("#f0f3f5")
+
+    def __init__(self, game, parent=None):
+        super().__init__(parent)
+        self.game = game
+        self.player_names = list(game.players.keys())
+        self.hole_numbers = sorted(game.holes.keys())
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.hole_numbers) * len(self.player_names)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        hole_index, player_index = divmod(index.row(), len(self.player_names))
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole:
+            # Shade every other hole so each hole's rows read as one block
+            return QBrush(self.HOLE_SHADE) if hole_index % 2 else QVariant()
+        if role != Qt.DisplayRole:
+            return QVariant()
+
+        hole = self.game.holes[self.hole_numbers[hole_index]]
+        column = index.column()
+        if column < 3:
+            if player_index:
+                return ""
+            return str((hole.hole_number, hole.value, hole.par)[column])
+
+        player = self.player_names[player_index]
+        if column == 3:
+            return player
+        if column == 4:
+            score = hole.player_scores.get(player)
+            return "-" if score is None else str(score)
+        if column == 5:
+            payments = hole.payments.get(player, {})
+        else:
+            payments = {payer: recipients[player] for payer, recipients in hole.payments.items()
+                        if player in recipients}
+        if not payments:
+            return "-"
+        return ", ".join(f"{other}: {money.format_amount(amount)}" for other, amount in payments.items())
+
+
+class PairwiseNetModel(QAbstractTableModel):
+    """Net settled between each pair of players: row player's view of each column player."""
+
+    def __init__(self, game, parent=None):
+        super().__init__(parent)
+        self.player_names = list(game.players.keys())
+        self.pairwise = game.get_pairwise_net()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.player_names)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.player_names)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        return self.player_names[section]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return QVariant()
+        player = self.player_names[index.row()]
+        opponent = self.player_names[index.column()]
+        if player == opponent:
+            return "-"
+        return money.format_amount(self.pairwise[player][opponent])
 
 
 class FinalResultsScreen(QWidget):
@@ -26,32 +137,23 @@ class FinalResultsScreen(QWidget):
         header_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(header_label)
         
-        # Tabs for different result views
-        tabs = QTabWidget()
-        
-        # Tab for hole-by-hole results
-        hole_tab = QWidget()
-        hole_layout = QVBoxLayout(hole_tab)
-        self.create_hole_by_hole_view(hole_layout)
-        tabs.addTab(hole_tab, "Hole by Hole")
-        
-        # Tab for player summary
-        player_tab = QWidget()
-        player_layout = QVBoxLayout(player_tab)
-        self.create_player_summary_view(player_layout)
-        tabs.addTab(player_tab, "Player Summary")
+        # Tabs for different result views, each built the first time it is shown
+        self.tabs = QTabWidget()
+        self.tab_builders = {}
+        self.add_lazy_tab("Hole by Hole", self.create_hole_by_hole_view)
+        self.add_lazy_tab("Player Summary", self.create_player_summary_view)
+        self.add_lazy_tab("Final Payments", self.create_final_payments_view)
+        self.tabs.currentChanged.connect(self.build_tab)
         
-        # Tab for final payments
-        payments_tab = QWidget()
-        payments_layout = QVBoxLayout(payments_tab)
-        self.create_final_payments_view(payments_layout)
-        tabs.addTab(payments_tab, "Final Payments")
-        
-        main_layout.addWidget(tabs)
+        main_layout.addWidget(self.tabs)
         
         # Buttons
         button_layout = QHBoxLayout()
         
+        export_button = QPushButton("Export Results")
+        export_button.clicked.connect(self.on_export)
+        button_layout.addWidget(export_button)
+        
         new_game_button = QPushButton("New Game")
         new_game_button.clicked.connect(self.on_new_game)
         button_layout.addWidget(new_game_button)
@@ -61,104 +163,38 @@ class FinalResultsScreen(QWidget):
         # Set the layout
         self.setLayout(main_layout)
     
+    def add_lazy_tab(self, title, builder):
+        """Add an empty tab whose contents are created by builder(layout) on first selection."""
+        tab = QWidget()
+        QVBoxLayout(tab)
+        index = self.tabs.addTab(tab, title)
+        self.tab_builders[index] = builder
+    
+    def build_tab(self, index):
+        builder = self.tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self.tabs.widget(index).layout())
+    
+    def showEvent(self, event):
+        # The tab that is current when the screen first appears has not been selected yet
+        self.build_tab(self.tabs.currentIndex())
+        super().showEvent(event)
+    
     def create_hole_by_hole_view(self, layout):
         """Create the hole-by-hole results view."""
-        # Scrollable container for all holes
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-        
-        # Add a section for each hole
-        for hole_number, hole in sorted(self.game.holes.items()):
-            hole_group = QGroupBox(f"Hole {hole_number}")
-            hole_layout = QVBoxLayout()
-            
-            # Hole info
-            hole_info = QLabel(f"Value: {hole.value}, Par: {hole.par}")
-            hole_layout.addWidget(hole_info)
-            
-            # Scores table
-            scores_table = QTableWidget()
-            scores_table.setColumnCount(2)
-            scores_table.setHorizontalHeaderLabels(["Player", "Score"])
-            scores_table.setRowCount(len(hole.player_scores))
-            
-            for i, (player, score) in enumerate(hole.player_scores.items()):
-                player_item = QTableWidgetItem(player)
-                scores_table.setItem(i, 0, player_item)
-                
-                score_item = QTableWidgetItem(str(score))
-                scores_table.setItem(i, 1, score_item)
-            
-            hole_layout.addWidget(scores_table)
-            
-            # Payments if any
-            if hole.payments:
-                payments_label = QLabel("Payments:")
-                hole_layout.addWidget(payments_label)
-                
-                payments_table = QTableWidget()
-                payments_table.setColumnCount(3)
-                payments_table.setHorizontalHeaderLabels(["From", "To", "Amount"])
-                
-                # Count total payments
-                payment_count = 0
-                for from_player, to_players in hole.payments.items():
-                    payment_count += len(to_players)
-                
-                payments_table.setRowCount(payment_count)
-                
-                # Fill payments table
-                row = 0
-                for from_player, to_players in hole.payments.items():
-                    for to_player, amount in to_players.items():
-                        payments_table.setItem(row, 0, QTableWidgetItem(from_player))
-                        payments_table.setItem(row, 1, QTableWidgetItem(to_player))
-                        payments_table.setItem(row, 2, QTableWidgetItem(str(amount)))
-                        row += 1
-                
-                hole_layout.addWidget(payments_table)
-            else:
-                no_payments = QLabel("No payments for this hole")
-                hole_layout.addWidget(no_payments)
-            
-            hole_group.setLayout(hole_layout)
-            scroll_layout.addWidget(hole_group)
-        
-        layout.addWidget(scroll_content)
+        # One virtualized table: rows are only materialized as they scroll into view
+        self.hole_model = HoleByHoleModel(self.game, self)
+        hole_table = QTableView()
+        hole_table.setModel(self.hole_model)
+        hole_table.verticalHeader().setVisible(False)
+        hole_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        hole_table.setShowGrid(True)
+        layout.addWidget(hole_table)
     
     def create_player_summary_view(self, layout):
         """Create the player summary view."""
-        # Calculate total scores and payments for each player
-        player_summary = {}
-        
-        for player_name in self.game.players:
-            # Initialize summary
-            player_summary[player_name] = {
-                "total_score": 0,
-                "paid": 0,
-                "received": 0,
-                "net": 0
-            }
-            
-            # Sum up scores
-            for hole_number, hole in self.game.holes.items():
-                if player_name in hole.player_scores:
-                    player_summary[player_name]["total_score"] += hole.player_scores[player_name]
-            
-            # Calculate payments
-            for hole_number, hole in self.game.holes.items():
-                # Payments made
-                if player_name in hole.payments:
-                    for recipient, amount in hole.payments[player_name].items():
-                        player_summary[player_name]["paid"] += amount
-                
-                # Payments received
-                for payer, recipients in hole.payments.items():
-                    if player_name in recipients:
-                        player_summary[player_name]["received"] += recipients[player_name]
-            
-            # Calculate net
-            player_summary[player_name]["net"] = player_summary[player_name]["received"] - player_summary[player_name]["paid"]
+        # Totals are kept by the game's ledger as holes are settled
+        player_summary = self.game.get_player_totals()
         
         # Create summary table
         summary_table = QTableWidget()
@@ -169,10 +205,10 @@ class FinalResultsScreen(QWidget):
         for i, (player, data) in enumerate(player_summary.items()):
             summary_table.setItem(i, 0, QTableWidgetItem(player))
             summary_table.setItem(i, 1, QTableWidgetItem(str(data["total_score"])))
-            summary_table.setItem(i, 2, QTableWidgetItem(str(data["paid"])))
-            summary_table.setItem(i, 3, QTableWidgetItem(str(data["received"])))
+            summary_table.setItem(i, 2, QTableWidgetItem(money.format_amount(data["paid"])))
+            summary_table.setItem(i, 3, QTableWidgetItem(money.format_amount(data["received"])))
             
-            net_item = QTableWidgetItem(str(data["net"]))
+            net_item = QTableWidgetItem(money.format_amount(data["net"]))
             # Color net item based on value
             if data["net"] > 0:
                 net_item.setBackground(Qt.green)
@@ -182,6 +218,16 @@ class FinalResultsScreen(QWidget):
             summary_table.setItem(i, 4, net_item)
         
         layout.addWidget(summary_table)
+        
+        # Net between every pair of players
+        head_to_head_label = QLabel("Head to head (what each column player paid each row player, net)")
+        head_to_head_label.setObjectName("infoLabel")
+        layout.addWidget(head_to_head_label)
+        
+        self.pairwise_model = PairwiseNetModel(self.game, self)
+        pairwise_table = QTableView()
+        pairwise_table.setModel(self.pairwise_model)
+        layout.addWidget(pairwise_table)
     
     def create_final_payments_view(self, layout):
         """Create the final payments view."""
@@ -190,6 +236,12 @@ class FinalResultsScreen(QWidget):
             layout.addWidget(no_payments)
             return
         
+        # How the settlement was found
+        if self.game.settlement is not None:
+            settlement_info = QLabel(f"Settled with {self.game.settlement.summary()}")
+            settlement_info.setObjectName("infoLabel")
+            layout.addWidget(settlement_info)
+        
         # Final payments table
         payments_table = QTableWidget()
         payments_table.setColumnCount(3)
@@ -208,11 +260,26 @@ class FinalResultsScreen(QWidget):
             for recipient, amount in recipients.items():
                 payments_table.setItem(row, 0, QTableWidgetItem(payer))
                 payments_table.setItem(row, 1, QTableWidgetItem(recipient))
-                payments_table.setItem(row, 2, QTableWidgetItem(str(amount)))
+                payments_table.setItem(row, 2, QTableWidgetItem(money.format_amount(amount)))
                 row += 1
         
         layout.addWidget(payments_table)
     
+    def on_export(self):
+        # Write the hole payments, player summary and final payments as CSV files
+        directory = QFileDialog.getExistingDirectory(self, "Export Results To")
+        if not directory:
+            return
+        try:
+            export.export_game(self.game, directory, "csv")
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", str(e))
+            return
+        QMessageBox.information(
+            self, "Results Exported",
+            f"Wrote hole_payments.csv, players.csv and final_payments.csv to {directory}."
+        )
+    
     def on_new_game(self):
         # Emit signal to start a new game
         self.new_game_signal.emit()
\ No newline at end of file
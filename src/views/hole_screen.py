@@ -4,6 +4,9 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import pyqtSignal, Qt
 
+DEFAULT_VALUE = 10
+DEFAULT_PAR = 3
+
 
 class HoleScreen(QWidget):
     # Signal emitted when the user wants to continue to the next hole
@@ -15,6 +18,7 @@ class HoleScreen(QWidget):
         self.hole_number = hole_number
         self.player_score_inputs = {}
         self.init_ui()
+        self.load_hole()
         
     def init_ui(self):
         # Main layout
@@ -23,10 +27,10 @@ class HoleScreen(QWidget):
         main_layout.setContentsMargins(30, 30, 30, 30)
         
         # Header
-        header_label = QLabel(f"Hole {self.hole_number}")
-        header_label.setObjectName("headerLabel")
-        header_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(header_label)
+        self.header_label = QLabel(f"Hole {self.hole_number}")
+        self.header_label.setObjectName("headerLabel")
+        self.header_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.header_label)
         
         # Card-style form container
         form_container = QWidget()
@@ -41,14 +45,14 @@ class HoleScreen(QWidget):
         self.hole_value = QSpinBox()
         self.hole_value.setMinimum(1)
         self.hole_value.setMaximum(1000)
-        self.hole_value.setValue(10)  # Default value
+        self.hole_value.setValue(DEFAULT_VALUE)
         hole_layout.addRow("Value:", self.hole_value)
         
         # Par for the hole
         self.hole_par = QSpinBox()
         self.hole_par.setMinimum(1)
         self.hole_par.setMaximum(10)
-        self.hole_par.setValue(3)  # Default value
+        self.hole_par.setValue(DEFAULT_PAR)
         hole_layout.addRow("Par:", self.hole_par)
         
         hole_group.setLayout(hole_layout)
@@ -56,27 +60,13 @@ class HoleScreen(QWidget):
         
         # Player scores group
         scores_group = QGroupBox("Player Scores")
-        scores_layout = QFormLayout()
+        self.scores_layout = QFormLayout()
+        self.create_score_inputs()
         
-        # Add input for each player's score
-        for player_name in self.game.players:
-            spin_box = QSpinBox()
-            spin_box.setMinimum(1)
-            spin_box.setMaximum(20)
-            spin_box.setValue(self.hole_par.value())  # Default to par
-            self.player_score_inputs[player_name] = spin_box
-            scores_layout.addRow(f"{player_name}:", spin_box)
-            
-            # Connect par value changes to update default scores
-            self.hole_par.valueChanged.connect(
-                lambda value, sb=spin_box: sb.setValue(value) if sb.value() == sb.property("last_par") else None)
-            spin_box.setProperty("last_par", self.hole_par.value())
-        
-        # Update last_par property when par changes
-        self.hole_par.valueChanged.connect(
-            lambda value: [spin_box.setProperty("last_par", value) for spin_box in self.player_score_inputs.values()])
+        # Scores still at the old par follow par changes
+        self.hole_par.valueChanged.connect(self.on_par_changed)
         
-        scores_group.setLayout(scores_layout)
+        scores_group.setLayout(self.scores_layout)
         form_layout.addWidget(scores_group)
         
         main_layout.addWidget(form_container)
@@ -93,15 +83,58 @@ class HoleScreen(QWidget):
         # Set the layout
         self.setLayout(main_layout)
     
+    def create_score_inputs(self):
+        """Add a score input for each player in the game."""
+        for player_name in self.game.players:
+            spin_box = QSpinBox()
+            spin_box.setMinimum(1)
+            spin_box.setMaximum(20)
+            spin_box.setValue(self.hole_par.value())  # Default to par
+            spin_box.setProperty("last_par", self.hole_par.value())
+            self.player_score_inputs[player_name] = spin_box
+            self.scores_layout.addRow(f"{player_name}:", spin_box)
+    
+    def on_par_changed(self, value):
+        for spin_box in self.player_score_inputs.values():
+            if spin_box.value() == spin_box.property("last_par"):
+                spin_box.setValue(value)
+            spin_box.setProperty("last_par", value)
+    
+    def reset(self, game, hole_number):
+        """Reuse this screen for another hole (and possibly another game)."""
+        self.game = game
+        self.hole_number = hole_number
+        self.header_label.setText(f"Hole {hole_number}")
+        
+        if list(self.player_score_inputs) != list(game.players):
+            # Different players: rebuild the score rows
+            while self.scores_layout.rowCount():
+                self.scores_layout.removeRow(0)
+            self.player_score_inputs = {}
+            self.create_score_inputs()
+        
+        self.load_hole()
+    
+    def load_hole(self):
+        """Show what was already entered for the hole (e.g. after a crash), or the defaults."""
+        hole = self.game.holes.get(self.hole_number)
+        entered = hole is not None and hole.par > 0
+        self.hole_value.setValue(hole.value if entered else DEFAULT_VALUE)
+        self.hole_par.setValue(hole.par if entered else DEFAULT_PAR)
+        
+        par = self.hole_par.value()
+        for player_name, spin_box in self.player_score_inputs.items():
+            score = hole.player_scores.get(player_name) if entered else None
+            spin_box.setValue(score or par)
+            spin_box.setProperty("last_par", par)
+    
     def on_continue(self):
         # Save hole details
         hole_value = self.hole_value.value()
         hole_par = self.hole_par.value()
         
         # Update the hole in the game
-        hole = self.game.holes[self.hole_number]
-        hole.value = hole_value
-        hole.par = hole_par
+        self.game.set_hole_details(self.hole_number, hole_value, hole_par)
         
         # Save player scores
         for player_name, spin_box in self.player_score_inputs.items():
@@ -0,0 +1,292 @@
+from bisect import bisect_left, bisect_right
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, pyqtSignal
+from PyQt5.QtGui import QBrush
+
+from src.models import money
+
+
+class HoleTableModel(QAbstractTableModel):
+    """One row per hole and one column per player, read straight from the game.
+
+    Nothing is copied out of the game: views ask for cells as they paint them,
+    and refresh_hole only tells them which row went stale. Subclasses pass
+    cell_text(hole_num, player), which gives the text of a player's cell.
+    """
+
+    def __init__(self, game, cell_text, parent=None):
+        super().__init__(parent)
+        self.game = game
+        self.cell_text = cell_text
+        self.player_names = list(game.players.keys())
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.game.settings.number_of_holes
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.player_names) + 1  # +1 for hole number
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return "Hole" if section == 0 else self.player_names[section - 1]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return QVariant()
+
+        hole_num = index.row() + 1
+        if index.column() == 0:
+            return str(hole_num)
+        return self.cell_text(hole_num, self.player_names[index.column() - 1])
+
+    def refresh_hole(self, hole_number):
+        """Tell the views that one hole's row changed."""
+        row = hole_number - 1
+        if 0 <= row < self.game.settings.number_of_holes:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def refresh_all(self):
+        self.beginResetModel()
+        self.player_names = list(self.game.players.keys())
+        self.endResetModel()
+
+
+class ScoresTableModel(HoleTableModel):
+    """Scores per hole (with voor-adjusted scores in brackets) plus a total row.
+
+    Scores of holes that have been settled can be edited in place until the
+    round is over (its final results are shown and archived); an edit is a
+    Game.correct_score, and hole_corrected tells the window which hole to
+    refresh.
+    """
+
+    # Emitted with the hole number after a score has been corrected
+    hole_corrected = pyqtSignal(int)
+
+    def __init__(self, game, parent=None):
+        super().__init__(game, self.score_text, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.game.settings.number_of_holes + 1  # +1 for total row
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Vertical and self.is_total_row(section):
+            return "Total"
+        return super().headerData(section, orientation, role)
+
+    def is_total_row(self, row):
+        return row == self.game.settings.number_of_holes
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if self.is_editable(index):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def is_editable(self, index):
+        """Only a settled hole's scores can be corrected; the hole being played is entered as usual."""
+        if not index.isValid() or index.column() == 0 or self.is_total_row(index.row()):
+            return False
+        if self.game.current_hole > self.game.settings.number_of_holes:
+            return False  # the round is over
+        return index.row() + 1 in self.game.ledger.entries
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not self.is_editable(index):
+            return False
+        try:
+            score = int(value)
+        except (TypeError, ValueError):
+            return False
+        if score <= 0:
+            return False
+
+        hole_num = index.row() + 1
+        self.game.correct_score(hole_num, self.player_names[index.column() - 1], score)
+        self.hole_corrected.emit(hole_num)
+        return True
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.EditRole and self.is_editable(index):
+            return self.game.get_player_score(index.row() + 1, self.player_names[index.column() - 1])
+        if not index.isValid() or not self.is_total_row(index.row()):
+            return super().data(index, role)
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole:
+            return QBrush(Qt.lightGray)
+        if role != Qt.DisplayRole:
+            return QVariant()
+
+        if index.column() == 0:
+            return "Total"
+        return self.total_text(self.player_names[index.column() - 1])
+
+    def score_text(self, hole_num, player):
+        score = self.game.get_player_score(hole_num, player)
+        if score is None:
+            return "-"
+
+        # Show adjusted score if voor is enabled
+        if self.game.settings.voor_enabled:
+            adjusted_score = self.game.get_adjusted_score(player, hole_num)
+            if adjusted_score != score:
+                return f"{score} ({adjusted_score})"
+        return str(score)
+
+    def total_text(self, player):
+        total = self.game.get_total_score(player)
+        if total is None:
+            return "-"
+
+        # Show adjusted total if voor is enabled
+        if self.game.settings.voor_enabled:
+            adjusted_total = self.game.get_adjusted_total_score(player)
+            if adjusted_total != total:
+                return f"{total} ({adjusted_total})"
+        return str(total)
+
+    def refresh_hole(self, hole_number):
+        super().refresh_hole(hole_number)
+
+        # The total row depends on every hole
+        total_row = self.game.settings.number_of_holes
+        self.dataChanged.emit(self.index(total_row, 1), self.index(total_row, self.columnCount() - 1))
+
+
+class VoorTableModel(HoleTableModel):
+    """Voor adjustments each player receives, repeated for every hole."""
+
+    def __init__(self, game, parent=None):
+        super().__init__(game, self.voor_text, parent)
+
+    def voor_text(self, hole_num, player):
+        adjustments = []
+        for opponent in self.game.players:
+            if opponent != player:
+                adjustment = self.game.players[player].voor_adjustments.get(opponent, 0)
+                if adjustment > 0:
+                    adjustments.append(f"{opponent}: -{adjustment}")
+
+        if adjustments:
+            return "\n".join(adjustments)
+        return "-"
+
+
+class BuchiTableModel(HoleTableModel):
+    """Buchi participation and wins per hole."""
+
+    def __init__(self, game, parent=None):
+        super().__init__(game, self.buchi_text, parent)
+
+    def buchi_text(self, hole_num, player):
+        participated = self.game.players[player].buchi_participations.get(hole_num, False)
+        won = self.game.players[player].buchi_wins.get(hole_num, False)
+
+        if participated:
+            return "✓" if won else "✗"
+        return "-"
+
+
+class PaymentsTableModel(QAbstractTableModel):
+    """Every per-hole payment as a (hole, from, to, amount) row, ordered by hole.
+
+    Rows are kept in a flat list; refreshing a hole removes and re-inserts only
+    that hole's rows.
+    """
+
+    HEADERS = ["Hole", "From", "To", "Amount"]
+
+    def __init__(self, game, parent=None):
+        super().__init__(parent)
+        self.game = game
+        self.rows = []  # (hole_number, from_player, to_player, amount)
+        self.row_holes = []  # hole number of each row, kept sorted for bisect
+        self.rebuild_rows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return QVariant()
+        value = self.rows[index.row()][index.column()]
+        if index.column() == 3:
+            return money.format_amount(value)
+        return str(value)
+
+    def hole_rows(self, hole_number):
+        hole = self.game.holes.get(hole_number)
+        if not hole:
+            return []
+        return [(hole_number, from_player, to_player, amount)
+                for from_player, to_players in hole.payments.items()
+                for to_player, amount in to_players.items()]
+
+    def rebuild_rows(self):
+        self.rows = []
+        for hole_num in range(1, self.game.settings.number_of_holes + 1):
+            self.rows.extend(self.hole_rows(hole_num))
+        self.row_holes = [row[0] for row in self.rows]
+
+    def refresh_hole(self, hole_number):
+        """Replace one hole's payment rows, leaving every other row alone."""
+        first = bisect_left(self.row_holes, hole_number)
+        last = bisect_right(self.row_holes, hole_number)
+        new_rows = self.hole_rows(hole_number)
+
+        # Same number of rows: just update them in place
+        if last - first == len(new_rows):
+            if new_rows and self.rows[first:last] != new_rows:
+                self.rows[first:last] = new_rows
+                self.dataChanged.emit(self.index(first, 0), self.index(last - 1, self.columnCount() - 1))
+            return
+
+        if last > first:
+            self.beginRemoveRows(QModelIndex(), first, last - 1)
+            del self.rows[first:last]
+            del self.row_holes[first:last]
+            self.endRemoveRows()
+
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self.rows[first:first] = new_rows
+            self.row_holes[first:first] = [hole_number] * len(new_rows)
+            self.endInsertRows()
+
+    def refresh_all(self):
+        self.beginResetModel()
+        self.rebuild_rows()
+        self.endResetModel()
@@ -4,6 +4,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import pyqtSignal, Qt
 
+from src.models import money
+
 
 class ResultsScreen(QWidget):
     # Signal emitted when the user wants to continue to the next hole
@@ -15,6 +17,7 @@ class ResultsScreen(QWidget):
         self.hole_number = hole_number
         self.hole = game.holes[hole_number]
         self.init_ui()
+        self.populate()
         
     def init_ui(self):
         # Main layout
@@ -23,10 +26,10 @@ class ResultsScreen(QWidget):
         main_layout.setContentsMargins(30, 30, 30, 30)
         
         # Header
-        header_label = QLabel(f"Results for Hole {self.hole_number}")
-        header_label.setObjectName("headerLabel")
-        header_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(header_label)
+        self.header_label = QLabel()
+        self.header_label.setObjectName("headerLabel")
+        self.header_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.header_label)
         
         # Card-style form container
         results_container = QWidget()
@@ -34,94 +37,51 @@ class ResultsScreen(QWidget):
         results_layout = QVBoxLayout(results_container)
         
         # Hole info
-        hole_info = QLabel(f"Value: {self.hole.value}, Par: {self.hole.par}")
-        hole_info.setAlignment(Qt.AlignCenter)
-        results_layout.addWidget(hole_info)
+        self.hole_info = QLabel()
+        self.hole_info.setAlignment(Qt.AlignCenter)
+        results_layout.addWidget(self.hole_info)
         
         # Scores table
         scores_group = QGroupBox("Scores")
         scores_layout = QVBoxLayout()
         
-        scores_table = QTableWidget()
-        scores_table.setColumnCount(2)
-        scores_table.setHorizontalHeaderLabels(["Player", "Score"])
-        scores_table.setRowCount(len(self.game.players))
-        scores_table.horizontalHeader().setStretchLastSection(True)
+        self.scores_table = QTableWidget()
+        self.scores_table.setColumnCount(2)
+        self.scores_table.setHorizontalHeaderLabels(["Player", "Score"])
+        self.scores_table.horizontalHeader().setStretchLastSection(True)
         
-        for i, (player_name, score) in enumerate(self.hole.player_scores.items()):
-            # Player name
-            player_item = QTableWidgetItem(player_name)
-            scores_table.setItem(i, 0, player_item)
-            
-            # Score
-            score_item = QTableWidgetItem(str(score))
-            scores_table.setItem(i, 1, score_item)
-        
-        scores_layout.addWidget(scores_table)
+        scores_layout.addWidget(self.scores_table)
         scores_group.setLayout(scores_layout)
         results_layout.addWidget(scores_group)
         
-        # Payments table
-        if self.hole.payments:
-            payments_group = QGroupBox("Payments")
-            payments_layout = QVBoxLayout()
-            
-            payments_table = QTableWidget()
-            payments_table.setColumnCount(3)
-            payments_table.setHorizontalHeaderLabels(["From", "To", "Amount"])
-            
-            # Count total payments
-            payment_count = 0
-            for from_player, to_players in self.hole.payments.items():
-                payment_count += len(to_players)
-            
-            payments_table.setRowCount(payment_count)
-            
-            # Fill payments table
-            row = 0
-            for from_player, to_players in self.hole.payments.items():
-                for to_player, amount in to_players.items():
-                    # From player
-                    from_item = QTableWidgetItem(from_player)
-                    payments_table.setItem(row, 0, from_item)
-                    
-                    # To player
-                    to_item = QTableWidgetItem(to_player)
-                    payments_table.setItem(row, 1, to_item)
-                    
-                    # Amount
-                    amount_item = QTableWidgetItem(str(amount))
-                    payments_table.setItem(row, 2, amount_item)
-                    
-                    row += 1
-            
-            payments_layout.addWidget(payments_table)
-            payments_group.setLayout(payments_layout)
-            results_layout.addWidget(payments_group)
-        else:
-            no_payments = QLabel("No payments for this hole")
-            no_payments.setAlignment(Qt.AlignCenter)
-            results_layout.addWidget(no_payments)
+        # Payments table (hidden when the hole has no payments)
+        self.payments_group = QGroupBox("Payments")
+        payments_layout = QVBoxLayout()
+        
+        self.payments_table = QTableWidget()
+        self.payments_table.setColumnCount(3)
+        self.payments_table.setHorizontalHeaderLabels(["From", "To", "Amount"])
+        
+        payments_layout.addWidget(self.payments_table)
+        self.payments_group.setLayout(payments_layout)
+        results_layout.addWidget(self.payments_group)
+        
+        self.no_payments = QLabel("No payments for this hole")
+        self.no_payments.setAlignment(Qt.AlignCenter)
+        results_layout.addWidget(self.no_payments)
         
         # Buchi results if applicable
-        if self.game.settings.buchi_enabled and self.hole.buchi_participants:
-            buchi_group = QGroupBox("Buchi Results")
-            buchi_layout = QVBoxLayout()
-            
-            # Participants
-            participants_label = QLabel("Participants: " + ", ".join(self.hole.buchi_participants))
-            buchi_layout.addWidget(participants_label)
-            
-            # Winners
-            if self.hole.buchi_winners:
-                winners_label = QLabel("Winners: " + ", ".join(self.hole.buchi_winners))
-                buchi_layout.addWidget(winners_label)
-            else:
-                winners_label = QLabel("No winners (or all won)")
-                buchi_layout.addWidget(winners_label)
-            
-            buchi_group.setLayout(buchi_layout)
-            results_layout.addWidget(buchi_group)
+        self.buchi_group = QGroupBox("Buchi Results")
+        buchi_layout = QVBoxLayout()
+        
+        self.participants_label = QLabel()
+        buchi_layout.addWidget(self.participants_label)
+        
+        self.winners_label = QLabel()
+        buchi_layout.addWidget(self.winners_label)
+        
+        self.buchi_group.setLayout(buchi_layout)
+        results_layout.addWidget(self.buchi_group)
         
         main_layout.addWidget(results_container)
         
@@ -137,6 +97,54 @@ class ResultsScreen(QWidget):
         # Set the layout
         self.setLayout(main_layout)
     
+    def reset(self, game, hole_number):
+        """Reuse this screen for another hole (and possibly another game)."""
+        self.game = game
+        self.hole_number = hole_number
+        self.hole = game.holes[hole_number]
+        self.populate()
+    
+    def populate(self):
+        """Fill the existing widgets with the current hole's results."""
+        self.header_label.setText(f"Results for Hole {self.hole_number}")
+        self.hole_info.setText(f"Value: {self.hole.value}, Par: {self.hole.par}")
+        
+        # Scores
+        self.scores_table.setRowCount(len(self.game.players))
+        for i, (player_name, score) in enumerate(self.hole.player_scores.items()):
+            self.set_cell(self.scores_table, i, 0, player_name)
+            self.set_cell(self.scores_table, i, 1, str(score))
+        
+        # Payments
+        payments = [(from_player, to_player, amount)
+                    for from_player, to_players in self.hole.payments.items()
+                    for to_player, amount in to_players.items()]
+        self.payments_table.setRowCount(len(payments))
+        for row, (from_player, to_player, amount) in enumerate(payments):
+            self.set_cell(self.payments_table, row, 0, from_player)
+            self.set_cell(self.payments_table, row, 1, to_player)
+            self.set_cell(self.payments_table, row, 2, money.format_amount(amount))
+        self.payments_group.setVisible(bool(payments))
+        self.no_payments.setVisible(not payments)
+        
+        # Buchi
+        show_buchi = self.game.settings.buchi_enabled and bool(self.hole.buchi_participants)
+        self.buchi_group.setVisible(show_buchi)
+        if show_buchi:
+            self.participants_label.setText("Participants: " + ", ".join(self.hole.buchi_participants))
+            if self.hole.buchi_winners:
+                self.winners_label.setText("Winners: " + ", ".join(self.hole.buchi_winners))
+            else:
+                self.winners_label.setText("No winners (or all won)")
+    
+    def set_cell(self, table, row, column, text):
+        """Update a cell's text, creating its item only the first time."""
+        item = table.item(row, column)
+        if item is None:
+            table.setItem(row, column, QTableWidgetItem(text))
+        else:
+            item.setText(text)
+    
     def on_continue(self):
         # Emit signal to continue to the next hole
-        self.continue_signal.emit()
\ No newline at end of file
+        self.continue_signal.emit()
@@ -0,0 +1,129 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableView, QLabel, QHeaderView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+
+from src.models import money
+
+
+class StandingsTableModel(QAbstractTableModel):
+    """Combined tournament standings, one row per player, best net first.
+
+    Rows are (group, player) keys into Tournament.entries. refresh_entries
+    only repaints the rows that changed, and only re-orders the rows when
+    the ranking itself moved.
+    """
+
+    HEADERS = ["Rank", "Group", "Player", "Holes", "Strokes", "Net"]
+    FIELDS = [None, "group", "player", "holes", "strokes", "net"]
+
+    def __init__(self, tournament, parent=None):
+        super().__init__(parent)
+        self.tournament = tournament
+        self.keys = []  # (group_id, player_name) in ranking order
+        self.rows = {}  # key: row
+        self.rebuild_rows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if index.column() == 0:
+            return str(index.row() + 1)
+        entry = self.tournament.entries[self.keys[index.row()]]
+        field = self.FIELDS[index.column()]
+        if field == "net":
+            return money.format_amount(entry[field])
+        return str(entry[field])
+
+    def ranked_keys(self):
+        return [(entry["group"], entry["player"]) for entry in self.tournament.standings()]
+
+    def rebuild_rows(self):
+        self.keys = self.ranked_keys()
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+
+    def refresh_entries(self, changed):
+        """Update the views for the standings keys returned by Tournament.collect()."""
+        if not changed:
+            return
+        if any(key not in self.rows for key in changed):
+            # A new group joined
+            self.beginResetModel()
+            self.rebuild_rows()
+            self.endResetModel()
+            return
+
+        keys = self.ranked_keys()
+        if keys != self.keys:
+            self.layoutAboutToBeChanged.emit()
+            self.keys = keys
+            self.rows = {key: row for row, key in enumerate(keys)}
+            self.layoutChanged.emit()
+            return
+
+        last_column = self.columnCount() - 1
+        for key in changed:
+            row = self.rows[key]
+            self.dataChanged.emit(self.index(row, 1), self.index(row, last_column))
+
+
+class StandingsWindow(QWidget):
+    def __init__(self, tournament):
+        super().__init__()
+        self.tournament = tournament
+        self.setWindowTitle("Tournament Standings")
+        self.setMinimumSize(900, 700)
+
+        layout = QVBoxLayout()
+        layout.setSpacing(20)
+        layout.setContentsMargins(30, 30, 30, 30)
+
+        title = QLabel("Tournament Standings")
+        title.setObjectName("headerLabel")
+        title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title)
+
+        self.status_label = QLabel()
+        self.status_label.setObjectName("infoLabel")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.status_label)
+
+        self.standings_model = StandingsTableModel(tournament, self)
+        self.standings_table = QTableView()
+        self.standings_table.setObjectName("progressTable")
+        self.standings_table.setModel(self.standings_model)
+        self.standings_table.verticalHeader().setVisible(False)
+        self.standings_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.standings_table)
+
+        self.setLayout(layout)
+        self.update_status()
+
+    def update_entries(self, changed):
+        """Refresh only the standings rows that changed."""
+        self.standings_model.refresh_entries(changed)
+        self.update_status()
+
+    def update_status(self):
+        self.status_label.setText(
+            f"{len(self.tournament.groups)} groups, {len(self.tournament.entries)} players, "
+            f"{self.tournament.pending} holes settling")
@@ -1,18 +1,27 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, 
-    QComboBox, QCheckBox, QPushButton, QGroupBox, QFormLayout
+    QComboBox, QCheckBox, QPushButton, QGroupBox, QFormLayout, QLineEdit
 )
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QIcon
+import copy
+import logging
+
+from src.models import scoring
+
+logger = logging.getLogger(__name__)
 
 
 class StartScreen(QWidget):
     # Signal emitted when the user wants to start the game
     start_game_signal = pyqtSignal()
+    # Signal emitted once, after the screen has been painted for the first time
+    first_paint_signal = pyqtSignal()
     
     def __init__(self, game_settings):
         super().__init__()
         self.game_settings = game_settings
+        self.painted = False
         self.init_ui()
         
     def init_ui(self):
@@ -68,14 +77,23 @@ class StartScreen(QWidget):
             self.game_mode.setCurrentIndex(1)
         settings_layout.addRow("Game Mode:", self.game_mode)
         
-        # Scoring type
+        # Scoring type: the built-in rule sets plus any from the rules file
+        try:
+            self.scoring_presets = scoring.load_scoring_rules()
+        except (OSError, ValueError):
+            logger.exception("Could not read the scoring rules file; using the built-in rules")
+            self.scoring_presets = dict(scoring.SCORING_RULES)
         self.scoring_type = QComboBox()
-        self.scoring_type.addItem("Par", "par")
-        self.scoring_type.addItem("Bogey", "bogey")
-        if self.game_settings.scoring_type == "bogey":
-            self.scoring_type.setCurrentIndex(1)
+        for name, rules in self.scoring_presets.items():
+            self.scoring_type.addItem(rules.get("label", name), name)
+        self.select_scoring_type(self.game_settings.scoring_type)
         settings_layout.addRow("Scoring Type:", self.scoring_type)
         
+        # Course name (used to look the round up later)
+        self.course = QLineEdit(self.game_settings.course)
+        self.course.setPlaceholderText("Optional")
+        settings_layout.addRow("Course:", self.course)
+        
         settings_group.setLayout(settings_layout)
         form_layout.addWidget(settings_group)
         
@@ -134,14 +152,41 @@ class StartScreen(QWidget):
         # Set the layout
         self.setLayout(main_layout)
     
+    def reset(self, game_settings):
+        """Reuse this screen for a new game with fresh settings."""
+        self.game_settings = game_settings
+        self.player_count.setValue(game_settings.number_of_players)
+        self.hole_count.setValue(game_settings.number_of_holes)
+        self.game_mode.setCurrentIndex(1 if game_settings.game_mode == "face_to_face" else 0)
+        self.select_scoring_type(game_settings.scoring_type)
+        self.course.setText(game_settings.course)
+        self.buchi_enabled.setChecked(True)
+        self.voor_enabled.setChecked(True)
+    
+    def select_scoring_type(self, name):
+        index = self.scoring_type.findData(name)
+        self.scoring_type.setCurrentIndex(max(index, 0))
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.first_paint_signal.emit()
+    
     def on_start_game(self):
         # Save all settings
         self.game_settings.number_of_players = self.player_count.value()
         self.game_settings.number_of_holes = self.hole_count.value()
         self.game_settings.game_mode = self.game_mode.currentData()
         self.game_settings.scoring_type = self.scoring_type.currentData()
+        # Rules from the file are copied into the game so it settles the same way wherever it is loaded
+        if self.game_settings.scoring_type in scoring.SCORING_RULES:
+            self.game_settings.scoring_rules = None
+        else:
+            self.game_settings.scoring_rules = copy.deepcopy(self.scoring_presets[self.game_settings.scoring_type])
         self.game_settings.buchi_enabled = self.buchi_enabled.isChecked()
         self.game_settings.voor_enabled = self.voor_enabled.isChecked()
+        self.game_settings.course = self.course.text().strip()
         
         # Emit signal to start the game
         self.start_game_signal.emit()
\ No newline at end of file
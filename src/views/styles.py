@@ -0,0 +1,33 @@
+"""Application stylesheet loading.
+
+The stylesheet is split in two so the start screen can paint sooner:
+style.qss (fonts, inputs, buttons, group boxes) is applied before the first
+window is shown, and tables.qss (tables, headers and tabs, which the start
+screen does not use) is appended once the start screen has painted.
+"""
+import os
+
+from PyQt5.QtWidgets import QApplication
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+BASE_STYLESHEET = "style.qss"
+DEFERRED_STYLESHEETS = ["tables.qss"]
+
+
+def read_stylesheet(name):
+    with open(os.path.join(ASSETS_DIR, name), "r") as f:
+        return f.read()
+
+
+def apply_base_stylesheet(app):
+    app.setStyleSheet(read_stylesheet(BASE_STYLESHEET))
+
+
+def apply_deferred_stylesheets(app=None):
+    """Append the stylesheets left out at start-up. Only the first call does anything."""
+    app = app or QApplication.instance()
+    if app is None or app.property("deferredStylesApplied"):
+        return
+    deferred = "\n".join(read_stylesheet(name) for name in DEFERRED_STYLESHEETS)
+    app.setStyleSheet(app.styleSheet() + "\n" + deferred)
+    app.setProperty("deferredStylesApplied", True)
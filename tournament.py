@@ -0,0 +1,111 @@
+import argparse
+import sys
+import time
+
+from src.models import money
+from src.models.batch import read_rounds, default_process_count
+from src.models.tournament import Tournament
+
+
+def load_groups(tournament, path):
+    """Create one group per round in the file; return each group's holes in order."""
+    holes = {}
+    for index, round_data in enumerate(read_rounds(path), 1):
+        group_id = round_data.get("id")
+        if group_id is None:
+            group_id = f"Group {index}"
+        settings = dict(round_data.get("settings", {}))
+        settings.setdefault("number_of_holes", len(round_data.get("holes", [])))
+        tournament.create_group(group_id, dict(round_data, settings=settings, holes=[]))
+        holes[group_id] = sorted(round_data.get("holes", []), key=lambda hole: hole["hole"])
+    return holes
+
+
+def holes_in_play_order(holes):
+    """Interleave the groups' holes as if they were all playing at once: every group's first hole, then the second..."""
+    longest = max((len(group_holes) for group_holes in holes.values()), default=0)
+    for position in range(longest):
+        for group_id, group_holes in holes.items():
+            if position < len(group_holes):
+                yield group_id, group_holes[position]
+
+
+def print_standings(tournament, limit):
+    print(f"{'Rank':>4}  {'Group':<30} {'Player':<20} {'Holes':>5} {'Strokes':>7} {'Net':>10}")
+    for rank, entry in enumerate(tournament.standings()[:limit], 1):
+        print(f"{rank:>4}  {str(entry['group']):<30} {entry['player']:<20} {entry['holes']:>5} "
+              f"{entry['strokes']:>7} {money.format_amount(entry['net']):>10}")
+
+
+def run_headless(tournament, holes, limit):
+    start = time.perf_counter()
+    posted = 0
+    for group_id, hole_data in holes_in_play_order(holes):
+        tournament.post_hole(group_id, hole_data)
+        posted += 1
+        tournament.collect()
+    tournament.finish()
+    elapsed = time.perf_counter() - start
+
+    print_standings(tournament, limit)
+    print(f"Settled {posted} holes for {len(tournament.groups)} groups in {elapsed:.3f}s "
+          f"({len(tournament.errors)} failed)", file=sys.stderr)
+    return 1 if tournament.errors else 0
+
+
+def run_gui(tournament, holes, interval):
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    from src.controllers.tournament_controller import TournamentController
+    from src.views.styles import apply_base_stylesheet, apply_deferred_stylesheets
+
+    app = QApplication(sys.argv)
+    apply_base_stylesheet(app)
+    apply_deferred_stylesheets(app)
+
+    controller = TournamentController(tournament)
+    controller.show()
+
+    # Replay the scorecards: one hole from every group per tick
+    postings = holes_in_play_order(holes)
+    group_count = len(holes)
+
+    def post_next_holes():
+        for _ in range(group_count):
+            posting = next(postings, None)
+            if posting is None:
+                feeder.stop()
+                return
+            controller.post_hole(*posting)
+
+    feeder = QTimer()
+    feeder.timeout.connect(post_next_holes)
+    feeder.start(interval)
+
+    result = app.exec_()
+    controller.close()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run a tournament: every round in the file is one group, all playing at once.")
+    parser.add_argument("input", help="JSON array or JSON lines file with one round per group")
+    parser.add_argument("-p", "--processes", type=int, default=default_process_count(),
+                        help="number of worker processes settling holes (default: CPU count)")
+    parser.add_argument("--gui", action="store_true",
+                        help="show the live standings window while the holes are replayed")
+    parser.add_argument("--interval", type=int, default=500,
+                        help="milliseconds between holes in --gui mode (default: 500)")
+    parser.add_argument("--top", type=int, default=20, help="standings rows to print (default: 20)")
+    args = parser.parse_args(argv)
+
+    with Tournament(args.processes) as tournament:
+        holes = load_groups(tournament, args.input)
+        if args.gui:
+            return run_gui(tournament, holes, args.interval)
+        return run_headless(tournament, holes, args.top)
+
+
+if __name__ == "__main__":
+    sys.exit(main())